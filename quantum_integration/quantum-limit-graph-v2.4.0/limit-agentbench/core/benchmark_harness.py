@@ -4,6 +4,7 @@ Benchmark Harness
 Orchestration engine for running comprehensive benchmarks
 """
 
+import asyncio
 import json
 from typing import Dict, Any, List, Optional
 from pathlib import Path
@@ -31,7 +32,8 @@ class BenchmarkHarness:
         self,
         output_dir: str = "./benchmark_results",
         grid_region: str = "GLOBAL",
-        hardware_profile: str = "default"
+        hardware_profile: str = "default",
+        max_workers: int = 8
     ):
         """
         Initialize benchmark harness.
@@ -40,8 +42,10 @@ class BenchmarkHarness:
             output_dir: Directory for saving results
             grid_region: Grid region for carbon calculations
             hardware_profile: Hardware profile for power estimation
+            max_workers: Maximum number of tasks evaluated concurrently
         """
         self.output_dir = Path(output_dir)
+        self.max_workers = max_workers
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
         self.evaluator = AgentEvaluator(
@@ -80,6 +84,41 @@ class BenchmarkHarness:
         """
         Run benchmark on an agent.
         
+        Synchronous wrapper around run_benchmark_async().
+        
+        Args:
+            agent: Agent instance to benchmark
+            task_suite: List of tasks
+            benchmark_name: Name of the benchmark
+            backend: Quantum backend (if applicable)
+            rank: NSN rank (if applicable)
+            
+        Returns:
+            Benchmark results
+        """
+        return asyncio.run(self.run_benchmark_async(
+            agent=agent,
+            task_suite=task_suite,
+            benchmark_name=benchmark_name,
+            backend=backend,
+            rank=rank
+        ))
+    
+    async def run_benchmark_async(
+        self,
+        agent: Any,
+        task_suite: List[Dict[str, Any]],
+        benchmark_name: str,
+        backend: Optional[str] = None,
+        rank: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Run benchmark on an agent, evaluating tasks concurrently.
+        
+        Adapters are synchronous, so each task runs in a worker thread;
+        at most max_workers tasks are in flight at once. A task that raises
+        is recorded as a failed result instead of aborting the suite.
+        
         Args:
             agent: Agent instance to benchmark
             task_suite: List of tasks
@@ -94,28 +133,51 @@ class BenchmarkHarness:
         
         start_time = datetime.utcnow()
         
-        # Evaluate agent on task suite
-        suite_result = self.evaluator.evaluate_suite(
-            agent=agent,
-            tasks=task_suite,
-            backend=backend,
-            rank=rank
+        agent_name = getattr(agent, 'name', agent.__class__.__name__)
+        framework = getattr(agent, 'framework', 'unknown')
+        semaphore = asyncio.Semaphore(self.max_workers)
+        
+        async def _evaluate(task: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self.evaluator.evaluate, agent, task, backend, rank
+                )
+        
+        outcomes = await asyncio.gather(
+            *(_evaluate(task) for task in task_suite),
+            return_exceptions=True
         )
         
+        task_results = []
+        for task, outcome in zip(task_suite, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Task {task.get('task_id', 'unknown')} failed: {outcome}")
+                outcome = {
+                    "task_id": task.get("task_id", "unknown"),
+                    "agent_name": agent_name,
+                    "framework": framework,
+                    "success": False,
+                    "output": None,
+                    "error": str(outcome),
+                    "error_type": type(outcome).__name__,
+                    "metrics": {}
+                }
+            task_results.append(outcome)
+        
         end_time = datetime.utcnow()
         duration = (end_time - start_time).total_seconds()
         
         # Build benchmark result
         benchmark_result = {
             "benchmark_name": benchmark_name,
-            "agent_name": suite_result["agent_name"],
-            "framework": suite_result["framework"],
-            "num_tasks": suite_result["num_tasks"],
+            "agent_name": agent_name,
+            "framework": framework,
+            "num_tasks": len(task_suite),
             "duration_seconds": duration,
             "start_time": start_time.isoformat() + "Z",
             "end_time": end_time.isoformat() + "Z",
-            "aggregated_metrics": suite_result["aggregated_metrics"],
-            "task_results": suite_result["results"],
+            "aggregated_metrics": self.evaluator._aggregate_results(task_results),
+            "task_results": task_results,
             "backend": backend,
             "rank": rank
         }
@@ -1,24 +1,180 @@
-# Update src/core/green_metrics.py
+# -*- coding: utf-8 -*-
+"""
+Green Metrics Tracker
+Energy and carbon tracking for agent executions
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional
+import logging
+
+from metrics.carbon_calculator import CarbonCalculator
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Rated power draw (W) per hardware profile
+HARDWARE_TDP = {
+    "nvidia_a100": 400.0,
+    "nvidia_h100": 700.0,
+    "nvidia_v100": 300.0,
+    "nvidia_t4": 70.0,
+    "cpu_server": 200.0,
+    "cpu_laptop": 45.0,
+    "default": 100.0
+}
 
-from analysis.complexity_analyzer import ComplexityAnalyzer
-from metrics.efficiency_calculator import NormalizedEfficiencyCalculator
 
 class GreenMetricsTracker:
-    def __init__(self):
-        self.complexity_analyzer = ComplexityAnalyzer()
-        self.efficiency_calc = NormalizedEfficiencyCalculator()
-    
+    """
+    Green metrics tracker for a single execution.
+
+    By default only a monotonic timestamp is taken on start() and stop();
+    energy is derived analytically from the hardware profile's rated power
+    when metrics are requested, so tracking costs no background work.
+    With sampled=True a thread samples CPU utilization instead, for callers
+    that need an instantaneous power curve.
+    """
+
+    def __init__(
+        self,
+        grid_region: str = "GLOBAL",
+        hardware_profile: str = "default",
+        track_energy: bool = True,
+        track_carbon: bool = True,
+        sampled: bool = False,
+        sampling_interval: float = 0.1
+    ):
+        """
+        Initialize green metrics tracker.
+
+        Args:
+            grid_region: Grid region for carbon calculations
+            hardware_profile: Hardware profile for power estimation
+            track_energy: Whether to report energy metrics
+            track_carbon: Whether to report carbon metrics
+            sampled: Sample CPU utilization on a background thread
+            sampling_interval: Sampling interval in seconds (sampled mode)
+        """
+        self.grid_region = grid_region
+        self.hardware_profile = hardware_profile
+        self.track_energy = track_energy
+        self.track_carbon = track_carbon
+        self.power_rating_watts = HARDWARE_TDP.get(hardware_profile, HARDWARE_TDP["default"])
+        self.carbon_intensity = CarbonCalculator.CARBON_INTENSITY.get(grid_region, 0.475)
+
+        if sampled and not PSUTIL_AVAILABLE:
+            logger.warning("psutil not available, using analytic power model")
+            sampled = False
+        self.sampled = sampled
+        self.sampling_interval = sampling_interval
+
+        self._t0: Optional[int] = None
+        self._dt_ns = 0
+        self._samples: List[float] = []
+        self._stop_event = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start tracking."""
+        if self.sampled:
+            self._samples = []
+            self._stop_event.clear()
+            self._sampler = threading.Thread(target=self._sample_loop, daemon=True)
+            self._sampler.start()
+        self._t0 = time.perf_counter_ns()
+
+    def stop(self):
+        """Stop tracking."""
+        self._dt_ns = time.perf_counter_ns() - self._t0
+        if self._sampler is not None:
+            self._stop_event.set()
+            self._sampler.join()
+            self._sampler = None
+
+    def get_metrics(self) -> Dict[str, float]:
+        """
+        Get metrics for the tracked execution.
+
+        Returns:
+            Dictionary with duration, power, energy and carbon metrics
+        """
+        duration_seconds = self._dt_ns / 1e9
+
+        if self._samples:
+            power_watts = sum(self._samples) / len(self._samples)
+        else:
+            power_watts = self.power_rating_watts
+
+        energy_kwh = power_watts * duration_seconds / 3.6e6
+
+        metrics = {
+            "duration_seconds": duration_seconds,
+            "power_watts": power_watts
+        }
+
+        if self.track_energy:
+            metrics["energy_kwh"] = energy_kwh
+            metrics["efficiency_score"] = 1.0 / energy_kwh if energy_kwh > 0 else 0.0
+
+        if self.track_carbon:
+            metrics["carbon_co2e_kg"] = energy_kwh * self.carbon_intensity
+
+        if self.sampled:
+            metrics["num_samples"] = len(self._samples)
+            metrics["peak_power_watts"] = max(self._samples, default=power_watts)
+
+        return metrics
+
+    def get_sustainability_index(
+        self,
+        accuracy: float,
+        energy_kwh: float,
+        carbon_co2e_kg: float
+    ) -> float:
+        """
+        Calculate sustainability index.
+
+        Args:
+            accuracy: Task accuracy
+            energy_kwh: Energy consumption
+            carbon_co2e_kg: Carbon emissions
+
+        Returns:
+            Sustainability index score
+        """
+        from metrics.sustainability_index import SustainabilityIndex
+        return SustainabilityIndex().calculate(accuracy, energy_kwh, carbon_co2e_kg)
+
     def get_normalized_metrics(self, trace: Dict) -> Dict:
         """Get complexity-normalized metrics"""
-        complexity = self.complexity_analyzer.analyze_from_trace(trace)
-        
+        from analysis.complexity_analyzer import ComplexityAnalyzer
+        from metrics.efficiency_calculator import NormalizedEfficiencyCalculator
+
+        complexity_analyzer = ComplexityAnalyzer()
+        efficiency_calc = NormalizedEfficiencyCalculator()
+        complexity = complexity_analyzer.analyze_from_trace(trace)
+
         return {
             'task_complexity': complexity.compute_composite_score(),
-            'complexity_tier': self.complexity_analyzer.categorize_complexity(complexity),
-            'energy_efficiency': self.efficiency_calc.calculate_energy_efficiency(
+            'complexity_tier': complexity_analyzer.categorize_complexity(complexity),
+            'energy_efficiency': efficiency_calc.calculate_energy_efficiency(
                 self.energy_kwh, trace
             ),
-            'accuracy_per_watt': self.efficiency_calc.calculate_accuracy_per_watt(
+            'accuracy_per_watt': efficiency_calc.calculate_accuracy_per_watt(
                 self.accuracy, self.energy_kwh
             )
         }
+
+    def _sample_loop(self):
+        """Sample CPU-utilization-scaled power until stopped."""
+        psutil.cpu_percent(interval=None)
+        while not self._stop_event.wait(self.sampling_interval):
+            cpu_percent = psutil.cpu_percent(interval=None)
+            self._samples.append(self.power_rating_watts * cpu_percent / 100)
@@ -5,13 +5,209 @@ Unified leaderboard with green metrics
 """
 
 import json
-from typing import Dict, List, Any, Optional
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 import logging
 
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Numeric metrics held per entry. They are noisy measurements well within
+# float32 precision, so columnar views use float32 storage.
+METRIC_FIELDS = (
+    "accuracy",
+    "energy_kwh",
+    "carbon_co2e_kg",
+    "latency_ms",
+    "sustainability_index",
+)
+
+# Stored entry columns, in table order
+ENTRY_COLUMNS = (
+    "agent_name",
+    "framework",
+    "task_suite",
+) + METRIC_FIELDS + (
+    "backend",
+    "rank",
+    "timestamp",
+    "metadata",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    agent_name TEXT NOT NULL,
+    framework TEXT NOT NULL,
+    task_suite TEXT NOT NULL,
+    accuracy REAL NOT NULL,
+    energy_kwh REAL NOT NULL,
+    carbon_co2e_kg REAL NOT NULL,
+    latency_ms REAL NOT NULL,
+    sustainability_index REAL NOT NULL,
+    backend TEXT,
+    rank INTEGER,
+    timestamp TEXT NOT NULL,
+    metadata TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_entries_si ON entries (sustainability_index DESC);
+DROP INDEX IF EXISTS idx_entries_framework;
+CREATE INDEX IF NOT EXISTS idx_entries_framework_si
+    ON entries (framework, sustainability_index DESC);
+"""
+
+_INSERT_ENTRY = (
+    f"INSERT INTO entries ({', '.join(ENTRY_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in ENTRY_COLUMNS)})"
+)
+
+# Row layout for metric columns: int64 entry id plus one float32 per metric
+_COLUMN_DTYPE = np.dtype([("id", np.int64)] + [(field, np.float32) for field in METRIC_FIELDS])
+
+# Full-precision inputs to the sustainability index, read back for rescoring
+_SCORE_FIELDS = ("accuracy", "energy_kwh", "carbon_co2e_kg")
+_SCORE_DTYPE = np.dtype([("id", np.int64)] + [(field, np.float64) for field in _SCORE_FIELDS])
+
+# Rows streamed per batch when exporting metric columns
+COLUMN_EXPORT_BATCH = 4096
+
+# Maximum number of distinct ranking queries memoized between submissions
+RANKING_CACHE_SIZE = 64
+
+# Shared read-only metadata for entries submitted without any
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to compact JSON text, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _loads(data) -> Any:
+    """Parse JSON text or bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_pretty(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+@dataclass(slots=True)
+class LeaderboardEntry:
+    """Single leaderboard submission."""
+    agent_name: str
+    framework: str
+    task_suite: str
+    accuracy: float
+    energy_kwh: float
+    carbon_co2e_kg: float
+    latency_ms: float
+    sustainability_index: float
+    backend: Optional[str]
+    rank: Optional[int]
+    timestamp: str
+    metadata: Mapping[str, Any]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the exported entry dictionary."""
+        return {
+            "agent_name": self.agent_name,
+            "framework": self.framework,
+            "task_suite": self.task_suite,
+            "metrics": {
+                "accuracy": self.accuracy,
+                "energy_kwh": self.energy_kwh,
+                "carbon_co2e_kg": self.carbon_co2e_kg,
+                "latency_ms": self.latency_ms,
+                "sustainability_index": self.sustainability_index
+            },
+            "backend": self.backend,
+            "rank": self.rank,
+            "timestamp": self.timestamp,
+            "metadata": dict(self.metadata)
+        }
+    
+    def to_row(self) -> Tuple[Any, ...]:
+        """Convert to a row of the entries table, in ENTRY_COLUMNS order."""
+        return (
+            self.agent_name,
+            self.framework,
+            self.task_suite,
+            self.accuracy,
+            self.energy_kwh,
+            self.carbon_co2e_kg,
+            self.latency_ms,
+            self.sustainability_index,
+            self.backend,
+            self.rank,
+            self.timestamp,
+            _dumps(dict(self.metadata)) if self.metadata else None
+        )
+    
+    @classmethod
+    def from_row(cls, row: Tuple[Any, ...]) -> "LeaderboardEntry":
+        """Build an entry from a row of the entries table."""
+        *fields, metadata = row
+        return cls(
+            *fields,
+            metadata=_loads(metadata) if metadata else _EMPTY_METADATA
+        )
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LeaderboardEntry":
+        """Build an entry from its exported dictionary."""
+        metrics = data["metrics"]
+        return cls(
+            agent_name=data["agent_name"],
+            framework=data["framework"],
+            task_suite=data["task_suite"],
+            accuracy=metrics["accuracy"],
+            energy_kwh=metrics["energy_kwh"],
+            carbon_co2e_kg=metrics["carbon_co2e_kg"],
+            latency_ms=metrics["latency_ms"],
+            sustainability_index=metrics["sustainability_index"],
+            backend=data.get("backend"),
+            rank=data.get("rank"),
+            timestamp=data["timestamp"],
+            metadata=data.get("metadata") or _EMPTY_METADATA
+        )
+
+
+def _framework_stats(count: int, accuracy: float, energy: float,
+                     carbon: float, sustainability: float) -> Dict[str, float]:
+    """Build one framework's statistics from its entry count and metric sums."""
+    return {
+        "count": count,
+        "total_accuracy": accuracy,
+        "total_energy": energy,
+        "total_carbon": carbon,
+        "total_sustainability": sustainability,
+        "avg_accuracy": accuracy / count,
+        "avg_energy": energy / count,
+        "avg_carbon": carbon / count,
+        "avg_sustainability": sustainability / count,
+    }
+
 
 class GreenLeaderboard:
     """
@@ -22,6 +218,10 @@ class GreenLeaderboard:
     - Energy consumption
     - Carbon footprint
     - Sustainability index
+    
+    Entries live in a SQLite database indexed on sustainability index and
+    framework, so rankings and per-framework statistics are answered by
+    the database instead of re-reading and re-sorting every entry.
     """
     
     def __init__(self, storage_path: str = "./leaderboard_data"):
@@ -33,11 +233,23 @@ class GreenLeaderboard:
         """
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
+        self.db_file = self.storage_path / "leaderboard.db"
+        # Pre-SQLite storage, imported once into an empty database
         self.entries_file = self.storage_path / "leaderboard_entries.json"
         
-        self.entries = self._load_entries()
+        # One shared connection; the lock serializes access from worker threads
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_file), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._migrate_json_entries()
+        
+        # Ranking memo, invalidated whenever the entry set changes
+        self._version = 0
+        self._ranking_cache: "OrderedDict[tuple, Tuple[LeaderboardEntry, ...]]" = OrderedDict()
+        self._si_calc = None
         
-        logger.info(f"Initialized GreenLeaderboard with {len(self.entries)} entries")
+        logger.info(f"Initialized GreenLeaderboard with {self._count_entries()} entries")
     
     def submit(
         self,
@@ -72,34 +284,69 @@ class GreenLeaderboard:
         Returns:
             Submitted entry
         """
-        # Calculate sustainability index if not provided
-        if sustainability_index is None:
-            from ..metrics.sustainability_index import SustainabilityIndex
-            si_calc = SustainabilityIndex()
-            sustainability_index = si_calc.calculate(accuracy, energy_kwh, carbon_co2e_kg)
-        
-        entry = {
+        return self.submit_many([{
             "agent_name": agent_name,
             "framework": framework,
             "task_suite": task_suite,
-            "metrics": {
-                "accuracy": accuracy,
-                "energy_kwh": energy_kwh,
-                "carbon_co2e_kg": carbon_co2e_kg,
-                "latency_ms": latency_ms,
-                "sustainability_index": sustainability_index
-            },
+            "accuracy": accuracy,
+            "energy_kwh": energy_kwh,
+            "carbon_co2e_kg": carbon_co2e_kg,
+            "latency_ms": latency_ms,
+            "sustainability_index": sustainability_index,
             "backend": backend,
             "rank": rank,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "metadata": metadata or {}
-        }
+            "metadata": metadata
+        }])[0]
+    
+    def submit_many(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Submit several results to the leaderboard in one transaction.
+        
+        Each row takes the same keys as submit()'s arguments; the optional
+        ones may be omitted. All rows are inserted with a single executemany
+        and committed once.
+        
+        Args:
+            rows: Results to submit
+            
+        Returns:
+            Submitted entries, in input order
+        """
+        timestamp = datetime.utcnow().isoformat() + "Z"
+        entries = []
+        
+        for row in rows:
+            # Calculate sustainability index if not provided
+            sustainability_index = row.get("sustainability_index")
+            if sustainability_index is None:
+                sustainability_index = self._sustainability_calculator().calculate(
+                    row["accuracy"], row["energy_kwh"], row["carbon_co2e_kg"]
+                )
+            
+            metadata = row.get("metadata")
+            entries.append(LeaderboardEntry(
+                agent_name=row["agent_name"],
+                framework=row["framework"],
+                task_suite=row["task_suite"],
+                accuracy=row["accuracy"],
+                energy_kwh=row["energy_kwh"],
+                carbon_co2e_kg=row["carbon_co2e_kg"],
+                latency_ms=row["latency_ms"],
+                sustainability_index=sustainability_index,
+                backend=row.get("backend"),
+                rank=row.get("rank"),
+                timestamp=timestamp,
+                metadata=metadata if metadata is not None else _EMPTY_METADATA
+            ))
         
-        self.entries.append(entry)
-        self._save_entries()
+        with self._lock, self._conn:
+            self._conn.executemany(_INSERT_ENTRY, (e.to_row() for e in entries))
+            self._invalidate_rankings()
         
-        logger.info(f"Submitted entry for {agent_name} ({framework}) on {task_suite}")
-        return entry
+        for entry in entries:
+            logger.info(f"Submitted entry for {entry.agent_name} "
+                        f"({entry.framework}) on {entry.task_suite}")
+        return [entry.to_dict() for entry in entries]
     
     def get_rankings(
         self,
@@ -111,6 +358,10 @@ class GreenLeaderboard:
         """
         Get leaderboard rankings.
         
+        Ranked entries are memoized per query until the next submission;
+        each call returns freshly built dictionaries, so callers may modify
+        them without affecting later results.
+        
         Args:
             sort_by: Metric to sort by
             framework_filter: Filter by framework (None for all)
@@ -118,30 +369,81 @@ class GreenLeaderboard:
             limit: Maximum number of entries to return
             
         Returns:
-            List of ranked entries
+            Ranked entries
         """
         # Filter entries
-        filtered = self.entries
+        clauses = []
+        params: List[Any] = []
         
         if framework_filter:
-            filtered = [e for e in filtered if e["framework"] == framework_filter]
+            clauses.append("framework = ?")
+            params.append(framework_filter)
         
         if task_suite_filter:
-            filtered = [e for e in filtered if e["task_suite"] == task_suite_filter]
+            clauses.append("task_suite = ?")
+            params.append(task_suite_filter)
         
-        # Sort entries
-        if sort_by in ["accuracy", "energy_kwh", "carbon_co2e_kg", "latency_ms", "sustainability_index"]:
+        # Sort entries; ties and unknown metrics keep submission order
+        order = "id"
+        if sort_by in METRIC_FIELDS:
             reverse = sort_by in ["accuracy", "sustainability_index"]  # Higher is better
-            filtered.sort(
-                key=lambda x: x["metrics"].get(sort_by, 0),
-                reverse=reverse
-            )
+            order = f"{sort_by} {'DESC' if reverse else 'ASC'}, id"
         
-        # Add rank
-        for i, entry in enumerate(filtered[:limit], 1):
-            entry["rank"] = i
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
         
-        return filtered[:limit]
+        # Memo lookup, query and insert happen under one lock so another
+        # thread cannot evict or invalidate the key in between
+        with self._lock:
+            key = (self._version, sort_by, framework_filter, task_suite_filter, limit)
+            ranked = self._ranking_cache.get(key)
+            if ranked is not None:
+                self._ranking_cache.move_to_end(key)
+            else:
+                rows = self._fetchall(
+                    f"SELECT {', '.join(ENTRY_COLUMNS)} FROM entries{where} "
+                    f"ORDER BY {order} LIMIT ?",
+                    (*params, limit)
+                )
+                
+                # Add rank
+                entries = []
+                for i, row in enumerate(rows, 1):
+                    entry = LeaderboardEntry.from_row(row)
+                    entry.rank = i
+                    entries.append(entry)
+                
+                ranked = tuple(entries)
+                self._ranking_cache[key] = ranked
+                if len(self._ranking_cache) > RANKING_CACHE_SIZE:
+                    self._ranking_cache.popitem(last=False)
+        
+        return [entry.to_dict() for entry in ranked]
+    
+    def rescore_all(self):
+        """
+        Recompute the sustainability index of every entry.
+        
+        Used after a weight change or data migration; the index is evaluated
+        once over the stored float64 metrics instead of once per entry, so
+        rescoring unchanged data reproduces calculate() exactly.
+        """
+        with self._lock, self._conn:
+            count = self._count_entries()
+            cursor = self._conn.execute(
+                f"SELECT id, {', '.join(_SCORE_FIELDS)} FROM entries ORDER BY id"
+            )
+            table = np.fromiter(cursor, dtype=_SCORE_DTYPE, count=count)
+            scores = self._sustainability_calculator().calculate_batch(
+                *(table[field] for field in _SCORE_FIELDS)
+            )
+            
+            self._conn.executemany(
+                "UPDATE entries SET sustainability_index = ? WHERE id = ?",
+                zip(scores.tolist(), table["id"].tolist())
+            )
+            self._invalidate_rankings()
+        
+        logger.info(f"Rescored {count} leaderboard entries")
     
     def get_top_agents(
         self,
@@ -156,7 +458,7 @@ class GreenLeaderboard:
             sort_by: Metric to sort by
             
         Returns:
-            List of top agents
+            Top agents
         """
         return self.get_rankings(sort_by=sort_by, limit=n)
     
@@ -170,7 +472,12 @@ class GreenLeaderboard:
         Returns:
             List of submissions for the agent
         """
-        return [e for e in self.entries if e["agent_name"] == agent_name]
+        rows = self._fetchall(
+            f"SELECT {', '.join(ENTRY_COLUMNS)} FROM entries "
+            f"WHERE agent_name = ? ORDER BY id",
+            (agent_name,)
+        )
+        return [LeaderboardEntry.from_row(row).to_dict() for row in rows]
     
     def get_framework_stats(self) -> Dict[str, Dict[str, float]]:
         """
@@ -179,55 +486,127 @@ class GreenLeaderboard:
         Returns:
             Dictionary with framework statistics
         """
-        frameworks = {}
-        
-        for entry in self.entries:
-            framework = entry["framework"]
-            if framework not in frameworks:
-                frameworks[framework] = {
-                    "count": 0,
-                    "total_accuracy": 0,
-                    "total_energy": 0,
-                    "total_carbon": 0,
-                    "total_sustainability": 0
-                }
+        # Grouped on the framework index; frameworks in first-submission order
+        rows = self._fetchall(
+            "SELECT framework, COUNT(*), SUM(accuracy), SUM(energy_kwh), "
+            "SUM(carbon_co2e_kg), SUM(sustainability_index) "
+            "FROM entries GROUP BY framework ORDER BY MIN(id)"
+        )
+        
+        return {framework: _framework_stats(*stats) for framework, *stats in rows}
+    
+    def export_columns(self, dirpath: str) -> Dict[str, Path]:
+        """
+        Export metric columns as raw float32 memory-mapped files.
+        
+        Writes ``id.i64`` plus one ``<metric>.f32`` file per metric, in
+        entry id order, streaming rows in batches so the export never holds
+        the whole leaderboard in memory. Read a column back with
+        ``np.memmap(path, dtype=np.float32, mode="r")``.
+        
+        Args:
+            dirpath: Output directory
+            
+        Returns:
+            Dictionary mapping column name to its file path
+        """
+        out = Path(dirpath)
+        out.mkdir(parents=True, exist_ok=True)
+        paths = {"id": out / "id.i64"}
+        paths.update({field: out / f"{field}.f32" for field in METRIC_FIELDS})
+        
+        with self._lock:
+            count = self._count_entries()
+            if count == 0:
+                for path in paths.values():
+                    path.write_bytes(b"")
+                return paths
             
-            frameworks[framework]["count"] += 1
-            frameworks[framework]["total_accuracy"] += entry["metrics"]["accuracy"]
-            frameworks[framework]["total_energy"] += entry["metrics"]["energy_kwh"]
-            frameworks[framework]["total_carbon"] += entry["metrics"]["carbon_co2e_kg"]
-            frameworks[framework]["total_sustainability"] += entry["metrics"]["sustainability_index"]
-        
-        # Calculate averages
-        for framework, stats in frameworks.items():
-            count = stats["count"]
-            stats["avg_accuracy"] = stats["total_accuracy"] / count
-            stats["avg_energy"] = stats["total_energy"] / count
-            stats["avg_carbon"] = stats["total_carbon"] / count
-            stats["avg_sustainability"] = stats["total_sustainability"] / count
-        
-        return frameworks
+            columns = {
+                name: np.memmap(path, dtype=_COLUMN_DTYPE[name], mode="w+", shape=(count,))
+                for name, path in paths.items()
+            }
+            cursor = self._conn.execute(
+                f"SELECT id, {', '.join(METRIC_FIELDS)} FROM entries ORDER BY id"
+            )
+            start = 0
+            while True:
+                rows = cursor.fetchmany(COLUMN_EXPORT_BATCH)
+                if not rows:
+                    break
+                batch = np.array(rows, dtype=_COLUMN_DTYPE)
+                for name, column in columns.items():
+                    column[start:start + len(rows)] = batch[name]
+                start += len(rows)
+        
+        for column in columns.values():
+            column.flush()
+        
+        logger.info(f"Exported {count} entries as metric columns to {out}")
+        return paths
     
     def export_to_json(self, filepath: str):
-        """Export leaderboard to JSON file."""
-        with open(filepath, 'w') as f:
-            json.dump({
-                "leaderboard": self.get_rankings(),
-                "framework_stats": self.get_framework_stats(),
-                "total_entries": len(self.entries),
-                "exported_at": datetime.utcnow().isoformat() + "Z"
-            }, f, indent=2)
+        """
+        Export leaderboard to JSON file.
+        
+        Ranked entries are serialized and written one at a time so the
+        export never holds a second full copy of the leaderboard as text.
+        """
+        rankings = self.get_rankings()
+        
+        with open(filepath, 'wb') as f:
+            f.write(b'{\n"leaderboard": [\n')
+            last = len(rankings) - 1
+            for i, entry in enumerate(rankings):
+                f.write(_dumps_pretty(entry))
+                f.write(b',\n' if i < last else b'\n')
+            f.write(b'],\n"framework_stats": ')
+            f.write(_dumps_pretty(self.get_framework_stats()))
+            f.write(b',\n"total_entries": ')
+            f.write(_dumps_pretty(self._count_entries()))
+            f.write(b',\n"exported_at": ')
+            f.write(_dumps_pretty(datetime.utcnow().isoformat() + "Z"))
+            f.write(b'\n}\n')
         
         logger.info(f"Exported leaderboard to {filepath}")
     
-    def _load_entries(self) -> List[Dict[str, Any]]:
-        """Load entries from storage."""
-        if self.entries_file.exists():
-            with open(self.entries_file, 'r') as f:
-                return json.load(f)
-        return []
-    
-    def _save_entries(self):
-        """Save entries to storage."""
-        with open(self.entries_file, 'w') as f:
-            json.dump(self.entries, f, indent=2)
+    def close(self):
+        """Close the leaderboard database."""
+        with self._lock:
+            self._conn.close()
+    
+    def _sustainability_calculator(self):
+        """Get the shared sustainability index calculator."""
+        if self._si_calc is None:
+            from metrics.sustainability_index import SustainabilityIndex
+            self._si_calc = SustainabilityIndex()
+        return self._si_calc
+    
+    def _invalidate_rankings(self):
+        """Drop memoized rankings after the entry set changes."""
+        self._version += 1
+        self._ranking_cache.clear()
+    
+    def _fetchall(self, query: str, params: Tuple[Any, ...] = ()) -> List[Tuple[Any, ...]]:
+        """Run a read query and return all rows."""
+        with self._lock:
+            return self._conn.execute(query, params).fetchall()
+    
+    def _count_entries(self) -> int:
+        """Number of stored entries."""
+        return self._fetchall("SELECT COUNT(*) FROM entries")[0][0]
+    
+    def _migrate_json_entries(self):
+        """Import entries from the legacy JSON file into an empty database."""
+        if not self.entries_file.exists() or self._count_entries():
+            return
+        
+        entries = [
+            LeaderboardEntry.from_dict(d)
+            for d in _loads(self.entries_file.read_bytes())
+        ]
+        
+        with self._lock, self._conn:
+            self._conn.executemany(_INSERT_ENTRY, (e.to_row() for e in entries))
+        
+        logger.info(f"Imported {len(entries)} entries from {self.entries_file}")
@@ -6,9 +6,16 @@ Demonstrates all four pillars: A2A Compliance, Independence, Robust Scoring, RLH
 
 import time
 import json
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import AgentBeats components
 from core.a2a_gateway import (
     A2AGateway, TaskStatus, create_a2a_task
@@ -17,6 +24,137 @@ from core.rlhf_feedback_engine import RLHFFeedbackEngine
 from core.green_metrics import GreenMetricsCollector
 from core.benchmark_harness import BenchmarkHarness
 
+from examples.demo_output import section_output
+
+
+def _dumps_pretty(obj: Any) -> str:
+    """Pretty-print a JSON payload, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=dict, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, default=dict, indent=2)
+
+
+def _score_success(output: Optional[Dict[str, Any]]) -> float:
+    return 1.0
+
+
+def _score_timeout(output: Optional[Dict[str, Any]]) -> float:
+    # Partial credit for timeout with output
+    if not output:
+        return 0.0
+    completeness = len(str(output)) / 500  # Assume 500 chars is complete
+    return min(0.8, 0.5 + completeness * 0.3)
+
+
+def _score_invalid_output(output: Optional[Dict[str, Any]]) -> float:
+    # Small credit for attempting output
+    return 0.3 if output else 0.0
+
+
+def _score_failure(output: Optional[Dict[str, Any]]) -> float:
+    # Complete failure
+    return 0.0
+
+
+# Demo fixtures are built once at import and shared read-only across runs
+_DOCKER_CONFIG: Mapping[str, Any] = MappingProxyType({
+    "image": "limit-graph-agent:latest",
+    "resources": {
+        "cpu_limit": "2.0",
+        "memory_limit": "4GB",
+        "gpu_limit": "1"
+    },
+    "environment": {
+        "A2A_VERSION": "1.1",
+        "ENABLE_GREEN_METRICS": "true"
+    },
+    "volumes": [
+        "/data:/app/data:ro",
+        "/output:/app/output:rw"
+    ]
+})
+
+_EXECUTION_STAGES: Tuple[str, ...] = (
+    "1. Container launched from A2A task JSON",
+    "2. Agent loads task and initializes",
+    "3. Autonomous execution with green metrics tracking",
+    "4. Results written to A2A response JSON",
+    "5. Container terminated and cleaned up"
+)
+
+_ROBUST_SCORING_SCENARIOS: Tuple[Mapping[str, Any], ...] = tuple(
+    MappingProxyType(scenario) for scenario in [
+        {
+            "name": "Success Case",
+            "status": TaskStatus.SUCCESS,
+            "output": {"result": "Complete answer"},
+            "expected_score": 1.0
+        },
+        {
+            "name": "Timeout with Partial Output",
+            "status": TaskStatus.TIMEOUT,
+            "output": {"result": "Partial answer..."},
+            "expected_score": 0.6
+        },
+        {
+            "name": "Out of Memory",
+            "status": TaskStatus.OOM,
+            "output": None,
+            "expected_score": 0.0
+        },
+        {
+            "name": "Invalid Output Format",
+            "status": TaskStatus.INVALID_OUTPUT,
+            "output": {"malformed": "data"},
+            "expected_score": 0.3
+        }
+    ]
+)
+
+_DEMO_REASONING_TRACE: Tuple[Mapping[str, Any], ...] = tuple(
+    MappingProxyType(step) for step in [
+        {
+            "action": "plan",
+            "thought": "Breaking down the research question into sub-questions",
+            "duration": 0.1
+        },
+        {
+            "action": "search",
+            "thought": "Searching for recent papers on AI sustainability",
+            "tool": "arxiv_search",
+            "observation": "Found 12 relevant papers",
+            "duration": 0.8
+        },
+        {
+            "action": "search",
+            "thought": "Searching for industry reports",
+            "tool": "web_search",
+            "observation": "Found 5 reports",
+            "duration": 0.6
+        },
+        {
+            "action": "analyze",
+            "thought": "Analyzing energy consumption data from papers",
+            "duration": 0.4
+        },
+        {
+            "action": "analyze",
+            "thought": "Comparing different model architectures",
+            "duration": 0.3
+        },
+        {
+            "action": "synthesize",
+            "thought": "Synthesizing findings into comprehensive answer",
+            "duration": 0.5
+        },
+        {
+            "action": "conclude",
+            "thought": "Formulating final answer with citations",
+            "duration": 0.2
+        }
+    ]
+)
+
 
 class AgentBeatsDemo:
     """
@@ -29,6 +167,13 @@ class AgentBeatsDemo:
     4. RLHF Feedback Loop
     """
     
+    # Status -> partial-credit handler, dispatched in O(1)
+    _SCORE_DISPATCH = {
+        TaskStatus.SUCCESS: _score_success,
+        TaskStatus.TIMEOUT: _score_timeout,
+        TaskStatus.INVALID_OUTPUT: _score_invalid_output,
+    }
+    
     def __init__(self):
         self.a2a_gateway = A2AGateway()
         self.rlhf_engine = RLHFFeedbackEngine()
@@ -37,40 +182,46 @@ class AgentBeatsDemo:
         
     def run_complete_demo(self):
         """Run complete AgentBeats demonstration"""
-        print("=" * 80)
-        print("AgentBeats-Ready Green_Agent Architecture Demo")
-        print("=" * 80)
-        print()
-        
-        # Demo 1: A2A Compliance
-        print("📋 PILLAR 1: A2A Protocol Compliance")
-        print("-" * 80)
-        self.demo_a2a_compliance()
-        print()
+        # Each pillar's output is written to stdout in one call
+        with section_output():
+            print("=" * 80)
+            print("AgentBeats-Ready Green_Agent Architecture Demo")
+            print("=" * 80)
+            print()
+            
+            # Demo 1: A2A Compliance
+            print("📋 PILLAR 1: A2A Protocol Compliance")
+            print("-" * 80)
+            self.demo_a2a_compliance()
+            print()
         
         # Demo 2: Independent Execution
-        print("🐳 PILLAR 2: Independent Execution")
-        print("-" * 80)
-        self.demo_independent_execution()
-        print()
+        with section_output():
+            print("🐳 PILLAR 2: Independent Execution")
+            print("-" * 80)
+            self.demo_independent_execution()
+            print()
         
         # Demo 3: Robust Scoring
-        print("📊 PILLAR 3: Robust Scoring with Failure Handling")
-        print("-" * 80)
-        self.demo_robust_scoring()
-        print()
+        with section_output():
+            print("📊 PILLAR 3: Robust Scoring with Failure Handling")
+            print("-" * 80)
+            self.demo_robust_scoring()
+            print()
         
         # Demo 4: RLHF Feedback
-        print("🔄 PILLAR 4: RLHF Feedback Loop")
-        print("-" * 80)
-        self.demo_rlhf_feedback()
-        print()
+        with section_output():
+            print("🔄 PILLAR 4: RLHF Feedback Loop")
+            print("-" * 80)
+            self.demo_rlhf_feedback()
+            print()
         
         # Summary
-        print("=" * 80)
-        print("✅ AgentBeats Integration Complete!")
-        print("=" * 80)
-        self.print_summary()
+        with section_output():
+            print("=" * 80)
+            print("✅ AgentBeats Integration Complete!")
+            print("=" * 80)
+            self.print_summary()
     
     def demo_a2a_compliance(self):
         """Demonstrate A2A protocol compliance"""
@@ -86,7 +237,7 @@ class AgentBeatsDemo:
         )
         
         print(f"✓ Task Request (A2A v1.1):")
-        print(json.dumps(task_request, indent=2))
+        print(_dumps_pretty(task_request))
         print()
         
         # Validate request
@@ -156,33 +307,15 @@ class AgentBeatsDemo:
         )
         
         print(f"✓ A2A Response Generated:")
-        print(json.dumps(response.to_dict(), indent=2))
+        print(_dumps_pretty(response.to_dict()))
     
     def demo_independent_execution(self):
         """Demonstrate independent execution capability"""
         print("Simulating Docker-based independent execution...")
         print()
         
-        # Show Docker configuration
-        docker_config = {
-            "image": "limit-graph-agent:latest",
-            "resources": {
-                "cpu_limit": "2.0",
-                "memory_limit": "4GB",
-                "gpu_limit": "1"
-            },
-            "environment": {
-                "A2A_VERSION": "1.1",
-                "ENABLE_GREEN_METRICS": "true"
-            },
-            "volumes": [
-                "/data:/app/data:ro",
-                "/output:/app/output:rw"
-            ]
-        }
-        
         print("Docker Configuration:")
-        print(json.dumps(docker_config, indent=2))
+        print(_dumps_pretty(_DOCKER_CONFIG))
         print()
         
         print("✓ Agent runs in isolated container")
@@ -193,14 +326,7 @@ class AgentBeatsDemo:
         
         # Simulate execution lifecycle
         print("Execution Lifecycle:")
-        stages = [
-            "1. Container launched from A2A task JSON",
-            "2. Agent loads task and initializes",
-            "3. Autonomous execution with green metrics tracking",
-            "4. Results written to A2A response JSON",
-            "5. Container terminated and cleaned up"
-        ]
-        for stage in stages:
+        for stage in _EXECUTION_STAGES:
             print(f"  {stage}")
     
     def demo_robust_scoring(self):
@@ -208,35 +334,7 @@ class AgentBeatsDemo:
         print("Testing robust scoring across different failure modes...")
         print()
         
-        # Test scenarios
-        scenarios = [
-            {
-                "name": "Success Case",
-                "status": TaskStatus.SUCCESS,
-                "output": {"result": "Complete answer"},
-                "expected_score": 1.0
-            },
-            {
-                "name": "Timeout with Partial Output",
-                "status": TaskStatus.TIMEOUT,
-                "output": {"result": "Partial answer..."},
-                "expected_score": 0.6
-            },
-            {
-                "name": "Out of Memory",
-                "status": TaskStatus.OOM,
-                "output": None,
-                "expected_score": 0.0
-            },
-            {
-                "name": "Invalid Output Format",
-                "status": TaskStatus.INVALID_OUTPUT,
-                "output": {"malformed": "data"},
-                "expected_score": 0.3
-            }
-        ]
-        
-        for scenario in scenarios:
+        for scenario in _ROBUST_SCORING_SCENARIOS:
             print(f"Scenario: {scenario['name']}")
             
             # Calculate score with failure handling
@@ -255,52 +353,9 @@ class AgentBeatsDemo:
         print("Generating RLHF feedback from reasoning trace...")
         print()
         
-        # Sample reasoning trace
-        reasoning_trace = [
-            {
-                "action": "plan",
-                "thought": "Breaking down the research question into sub-questions",
-                "duration": 0.1
-            },
-            {
-                "action": "search",
-                "thought": "Searching for recent papers on AI sustainability",
-                "tool": "arxiv_search",
-                "observation": "Found 12 relevant papers",
-                "duration": 0.8
-            },
-            {
-                "action": "search",
-                "thought": "Searching for industry reports",
-                "tool": "web_search",
-                "observation": "Found 5 reports",
-                "duration": 0.6
-            },
-            {
-                "action": "analyze",
-                "thought": "Analyzing energy consumption data from papers",
-                "duration": 0.4
-            },
-            {
-                "action": "analyze",
-                "thought": "Comparing different model architectures",
-                "duration": 0.3
-            },
-            {
-                "action": "synthesize",
-                "thought": "Synthesizing findings into comprehensive answer",
-                "duration": 0.5
-            },
-            {
-                "action": "conclude",
-                "thought": "Formulating final answer with citations",
-                "duration": 0.2
-            }
-        ]
-        
         # Generate feedback
         feedback = self.rlhf_engine.analyze_reasoning_trace(
-            reasoning_trace=reasoning_trace,
+            reasoning_trace=_DEMO_REASONING_TRACE,
             task_type="research",
             execution_time=2.9,
             success=True
@@ -345,18 +400,7 @@ class AgentBeatsDemo:
         - Invalid output: 0.2-0.4 based on similarity
         - Complete failure: 0.0
         """
-        if status == TaskStatus.SUCCESS:
-            return 1.0
-        elif status == TaskStatus.TIMEOUT and output:
-            # Partial credit for timeout with output
-            completeness = len(str(output)) / 500  # Assume 500 chars is complete
-            return min(0.8, 0.5 + completeness * 0.3)
-        elif status == TaskStatus.INVALID_OUTPUT and output:
-            # Small credit for attempting output
-            return 0.3
-        else:
-            # Complete failure
-            return 0.0
+        return self._SCORE_DISPATCH.get(status, _score_failure)(output)
     
     def print_summary(self):
         """Print demo summary"""
@@ -4,9 +4,12 @@ Demo: Green Agent Benchmarking
 Demonstrates the LIMIT-AgentBench platform capabilities
 """
 
+import asyncio
 import sys
 import logging
-from typing import Dict, Any
+from typing import Callable, Dict, Any
+
+from examples.demo_output import section_output
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -162,9 +165,9 @@ def demo_sustainability_index():
     
     print("\n✓ Sustainability Index Rankings:")
     rankings = si_calc.rank_agents(agents)
+    ratings = SustainabilityIndex.get_ratings([si for _, si in rankings])
     
-    for i, (agent_name, si) in enumerate(rankings, 1):
-        rating = SustainabilityIndex.get_rating(si)
+    for i, ((agent_name, si), rating) in enumerate(zip(rankings, ratings), 1):
         metrics = agents[agent_name]
         print(f"\n  {i}. {agent_name}")
         print(f"     Sustainability Index: {si:.2f} ({rating})")
@@ -193,16 +196,19 @@ def demo_green_leaderboard():
     ]
     
     print("\n✓ Submitting results to leaderboard...")
-    for agent_name, framework, accuracy, energy, carbon in agents_data:
-        leaderboard.submit(
-            agent_name=agent_name,
-            framework=framework,
-            task_suite="demo_benchmark",
-            accuracy=accuracy,
-            energy_kwh=energy,
-            carbon_co2e_kg=carbon,
-            latency_ms=150.0
-        )
+    leaderboard.submit_many([
+        {
+            "agent_name": agent_name,
+            "framework": framework,
+            "task_suite": "demo_benchmark",
+            "accuracy": accuracy,
+            "energy_kwh": energy,
+            "carbon_co2e_kg": carbon,
+            "latency_ms": 150.0
+        }
+        for agent_name, framework, accuracy, energy, carbon in agents_data
+    ])
+    for agent_name, *_ in agents_data:
         print(f"  - Submitted {agent_name}")
     
     # Get rankings
@@ -276,6 +282,33 @@ def demo_benchmark_harness():
     print(f"  Success Rate: {result['aggregated_metrics']['success_rate']:.2%}")
 
 
+def _run_demo(demo: Callable[[], None]):
+    """Run a sync demo with its section printed in one block."""
+    with section_output():
+        demo()
+
+
+async def _run_all_demos():
+    """Run the independent demos concurrently; sections print as each finishes."""
+    # Let every demo finish before surfacing a failure, so no section is
+    # cut short by another demo's error
+    results = await asyncio.gather(*(
+        asyncio.to_thread(_run_demo, demo)
+        for demo in (
+            demo_agentbench_protocol,
+            demo_green_metrics,
+            demo_multi_framework_adapters,
+            demo_sustainability_index,
+            demo_green_leaderboard,
+            demo_benchmark_harness,
+        )
+    ), return_exceptions=True)
+    
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
 def main():
     """Run all demos."""
     print("\n" + "="*80)
@@ -284,12 +317,7 @@ def main():
     print("="*80)
     
     try:
-        demo_agentbench_protocol()
-        demo_green_metrics()
-        demo_multi_framework_adapters()
-        demo_sustainability_index()
-        demo_green_leaderboard()
-        demo_benchmark_harness()
+        asyncio.run(_run_all_demos())
         
         print("\n" + "="*80)
         print("✓ All demos completed successfully!")
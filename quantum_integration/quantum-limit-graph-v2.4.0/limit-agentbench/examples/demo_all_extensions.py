@@ -7,23 +7,21 @@ Demonstrates:
 3. RLHF Reward Shaping
 4. Multi-Layer Reporting
 
-Run with: python examples/demo_all_extensions.py
+Run with: python examples/demo_all_extensions.py [--interactive] [--parallel N]
 """
 
+import argparse
+import importlib.util
 import sys
 from pathlib import Path
 import asyncio
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+# Add src to path unless the analysis package is already importable;
+# extension modules are imported inside each demo
+if importlib.util.find_spec('analysis') is None:
+    sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
-from metrics.efficiency_calculator import NormalizedEfficiencyCalculator
-from constraints.budget_manager import Budget, BudgetManager
-from constraints.budget_enforcer import BudgetEnforcer
-from rlhf.reward_shaper import ExecutionMode, RewardShaper
-from rlhf.policy_evaluator import PolicyEvaluationEnvironment
-from reporting.layered_reporter import LayeredReporter
-from reporting.report_generator import ReportGenerator
+from demo_output import section_output
 
 
 def print_section(title):
@@ -40,6 +38,8 @@ def print_section(title):
 def demo_complexity_normalization():
     print_section("DEMO 1: Task Complexity Normalization")
     
+    from metrics.efficiency_calculator import NormalizedEfficiencyCalculator
+    
     print("Scenario: Compare Cinebench classifiers on different task complexities\n")
     
     # Simulate results from different task complexities
@@ -106,6 +106,9 @@ def demo_complexity_normalization():
 async def demo_budget_constraints():
     print_section("DEMO 2: Budget Constraints")
     
+    from constraints.budget_manager import Budget
+    from constraints.budget_enforcer import BudgetEnforcer
+    
     print("Scenario: Deploy Cinebench classifier with strict energy budget\n")
     
     # Create eco-friendly budget
@@ -167,6 +170,8 @@ async def demo_budget_constraints():
 def demo_rlhf_reward_shaping():
     print_section("DEMO 3: RLHF Reward Shaping")
     
+    from rlhf.reward_shaper import ExecutionMode, RewardShaper
+    
     print("Scenario: Compare agents across different execution modes\n")
     
     # Sample agent results
@@ -197,9 +202,10 @@ def demo_rlhf_reward_shaping():
     # Test different modes
     modes = [ExecutionMode.ECO_MODE, ExecutionMode.FAST_MODE, ExecutionMode.ACCURACY_MODE]
     
+    comparisons = RewardShaper.batch_compare(agent_results, modes)
+    
     for mode in modes:
-        shaper = RewardShaper(mode)
-        comparison = shaper.compare_policies(agent_results)
+        comparison = comparisons[mode.value]
         
         print(f"\n🎯 {mode.value.upper()} MODE:")
         print(f"   Best Agent: {comparison['best_agent']}")
@@ -215,9 +221,11 @@ def demo_rlhf_reward_shaping():
 # DEMO 4: Policy Evaluation Environment
 # ============================================================================
 
-def demo_policy_evaluation():
+def demo_policy_evaluation(max_workers: int = 8):
     print_section("DEMO 4: Policy Evaluation Environment")
     
+    from rlhf.policy_evaluator import PolicyEvaluationEnvironment
+    
     print("Scenario: Evaluate agent policy across all modes\n")
     
     # Mock agent policy
@@ -233,7 +241,7 @@ def demo_policy_evaluation():
     tasks = [{'task_id': f'task_{i}'} for i in range(10)]
     
     # Evaluate across all modes
-    env = PolicyEvaluationEnvironment()
+    env = PolicyEvaluationEnvironment(max_workers=max_workers)
     results = env.multi_mode_evaluation(my_classifier, tasks, verbose=False)
     
     print("Results across all execution modes:\n")
@@ -257,6 +265,9 @@ def demo_policy_evaluation():
 def demo_multi_layer_reporting():
     print_section("DEMO 5: Multi-Layer Reporting")
     
+    from reporting.layered_reporter import LayeredReporter
+    from reporting.report_generator import ReportGenerator
+    
     print("Scenario: Generate transparent three-layer reports\n")
     
     # Sample evaluation results
@@ -327,6 +338,11 @@ def demo_multi_layer_reporting():
 async def demo_cinebench_integration():
     print_section("DEMO 6: Cinebench Integration (All Modules Combined)")
     
+    from metrics.efficiency_calculator import NormalizedEfficiencyCalculator
+    from constraints.budget_manager import Budget, BudgetManager
+    from rlhf.reward_shaper import ExecutionMode, RewardShaper
+    from reporting.layered_reporter import LayeredReporter
+    
     print("Scenario: Complete Cinebench classifier evaluation workflow\n")
     
     # Step 1: Define budget
@@ -401,14 +417,12 @@ async def demo_cinebench_integration():
     print("\nStep 2: Check Budget Compliance")
     print("-" * 40)
     
-    for result in classifiers_results:
+    within_budget = BudgetManager.compliance_mask(classifiers_results, budget)
+    
+    for result, fits_budget in zip(classifiers_results, within_budget):
         energy_wh = result['energy_kwh'] * 1000
         carbon_g = result['carbon_kg'] * 1000
         
-        fits_budget = (energy_wh <= budget.max_energy_wh and 
-                      carbon_g <= budget.max_carbon_g and
-                      result['latency_ms'] <= budget.max_latency_ms)
-        
         status = "✅" if fits_budget else "❌"
         print(f"  {status} {result['agent_id']}: "
               f"E={energy_wh:.1f}Wh, C={carbon_g:.1f}g, L={result['latency_ms']:.0f}ms")
@@ -449,8 +463,12 @@ async def demo_cinebench_integration():
 # MAIN
 # ============================================================================
 
-async def main():
+async def main(parallel: int = 8, interactive: bool = False):
     """Run all demos"""
+    def pause(prompt: str):
+        if interactive:
+            input(prompt)
+    
     print("\n" + "🌟"*35)
     print("Green_Agent Extensions - Complete Demo")
     print("🌟"*35 + "\n")
@@ -463,25 +481,31 @@ async def main():
     print("  5. Policy Evaluation")
     print("  6. Complete Cinebench Integration\n")
     
-    input("Press Enter to start demos...")
+    pause("Press Enter to start demos...")
     
     # Run demos
-    demo_complexity_normalization()
-    input("\nPress Enter for next demo...")
+    with section_output():
+        demo_complexity_normalization()
+    pause("\nPress Enter for next demo...")
     
-    await demo_budget_constraints()
-    input("\nPress Enter for next demo...")
+    with section_output():
+        await demo_budget_constraints()
+    pause("\nPress Enter for next demo...")
     
-    demo_rlhf_reward_shaping()
-    input("\nPress Enter for next demo...")
+    with section_output():
+        demo_rlhf_reward_shaping()
+    pause("\nPress Enter for next demo...")
     
-    demo_policy_evaluation()
-    input("\nPress Enter for next demo...")
+    with section_output():
+        demo_policy_evaluation(max_workers=parallel)
+    pause("\nPress Enter for next demo...")
     
-    demo_multi_layer_reporting()
-    input("\nPress Enter for final demo...")
+    with section_output():
+        demo_multi_layer_reporting()
+    pause("\nPress Enter for final demo...")
     
-    await demo_cinebench_integration()
+    with section_output():
+        await demo_cinebench_integration()
     
     print("\n" + "="*70)
     print("✅ All Demos Complete!")
@@ -493,4 +517,10 @@ async def main():
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Green_Agent extensions demo")
+    parser.add_argument('--parallel', type=int, default=8, metavar='N',
+                        help="worker threads for policy evaluation (1 = sequential)")
+    parser.add_argument('--interactive', action=argparse.BooleanOptionalAction, default=False,
+                        help="pause for Enter between demos")
+    args = parser.parse_args()
+    asyncio.run(main(parallel=args.parallel, interactive=args.interactive))
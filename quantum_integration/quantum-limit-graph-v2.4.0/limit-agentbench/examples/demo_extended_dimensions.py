@@ -7,17 +7,21 @@ Showcases:
 3. Inference variance (stability under repeated execution)
 4. Three specialized 2D plots (policy-oriented visualizations)
 
-Run with: python examples/demo_extended_dimensions.py
+Run with: python examples/demo_extended_dimensions.py [--no-interactive] [--plots]
 """
 
+import argparse
+import importlib.util
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+# Add src to path unless the analysis package is already importable
+if importlib.util.find_spec('analysis') is None:
+    sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from analysis.extended_pareto_analyzer import ExtendedParetoPoint, ExtendedParetoAnalyzer
-from visualization.pareto_plotter import ParetoPlotter
+
+from demo_output import section_output
 
 
 def print_section(title):
@@ -108,9 +112,12 @@ def demo_7d_pareto_analysis():
         )
     ]
     
-    # Compute 7D frontier
+    # Materialize the agents once; every later demo reuses the batch
     analyzer = ExtendedParetoAnalyzer()
-    frontier = analyzer.compute_frontier(agents)
+    batch = analyzer.prepare(agents)
+    
+    # Compute 7D frontier
+    frontier = analyzer.compute_frontier(batch)
     
     print("📊 7D Pareto Frontier Results:")
     print(f"   Total agents: {len(agents)}")
@@ -125,17 +132,17 @@ def demo_7d_pareto_analysis():
     for agent in dominated:
         print(f"      • {agent.agent_id}")
     
-    return agents, frontier, analyzer
+    return agents, batch, frontier, analyzer
 
 
-def demo_memory_analysis(agents, analyzer):
+def demo_memory_analysis(batch, analyzer):
     """Demo 2: Memory constraint analysis"""
     print_section("DEMO 2: Memory Footprint Analysis")
     
     print("Scenario: Edge device with 512 MB RAM limit\n")
     
     # Analyze with 512 MB constraint (typical edge device)
-    memory_analysis = analyzer.analyze_memory_constraint(agents, max_memory_mb=512)
+    memory_analysis = analyzer.analyze_memory_constraint(batch, max_memory_mb=512)
     
     print(f"Memory Constraint: {memory_analysis['max_memory_mb']} MB\n")
     
@@ -161,13 +168,13 @@ def demo_memory_analysis(agents, analyzer):
     print("   High-accuracy agents may be useless if they don't fit in RAM!")
 
 
-def demo_circuit_depth_analysis(agents, analyzer):
+def demo_circuit_depth_analysis(batch, analyzer):
     """Demo 3: Quantum circuit depth analysis"""
     print_section("DEMO 3: Quantum Circuit Depth Analysis")
     
     print("Scenario: Analyze quantum/hybrid agent scalability\n")
     
-    circuit_analysis = analyzer.analyze_circuit_depth_scalability(agents)
+    circuit_analysis = analyzer.analyze_circuit_depth_scalability(batch)
     
     if circuit_analysis.get('quantum_agents_count', 0) == 0:
         print("⚠️  No quantum agents in this batch (all classical)")
@@ -192,9 +199,8 @@ def demo_circuit_depth_analysis(agents, analyzer):
     
     print(f"\n⚠️  Fragility Scores (depth/accuracy - lower is better):")
     fragility = circuit_analysis['fragility_scores']
-    sorted_fragility = sorted(fragility.items(), key=lambda x: x[1])
-    for agent_id, score in sorted_fragility:
-        print(f"   • {agent_id}: {score:.2f}")
+    for agent_id in circuit_analysis['fragility_order']:
+        print(f"   • {agent_id}: {fragility[agent_id]:.2f}")
     
     print(f"\n🏆 Most robust: {circuit_analysis['most_robust']}")
     print(f"⚠️  Most fragile: {circuit_analysis['most_fragile']}")
@@ -204,14 +210,14 @@ def demo_circuit_depth_analysis(agents, analyzer):
     print("   Shallow circuits are more robust and scalable!")
 
 
-def demo_variance_stability(agents, analyzer):
+def demo_variance_stability(batch, analyzer):
     """Demo 4: Inference variance analysis"""
     print_section("DEMO 4: Inference Variance & Stability")
     
     print("Scenario: Production deployment requires predictability\n")
     
     variance_analysis = analyzer.analyze_variance_stability(
-        agents,
+        batch,
         stability_threshold=0.2
     )
     
@@ -230,8 +236,8 @@ def demo_variance_stability(agents, analyzer):
               f"(P95 energy cost: +{cost*1000:.2f} Wh)")
     
     print(f"\n📊 Stability Ranking (most → least stable):")
-    for i, agent_id in enumerate(variance_analysis['stability_ranking'][:3]):
-        print(f"   {i+1}. {agent_id}")
+    print("\n".join(f"   {i}. {agent_id}" for i, agent_id in
+                    enumerate(variance_analysis['stability_ranking'][:3], start=1)))
     
     print(f"\n🏆 Most stable: {variance_analysis['most_stable']}")
     print(f"⚠️  Least stable: {variance_analysis['least_stable']}")
@@ -242,7 +248,7 @@ def demo_variance_stability(agents, analyzer):
     print("   → Less green in practice!")
 
 
-def demo_comprehensive_analysis(agents, analyzer):
+def demo_comprehensive_analysis(batch, analyzer):
     """Demo 5: Comprehensive analysis with all constraints"""
     print_section("DEMO 5: Comprehensive 7D Analysis with Constraints")
     
@@ -258,7 +264,7 @@ def demo_comprehensive_analysis(agents, analyzer):
     for key, value in constraints.items():
         print(f"   • {key}: {value}")
     
-    comprehensive = analyzer.comprehensive_analysis(agents, constraints)
+    comprehensive = analyzer.comprehensive_analysis(batch, constraints)
     
     print(f"\n📊 Analysis Results:")
     print(f"   Total agents: {comprehensive['total_agents']}")
@@ -281,17 +287,21 @@ def demo_comprehensive_analysis(agents, analyzer):
     print("   7D Pareto analysis finds agents that satisfy them all!")
 
 
-def demo_specialized_plots(agents, frontier):
+def demo_specialized_plots(agents, plotter=None):
     """Demo 6: Three specialized 2D plots"""
     print_section("DEMO 6: Specialized 2D Policy Plots")
     
     print("Why multiple 2D plots instead of one 7D plot?\n")
     print("   • Humans cannot reason in 7D")
     print("   • Each 2D plot answers a different policy question")
-    print("   • Projections reveal different trade-offs\n")
+    print("   • Projections reveal different trade-offs")
+    print("   • Each plot highlights its own 2D frontier, not the 7D one\n")
     
     try:
-        plotter = ParetoPlotter(backend='plotly')
+        if plotter is None:
+            # Imported here so Demos 1-5 never load plotly
+            from visualization.pareto_plotter import ParetoPlotter
+            plotter = ParetoPlotter(backend='plotly')
         
         print("📊 Generating three specialized plots...\n")
         
@@ -300,32 +310,35 @@ def demo_specialized_plots(agents, frontier):
         print("   Question: 'What performance per unit environmental cost?'")
         print("   Users: Sustainability reviewers, ESG officers")
         fig1 = plotter.plot_accuracy_vs_carbon(
-            agents, frontier,
-            save_path='accuracy_vs_carbon.html'
+            agents
         )
-        print("   ✅ Saved to: accuracy_vs_carbon.html\n")
+        print()
         
         # Plot 2: Latency vs Energy
         print("2️⃣  Latency vs Energy")
         print("   Question: 'Are fast agents inherently wasteful?'")
         print("   Users: Systems engineers, edge teams")
         fig2 = plotter.plot_latency_vs_energy(
-            agents, frontier,
-            save_path='latency_vs_energy.html'
+            agents
         )
-        print("   ✅ Saved to: latency_vs_energy.html\n")
+        print()
         
         # Plot 3: Carbon vs Energy (Pure Green!)
         print("3️⃣  Carbon vs Energy (Pure Green Plot)")
         print("   Question: 'Which agents are environmentally efficient?'")
         print("   Users: Green AI researchers, carbon planners")
         fig3 = plotter.plot_carbon_vs_energy(
-            agents, frontier,
-            save_path='carbon_vs_energy.html'
+            agents
         )
-        print("   ✅ Saved to: carbon_vs_energy.html\n")
+        print()
         
-        print("🎨 All plots saved! Open in browser to interact.\n")
+        # One HTML file, plotly.js loaded from the CDN
+        plotter.combine_projections(
+            {'accuracy_vs_carbon': fig1, 'latency_vs_energy': fig2, 'carbon_vs_energy': fig3},
+            save_path='pareto_plots.html'
+        )
+        print("🎨 All plots saved to: pareto_plots.html")
+        print("   Open in browser to interact.\n")
         
         print("💡 Key Insight:")
         print("   Each plot shows a different 'face' of the Pareto frontier.")
@@ -338,8 +351,12 @@ def demo_specialized_plots(agents, frontier):
         print(f"\n   Error: {e}")
 
 
-def main():
+def main(interactive: bool = True, plots: bool = False):
     """Run all demos"""
+    def pause(prompt: str):
+        if interactive:
+            input(prompt)
+
     print("\n" + "🌟"*35)
     print("Green_Agent: Extended 7D Pareto Analysis")
     print("🌟"*35)
@@ -353,25 +370,35 @@ def main():
     print("  2. Latency vs Energy - Systems engineering view")
     print("  3. Carbon vs Energy - Pure green efficiency\n")
     
-    input("Press Enter to start demos...")
+    pause("Press Enter to start demos...")
     
-    # Run all demos
-    agents, frontier, analyzer = demo_7d_pareto_analysis()
-    input("\nPress Enter for next demo...")
+    # Run all demos; each section's output is written in one call
+    with section_output():
+        agents, batch, frontier, analyzer = demo_7d_pareto_analysis()
+    pause("\nPress Enter for next demo...")
     
-    demo_memory_analysis(agents, analyzer)
-    input("\nPress Enter for next demo...")
+    with section_output():
+        demo_memory_analysis(batch, analyzer)
+    pause("\nPress Enter for next demo...")
     
-    demo_circuit_depth_analysis(agents, analyzer)
-    input("\nPress Enter for next demo...")
+    with section_output():
+        demo_circuit_depth_analysis(batch, analyzer)
+    pause("\nPress Enter for next demo...")
     
-    demo_variance_stability(agents, analyzer)
-    input("\nPress Enter for next demo...")
+    with section_output():
+        demo_variance_stability(batch, analyzer)
+    pause("\nPress Enter for next demo...")
     
-    demo_comprehensive_analysis(agents, analyzer)
-    input("\nPress Enter for final demo...")
+    with section_output():
+        demo_comprehensive_analysis(batch, analyzer)
+    pause("\nPress Enter for final demo...")
     
-    demo_specialized_plots(agents, frontier)
+    with section_output():
+        if plots:
+            demo_specialized_plots(agents)
+        else:
+            print_section("DEMO 6: Specialized 2D Policy Plots")
+            print("Skipped (run with --plots to write the HTML plots)")
     
     print("\n" + "="*70)
     print("✅ All Demos Complete!")
@@ -385,11 +412,18 @@ def main():
     print("   5. Each dimension captures different failure modes\n")
     
     print("Next steps:")
-    print("   • Open the HTML plots in your browser")
+    if plots:
+        print("   • Open pareto_plots.html in your browser")
     print("   • Integrate with your Cinebench pipeline")
     print("   • Test with real quantum/hybrid agents")
     print("   • Use for AgentBeats submission\n")
 
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description="Extended 7D Pareto analysis demo")
+    parser.add_argument('--interactive', action=argparse.BooleanOptionalAction, default=True,
+                        help="pause for Enter between demos")
+    parser.add_argument('--plots', action=argparse.BooleanOptionalAction, default=False,
+                        help="write the specialized HTML plots (slowest part of the demo)")
+    args = parser.parse_args()
+    main(interactive=args.interactive, plots=args.plots)
@@ -0,0 +1,54 @@
+"""
+Shared output helper for the demo scripts
+
+section_output() buffers a demo section's prints and writes them to stdout
+in one call. Buffers are per thread, so sections run concurrently in worker
+threads still come out whole, one after another.
+"""
+
+import io
+import sys
+import threading
+from contextlib import contextmanager
+
+_lock = threading.Lock()
+_local = threading.local()
+_active = 0
+
+
+class _SectionStream(io.TextIOBase):
+    """stdout proxy sending each thread's writes to its open section buffer"""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, text: str) -> int:
+        buf = getattr(_local, 'buf', None)
+        return (buf if buf is not None else self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+@contextmanager
+def section_output():
+    """Buffer the calling thread's prints and write them to stdout in one call"""
+    global _active
+    with _lock:
+        if _active == 0:
+            sys.stdout = _SectionStream(sys.stdout)
+        _active += 1
+        proxy = sys.stdout
+
+    outer = getattr(_local, 'buf', None)
+    buf = _local.buf = io.StringIO()
+    try:
+        yield
+    finally:
+        _local.buf = outer
+        with _lock:
+            (outer if outer is not None else proxy.stream).write(buf.getvalue())
+            proxy.stream.flush()
+            _active -= 1
+            if _active == 0:
+                sys.stdout = proxy.stream
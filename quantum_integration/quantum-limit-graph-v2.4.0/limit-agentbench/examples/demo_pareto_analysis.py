@@ -7,15 +7,19 @@ across multiple objectives (accuracy, energy, carbon, latency).
 Run with: python examples/demo_pareto_analysis.py
 """
 
+import importlib.util
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+# Add src to path unless the analysis package is already importable
+if importlib.util.find_spec('analysis') is None:
+    sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from analysis.pareto_analyzer import ParetoPoint, ParetoFrontierAnalyzer
 from analysis.complexity_analyzer import TaskComplexity, ComplexityAnalyzer
 
+from demo_output import section_output
+
 
 def demo_basic_pareto():
     """Demo 1: Basic Pareto frontier analysis"""
@@ -46,7 +50,7 @@ def demo_basic_pareto():
     
     # Compute Pareto frontier
     print("\n📊 Computing Pareto Frontier...")
-    frontier = analyzer.compute_frontier(agents)
+    frontier, knee = analyzer.compute_frontier(agents, return_knee=True)
     
     print(f"\nTotal agents: {len(agents)}")
     print(f"Frontier agents: {len(frontier)}")
@@ -59,8 +63,7 @@ def demo_basic_pareto():
         print(f"    Latency: {agent.latency_ms:.0f} ms")
         print()
     
-    # Find knee point (best balance)
-    knee = analyzer.get_knee_point(frontier)
+    # Knee point (best balance), found alongside the frontier
     print(f"🎯 Knee Point (Best Balance): {knee.agent_id}")
     print(f"   This agent offers the best overall compromise.\n")
 
@@ -254,8 +257,8 @@ def demo_cinebench_integration():
     
     analyzer = ParetoFrontierAnalyzer()
     
-    # Compute frontier
-    frontier = analyzer.compute_frontier(classifiers)
+    # Compute frontier and knee point in one pass
+    frontier, knee = analyzer.compute_frontier(classifiers, return_knee=True)
     
     print("\n📊 Cinebench Classifier Analysis:")
     print(f"\nTotal models evaluated: {len(classifiers)}")
@@ -270,8 +273,6 @@ def demo_cinebench_integration():
         print(f"    Accuracy per Wh: {acc_per_wh:.4f}")
         print(f"    Latency: {clf.latency_ms:.0f} ms")
     
-    # Find knee point
-    knee = analyzer.get_knee_point(frontier)
     print(f"\n🎯 RECOMMENDED FOR PRODUCTION: {knee.agent_id}")
     print(f"   Best balance between accuracy and efficiency")
 
@@ -282,12 +283,11 @@ def main():
     print("Green_Agent Pareto Analysis Demo")
     print("🌟" * 30 + "\n")
     
-    demo_basic_pareto()
-    demo_pareto_ranking()
-    demo_agent_comparison()
-    demo_complexity_analysis()
-    demo_over_reasoning_detection()
-    demo_cinebench_integration()
+    for demo in (demo_basic_pareto, demo_pareto_ranking, demo_agent_comparison,
+                 demo_complexity_analysis, demo_over_reasoning_detection,
+                 demo_cinebench_integration):
+        with section_output():
+            demo()
     
     print("\n" + "=" * 60)
     print("✅ Demo complete!")
@@ -1,14 +1,27 @@
 # -*- coding: utf-8 -*-
 """Green metrics tracking modules"""
 
-from .energy_tracker import EnergyTracker
-from .carbon_calculator import CarbonCalculator
-from .efficiency_scorer import EfficiencyScorer
-from .sustainability_index import SustainabilityIndex
-
-__all__ = [
-    "EnergyTracker",
-    "CarbonCalculator",
-    "EfficiencyScorer",
-    "SustainabilityIndex",
-]
+import importlib
+
+# Public name -> submodule; submodules are imported on first attribute access
+# (PEP 562) so importing one metric does not pull in the others
+_EXPORTS = {
+    "EnergyTracker": "energy_tracker",
+    "CarbonCalculator": "carbon_calculator",
+    "EfficiencyScorer": "efficiency_scorer",
+    "SustainabilityIndex": "sustainability_index",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
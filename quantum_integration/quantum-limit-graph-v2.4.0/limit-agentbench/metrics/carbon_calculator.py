@@ -4,11 +4,18 @@ Carbon Calculator
 Carbon footprint calculation and analysis
 """
 
-from typing import Dict
+from typing import Callable, Dict, Sequence
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Reciprocals of the savings equivalences: 1 tree absorbs ~21 kg CO2/year,
+# 1 mile driven emits ~0.404 kg CO2
+_INV_TREE_KG = 1.0 / 21.0
+_INV_MILE_KG = 1.0 / 0.404
+
 
 class CarbonCalculator:
     """
@@ -38,6 +45,16 @@ class CarbonCalculator:
         "GLOBAL": 0.475    # Global average
     }
     
+    # CARBON_INTENSITY as (region, intensity) pairs for labeled per-call
+    # output, and as parallel region / intensity columns for vectorized
+    # comparisons (built once at class definition)
+    _CARBON_ITEMS = tuple(CARBON_INTENSITY.items())
+    _REGIONS = tuple(CARBON_INTENSITY)
+    _INTENSITY_ARR = np.fromiter(CARBON_INTENSITY.values(), dtype=np.float64,
+                                 count=len(CARBON_INTENSITY))
+    _CLEANEST = min(CARBON_INTENSITY, key=CARBON_INTENSITY.get)
+    _DIRTIEST = max(CARBON_INTENSITY, key=CARBON_INTENSITY.get)
+    
     def __init__(self, grid_region: str = "GLOBAL"):
         """
         Initialize carbon calculator.
@@ -63,6 +80,22 @@ class CarbonCalculator:
         """
         return energy_kwh * self.carbon_intensity
     
+    def make_emitter(self) -> Callable[[float], float]:
+        """
+        Build a calculate_emissions() equivalent for tight loops.
+        
+        The carbon intensity is captured as a default argument, so each
+        call is a local-variable load and one multiply with no attribute
+        lookup. Later changes to carbon_intensity do not affect an
+        emitter that already exists.
+        
+        Returns:
+            Function mapping energy in kWh to CO2e emissions in kg
+        """
+        def emit(energy_kwh: float, carbon_intensity: float = self.carbon_intensity) -> float:
+            return energy_kwh * carbon_intensity
+        return emit
+    
     def calculate_savings(
         self,
         baseline_energy_kwh: float,
@@ -78,16 +111,17 @@ class CarbonCalculator:
         Returns:
             Dictionary with savings metrics
         """
-        baseline_carbon = self.calculate_emissions(baseline_energy_kwh)
-        optimized_carbon = self.calculate_emissions(optimized_energy_kwh)
+        carbon_intensity = self.carbon_intensity
+        baseline_carbon = baseline_energy_kwh * carbon_intensity
+        optimized_carbon = optimized_energy_kwh * carbon_intensity
         
         carbon_saved_kg = baseline_carbon - optimized_carbon
         reduction_percent = (carbon_saved_kg / baseline_carbon * 100 
                             if baseline_carbon > 0 else 0.0)
         
         # Convert to equivalent metrics
-        trees_equivalent = carbon_saved_kg / 21  # 1 tree absorbs ~21 kg CO2/year
-        miles_driven = carbon_saved_kg / 0.404   # 1 mile driven = ~0.404 kg CO2
+        trees_equivalent = carbon_saved_kg * _INV_TREE_KG
+        miles_driven = carbon_saved_kg * _INV_MILE_KG
         
         return {
             "baseline_carbon_kg": baseline_carbon,
@@ -109,17 +143,32 @@ class CarbonCalculator:
         Returns:
             Dictionary with emissions by region
         """
-        return {
-            region: energy_kwh * intensity
-            for region, intensity in self.CARBON_INTENSITY.items()
-        }
+        return {region: energy_kwh * intensity for region, intensity in self._CARBON_ITEMS}
+    
+    def compare_regions_batch(self, energy_kwh: Sequence[float]) -> np.ndarray:
+        """
+        Compare carbon emissions across regions for many energy values.
+        
+        Args:
+            energy_kwh: Energy consumption per agent/run
+            
+        Returns:
+            (len(energy_kwh), n_regions) array of emissions in kg; columns
+            follow CARBON_INTENSITY order (see region_names())
+        """
+        return np.multiply.outer(np.asarray(energy_kwh, dtype=np.float64), self._INTENSITY_ARR)
+    
+    @classmethod
+    def region_names(cls) -> tuple:
+        """Region codes in the column order of compare_regions_batch."""
+        return cls._REGIONS
     
     @classmethod
     def get_cleanest_region(cls) -> str:
         """Get region with lowest carbon intensity."""
-        return min(cls.CARBON_INTENSITY.items(), key=lambda x: x[1])[0]
+        return cls._CLEANEST
     
     @classmethod
     def get_dirtiest_region(cls) -> str:
         """Get region with highest carbon intensity."""
-        return max(cls.CARBON_INTENSITY.items(), key=lambda x: x[1])[0]
+        return cls._DIRTIEST
@@ -4,9 +4,11 @@ Efficiency Scorer
 Performance efficiency metrics calculation
 """
 
-from typing import Dict
+from typing import Callable, Dict
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -65,6 +67,30 @@ class EfficiencyScorer:
             return 0.0
         return accuracy / energy_kwh
     
+    def calculate_efficiency_batch(
+        self,
+        accuracy: np.ndarray,
+        energy_kwh: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate efficiency scores over whole metric columns.
+        
+        Same formula as calculate_efficiency_score(), with one vectorized
+        divide instead of a call per agent. Zero energy scores 0.0.
+        
+        Args:
+            accuracy: Task accuracies
+            energy_kwh: Energy consumption values
+            
+        Returns:
+            Array of efficiency scores
+        """
+        accuracy = np.asarray(accuracy, dtype=np.float64)
+        energy_kwh = np.asarray(energy_kwh, dtype=np.float64)
+        
+        nonzero = energy_kwh != 0
+        return np.where(nonzero, accuracy / np.where(nonzero, energy_kwh, 1.0), 0.0)
+    
     def calculate_performance_per_watt(
         self,
         accuracy: float,
@@ -115,6 +141,21 @@ class EfficiencyScorer:
             "grid_region": self.grid_region
         }
     
+    def make_cost_estimator(self) -> Callable[[float], float]:
+        """
+        Build an energy-to-cost function for tight loops.
+        
+        Matches calculate_cost_efficiency()["cost_usd"] with the
+        electricity cost captured as a default argument, so each call
+        needs no attribute lookup or result dictionary.
+        
+        Returns:
+            Function mapping energy in kWh to cost in USD
+        """
+        def cost(energy_kwh: float, electricity_cost: float = self.electricity_cost) -> float:
+            return energy_kwh * electricity_cost
+        return cost
+    
     def calculate_throughput_efficiency(
         self,
         num_tasks: int,
@@ -158,14 +199,10 @@ class EfficiencyScorer:
         Returns:
             Comparison results
         """
-        eff_a = self.calculate_efficiency_score(
-            agent_a_metrics.get("accuracy", 0),
-            agent_a_metrics.get("energy_kwh", 1)
-        )
-        eff_b = self.calculate_efficiency_score(
-            agent_b_metrics.get("accuracy", 0),
-            agent_b_metrics.get("energy_kwh", 1)
-        )
+        energy_a = agent_a_metrics.get("energy_kwh", 1)
+        energy_b = agent_b_metrics.get("energy_kwh", 1)
+        eff_a = agent_a_metrics.get("accuracy", 0) / energy_a if energy_a else 0.0
+        eff_b = agent_b_metrics.get("accuracy", 0) / energy_b if energy_b else 0.0
         
         improvement = ((eff_b - eff_a) / eff_a * 100) if eff_a > 0 else 0.0
         
@@ -175,3 +212,38 @@ class EfficiencyScorer:
             "improvement_percent": improvement,
             "winner": "agent_b" if eff_b > eff_a else "agent_a"
         }
+    
+    def compare_efficiency_matrix(
+        self,
+        agent_metrics: Dict[str, Dict[str, float]]
+    ) -> Dict[str, any]:
+        """
+        Compare efficiency between every pair of agents.
+        
+        Scores each agent once with calculate_efficiency_batch() and
+        derives all pairwise improvements by broadcasting, matching
+        compare_efficiency() for every (a, b) pair.
+        
+        Args:
+            agent_metrics: Dictionary mapping agent_id to metrics
+            
+        Returns:
+            Dictionary with agent ids, efficiencies and an improvement
+            matrix where [i, j] is the percent gain of agent j over agent i
+        """
+        agent_ids = list(agent_metrics)
+        efficiencies = self.calculate_efficiency_batch(
+            [m.get("accuracy", 0) for m in agent_metrics.values()],
+            [m.get("energy_kwh", 1) for m in agent_metrics.values()]
+        )
+        
+        base = efficiencies[:, None]
+        positive = base > 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            improvement = (efficiencies[None, :] - base) / np.where(positive, base, 1.0) * 100
+        
+        return {
+            "agent_ids": agent_ids,
+            "efficiencies": efficiencies,
+            "improvement_percent": np.where(positive, improvement, 0.0)
+        }
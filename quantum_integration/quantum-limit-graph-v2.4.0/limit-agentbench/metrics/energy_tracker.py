@@ -4,11 +4,14 @@ Energy Tracker
 Detailed energy consumption monitoring
 """
 
+import threading
 import time
 import psutil
 from typing import Dict, List, Optional
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,26 +24,84 @@ class EnergyTracker:
     - Energy per operation
     - Peak power consumption
     - Energy efficiency trends
+    
+    Samples are stored column-wise in fixed-size float64 ring buffers
+    (timestamp, CPU %, power) holding the most recent `capacity` samples.
+    Power count, sum and peak are kept as running totals over every
+    sample, so memory stays constant and get_metrics() does not rescan.
+    
+    sample() is a non-blocking probe: CPU utilization is read as the delta
+    since the previous call rather than by sleeping inside psutil. By
+    default callers drive sample() themselves; with background=True,
+    start() also runs a daemon thread that samples every sampling_interval
+    until stop().
     """
     
-    def __init__(self, hardware_power_watts: float = 100, sampling_interval: float = 0.1):
+    def __init__(
+        self,
+        hardware_power_watts: float = 100,
+        sampling_interval: float = 0.1,
+        capacity: int = 4096,
+        background: bool = False
+    ):
         """
         Initialize energy tracker.
         
         Args:
             hardware_power_watts: Maximum hardware power consumption
             sampling_interval: Sampling interval in seconds
+            capacity: Number of most recent samples kept for the timeline
+            background: Sample on a background thread between start() and stop()
         """
         self.hardware_power_watts = hardware_power_watts
         self.sampling_interval = sampling_interval
-        self.samples: List[Dict[str, float]] = []
+        self.capacity = max(1, capacity)
+        self.background = background
+        self._reset_buffers()
         self.is_tracking = False
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        
+        # Prime psutil's delta counter so the first sample is meaningful
+        psutil.cpu_percent(interval=None)
+    
+    def _reset_buffers(self):
+        self._ts = np.empty(self.capacity)
+        self._cpu = np.empty(self.capacity)
+        self._pw = np.empty(self.capacity)
+        self._idx = 0
+        self._count = 0
+        self._sum_pw = 0.0
+        self._peak_pw = 0.0
+    
+    @property
+    def samples(self) -> List[Dict[str, float]]:
+        """Retained samples, oldest first, as timestamp / cpu_percent / power_watts dicts."""
+        with self._lock:
+            if self._count <= self.capacity:
+                order = slice(0, self._count)
+            else:
+                order = np.r_[self._idx:self.capacity, 0:self._idx]
+            columns = (self._ts[order].tolist(), self._cpu[order].tolist(),
+                       self._pw[order].tolist())
+        return [
+            {"timestamp": ts, "cpu_percent": cpu, "power_watts": pw}
+            for ts, cpu, pw in zip(*columns)
+        ]
         
     def start(self):
-        """Start energy tracking."""
-        self.samples = []
+        """Start energy tracking, stopping any sampler left running by a previous start()."""
+        if self._sampler is not None:
+            self.stop()
+        self._reset_buffers()
         self.is_tracking = True
         self.start_time = time.time()
+        psutil.cpu_percent(interval=None)
+        if self.background:
+            self._stop_event.clear()
+            self._sampler = threading.Thread(target=self._sample_loop, daemon=True)
+            self._sampler.start()
         logger.debug("Started energy tracking")
     
     def sample(self):
@@ -48,21 +109,36 @@ class EnergyTracker:
         if not self.is_tracking:
             return
         
-        cpu_percent = psutil.cpu_percent(interval=self.sampling_interval)
+        # Utilization since the previous call; does not sleep
+        cpu_percent = psutil.cpu_percent(interval=None)
         power_watts = self.hardware_power_watts * (cpu_percent / 100)
         
-        self.samples.append({
-            "timestamp": time.time(),
-            "cpu_percent": cpu_percent,
-            "power_watts": power_watts
-        })
+        with self._lock:
+            idx = self._idx
+            self._ts[idx] = time.time()
+            self._cpu[idx] = cpu_percent
+            self._pw[idx] = power_watts
+            self._idx = (idx + 1) % self.capacity
+            self._count += 1
+            self._sum_pw += power_watts
+            if power_watts > self._peak_pw:
+                self._peak_pw = power_watts
     
     def stop(self):
         """Stop energy tracking."""
+        if self._sampler is not None:
+            self._stop_event.set()
+            self._sampler.join()
+            self._sampler = None
         self.is_tracking = False
         self.end_time = time.time()
         logger.debug("Stopped energy tracking")
     
+    def _sample_loop(self):
+        """Sample every sampling_interval until stopped."""
+        while not self._stop_event.wait(self.sampling_interval):
+            self.sample()
+    
     def get_metrics(self) -> Dict[str, float]:
         """
         Get detailed energy metrics.
@@ -70,27 +146,28 @@ class EnergyTracker:
         Returns:
             Dictionary with energy metrics
         """
-        if not self.samples:
+        with self._lock:
+            n = self._count
+            sum_power_watts = self._sum_pw
+            peak_power_watts = self._peak_pw
+        if not n:
             return {}
         
         duration_seconds = self.end_time - self.start_time
         duration_hours = duration_seconds / 3600
         
         # Calculate average power
-        avg_power_watts = sum(s["power_watts"] for s in self.samples) / len(self.samples)
-        
-        # Calculate peak power
-        peak_power_watts = max(s["power_watts"] for s in self.samples)
+        avg_power_watts = sum_power_watts / n
         
         # Calculate total energy
         energy_kwh = (avg_power_watts * duration_hours) / 1000
         
         # Calculate energy per sample
-        energy_per_sample = energy_kwh / len(self.samples) if self.samples else 0
+        energy_per_sample = energy_kwh / n
         
         return {
             "duration_seconds": duration_seconds,
-            "num_samples": len(self.samples),
+            "num_samples": n,
             "avg_power_watts": avg_power_watts,
             "peak_power_watts": peak_power_watts,
             "energy_kwh": energy_kwh,
@@ -4,11 +4,75 @@ Sustainability Index
 Composite green performance metric
 """
 
-from typing import Dict
+from bisect import bisect_right
+from typing import Dict, Union
 import logging
 
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Agent count above which rank_agents switches to the NumPy kernel
+VECTORIZED_RANKING_THRESHOLD = 64
+
+# Lower bounds of each rating band above "Poor", ascending
+RATING_THRESHOLDS = (50.0, 100.0, 150.0, 200.0)
+RATING_LABELS = ("Poor", "Fair", "Good", "Very Good", "Excellent")
+
+_RATING_THRESHOLD_ARRAY = np.array(RATING_THRESHOLDS, dtype=np.float64)
+_RATING_LABEL_ARRAY = np.array(RATING_LABELS)
+
+# Columnar (one record per agent) layout accepted by rank_agents() in place
+# of a dict of metric dicts
+METRICS_DTYPE = np.dtype([
+    ("agent", "U64"),
+    ("accuracy", "f8"),
+    ("energy_kwh", "f8"),
+    ("carbon_co2e_kg", "f8"),
+    ("latency_ms", "f8"),
+])
+
+# Value used for a metric an agent does not report
+_METRIC_DEFAULTS = (
+    ("accuracy", 0.0),
+    ("energy_kwh", 1.0),
+    ("carbon_co2e_kg", 1.0),
+    ("latency_ms", np.nan),
+)
+
+AgentMetrics = Union[Dict[str, Dict[str, float]], np.ndarray]
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _sustainability_kernel(accuracy, energy_kwh, carbon_co2e_kg,
+                               accuracy_weight, efficiency_weight, carbon_weight):
+        """Scalar body of SustainabilityIndex.calculate()"""
+        if carbon_co2e_kg == 0 or energy_kwh == 0:
+            return 0.0
+        numerator = accuracy * accuracy_weight + efficiency_weight / energy_kwh
+        denominator = carbon_co2e_kg * carbon_weight
+        return numerator / denominator if denominator > 0 else 0.0
+
+    @njit(cache=True, parallel=True)
+    def _sustainability_batch(accuracy, energy_kwh, carbon_co2e_kg,
+                              accuracy_weight, efficiency_weight, carbon_weight):
+        """out[i] = _sustainability_kernel() of row i, rows split across threads"""
+        n = accuracy.shape[0]
+        out = np.empty(n, np.float64)
+        for i in prange(n):
+            out[i] = _sustainability_kernel(
+                accuracy[i], energy_kwh[i], carbon_co2e_kg[i],
+                accuracy_weight, efficiency_weight, carbon_weight
+            )
+        return out
+
 
 class SustainabilityIndex:
     """
@@ -40,6 +104,9 @@ class SustainabilityIndex:
         self.efficiency_weight = efficiency_weight / total
         self.carbon_weight = carbon_weight / total
         
+        # Normalized weights packed for calculate(), unpacked once per call
+        self._w = (self.accuracy_weight, self.efficiency_weight, self.carbon_weight)
+        
         logger.info(f"Initialized SustainabilityIndex with weights: "
                    f"accuracy={self.accuracy_weight:.2f}, "
                    f"efficiency={self.efficiency_weight:.2f}, "
@@ -68,21 +135,61 @@ class SustainabilityIndex:
         if carbon_co2e_kg == 0 or energy_kwh == 0:
             return 0.0
         
-        # Normalize efficiency (inverse of energy)
-        efficiency = 1.0 / energy_kwh
+        w_accuracy, w_efficiency, w_carbon = self._w
         
-        # Calculate weighted numerator
-        numerator = (
-            accuracy * self.accuracy_weight +
-            efficiency * self.efficiency_weight
-        )
+        # Efficiency (inverse of energy) is weighted in a single divide
+        numerator = accuracy * w_accuracy + w_efficiency / energy_kwh
+        denominator = carbon_co2e_kg * w_carbon
         
-        # Calculate weighted denominator
-        denominator = carbon_co2e_kg * self.carbon_weight
+        return numerator / denominator if denominator > 0 else 0.0
+    
+    def calculate_batch(
+        self,
+        accuracy: np.ndarray,
+        energy_kwh: np.ndarray,
+        carbon_co2e_kg: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate sustainability index over whole metric columns.
         
-        sustainability_index = numerator / denominator if denominator > 0 else 0.0
+        Same formula as calculate(), evaluated by a parallel Numba kernel
+        when Numba is installed and once per column with NumPy otherwise.
         
-        return sustainability_index
+        Args:
+            accuracy: Task accuracies
+            energy_kwh: Energy consumption values
+            carbon_co2e_kg: Carbon emission values
+            
+        Returns:
+            Array of sustainability index scores
+        """
+        if NUMBA_AVAILABLE:
+            accuracy, energy_kwh, carbon_co2e_kg = np.broadcast_arrays(
+                np.asarray(accuracy, dtype=np.float64),
+                np.asarray(energy_kwh, dtype=np.float64),
+                np.asarray(carbon_co2e_kg, dtype=np.float64)
+            )
+            scores = _sustainability_batch(
+                np.ascontiguousarray(accuracy).ravel(),
+                np.ascontiguousarray(energy_kwh).ravel(),
+                np.ascontiguousarray(carbon_co2e_kg).ravel(),
+                *self._w
+            )
+            return scores.reshape(accuracy.shape)
+        
+        accuracy = np.asarray(accuracy, dtype=np.float64)
+        energy_kwh = np.asarray(energy_kwh, dtype=np.float64)
+        carbon_co2e_kg = np.asarray(carbon_co2e_kg, dtype=np.float64)
+        
+        w_accuracy, w_efficiency, w_carbon = self._w
+        denominator = carbon_co2e_kg * w_carbon
+        valid = (energy_kwh != 0) & (denominator > 0)
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            numerator = accuracy * w_accuracy + w_efficiency / energy_kwh
+            scores = numerator / denominator
+        
+        return np.where(valid, scores, 0.0)
     
     def calculate_detailed(
         self,
@@ -130,19 +237,66 @@ class SustainabilityIndex:
         
         return result
     
+    @staticmethod
+    def metrics_table(agent_metrics: Dict[str, Dict[str, float]]) -> np.ndarray:
+        """
+        Convert a dict of agent metric dicts to a METRICS_DTYPE array.
+        
+        Build the table once and pass it to rank_agents() or
+        rank_agents_vectorized() to rank repeatedly without re-reading the
+        dicts. Missing metrics take the rank_agents() defaults, with NaN for
+        latency. Agent names are stored up to 64 characters.
+        
+        Args:
+            agent_metrics: Dictionary mapping agent names to their metrics
+            
+        Returns:
+            Structured array with one record per agent
+        """
+        table = np.empty(len(agent_metrics), dtype=METRICS_DTYPE)
+        table["agent"] = list(agent_metrics)
+        for key, default in _METRIC_DEFAULTS:
+            table[key] = np.fromiter(
+                (metrics.get(key, default) for metrics in agent_metrics.values()),
+                dtype=np.float64,
+                count=len(table)
+            )
+        return table
+    
+    def _score_table(self, agent_metrics: AgentMetrics) -> tuple:
+        """Agent names and calculate_batch() scores for either metrics form."""
+        if isinstance(agent_metrics, np.ndarray):
+            table = agent_metrics
+            names = table["agent"].tolist()
+        else:
+            table = self.metrics_table(agent_metrics)
+            names = list(agent_metrics)
+        
+        scores = self.calculate_batch(
+            table["accuracy"],
+            table["energy_kwh"],
+            table["carbon_co2e_kg"]
+        )
+        return names, scores
+    
     def rank_agents(
         self,
-        agent_metrics: Dict[str, Dict[str, float]]
+        agent_metrics: AgentMetrics
     ) -> list:
         """
         Rank agents by sustainability index.
         
         Args:
-            agent_metrics: Dictionary mapping agent names to their metrics
+            agent_metrics: Dictionary mapping agent names to their metrics,
+                or a METRICS_DTYPE table from metrics_table()
             
         Returns:
             List of (agent_name, sustainability_index) tuples, sorted
         """
+        if (isinstance(agent_metrics, np.ndarray)
+                or len(agent_metrics) > VECTORIZED_RANKING_THRESHOLD):
+            return self.rank_agents_vectorized(agent_metrics)
+        
         rankings = []
         
         for agent_name, metrics in agent_metrics.items():
@@ -158,6 +312,29 @@ class SustainabilityIndex:
         
         return rankings
     
+    def rank_agents_vectorized(
+        self,
+        agent_metrics: AgentMetrics
+    ) -> list:
+        """
+        Rank agents by sustainability index using NumPy.
+        
+        Scores the float64 metric columns with calculate_batch() and
+        sorts once with argsort. Scores and ties (kept in input order)
+        match rank_agents() exactly.
+        
+        Args:
+            agent_metrics: Dictionary mapping agent names to their metrics,
+                or a METRICS_DTYPE table from metrics_table()
+            
+        Returns:
+            List of (agent_name, sustainability_index) tuples, sorted
+        """
+        names, scores = self._score_table(agent_metrics)
+        order = np.argsort(-scores, kind="stable")
+        
+        return [(names[i], float(scores[i])) for i in order]
+    
     def compare_agents(
         self,
         agent_a_metrics: Dict[str, float],
@@ -185,6 +362,51 @@ class SustainabilityIndex:
             carbon_co2e_kg=agent_b_metrics.get("carbon_co2e_kg", 1)
         )
         
+        return self._comparison(si_a, si_b)
+    
+    def precompute_si(
+        self,
+        agent_metrics: AgentMetrics
+    ) -> Dict[str, float]:
+        """
+        Score every agent once for repeated comparisons.
+        
+        Args:
+            agent_metrics: Dictionary mapping agent names to their metrics,
+                or a METRICS_DTYPE table from metrics_table()
+            
+        Returns:
+            Dictionary mapping agent names to sustainability index, for
+            compare_agents_cached()
+        """
+        names, scores = self._score_table(agent_metrics)
+        return dict(zip(names, scores.tolist()))
+    
+    def compare_agents_cached(
+        self,
+        agent_a: str,
+        agent_b: str,
+        si_map: Dict[str, float]
+    ) -> Dict[str, any]:
+        """
+        Compare two agents using scores from precompute_si().
+        
+        Same result as compare_agents() on their metrics, with no
+        rescoring, so all-pairs comparisons score each agent only once.
+        
+        Args:
+            agent_a: Name of agent A
+            agent_b: Name of agent B
+            si_map: Precomputed sustainability indices
+            
+        Returns:
+            Comparison results
+        """
+        return self._comparison(si_map[agent_a], si_map[agent_b])
+    
+    @staticmethod
+    def _comparison(si_a: float, si_b: float) -> Dict[str, any]:
+        """Comparison result for two sustainability indices."""
         improvement = ((si_b - si_a) / si_a * 100) if si_a > 0 else 0.0
         
         return {
@@ -206,13 +428,23 @@ class SustainabilityIndex:
         Returns:
             Rating string
         """
-        if sustainability_index >= 200:
-            return "Excellent"
-        elif sustainability_index >= 150:
-            return "Very Good"
-        elif sustainability_index >= 100:
-            return "Good"
-        elif sustainability_index >= 50:
-            return "Fair"
-        else:
-            return "Poor"
+        # NaN fails every ">=" band check, so it rates "Poor"
+        if sustainability_index != sustainability_index:
+            return RATING_LABELS[0]
+        return RATING_LABELS[bisect_right(RATING_THRESHOLDS, sustainability_index)]
+    
+    @staticmethod
+    def get_ratings(sustainability_indices: np.ndarray) -> np.ndarray:
+        """
+        Get qualitative ratings for many sustainability indices at once.
+        
+        Args:
+            sustainability_indices: Array of sustainability index values
+            
+        Returns:
+            Array of rating strings, same shape as the input
+        """
+        values = np.asarray(sustainability_indices, dtype=np.float64)
+        bands = np.searchsorted(_RATING_THRESHOLD_ARRAY, values, side="right")
+        bands[np.isnan(values)] = 0
+        return _RATING_LABEL_ARRAY[bands]
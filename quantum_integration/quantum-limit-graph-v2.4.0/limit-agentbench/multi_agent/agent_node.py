@@ -1,5 +1,10 @@
+import asyncio
+
+
 class AgentNode:
 
+    __slots__ = ("name", "runner")
+
     def __init__(self, name, runner):
         self.name = name
         self.runner = runner
@@ -7,3 +12,10 @@ class AgentNode:
     def execute(self, task):
         result = self.runner.run(task)
         return result
+
+    async def execute_async(self, task):
+        # Prefer the runner's native coroutine; otherwise keep the loop free
+        run_async = getattr(self.runner, "run_async", None)
+        if run_async is not None:
+            return await run_async(task)
+        return await asyncio.to_thread(self.runner.run, task)
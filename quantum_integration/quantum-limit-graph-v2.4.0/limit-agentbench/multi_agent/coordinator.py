@@ -1,13 +1,20 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+
 class MultiAgentCoordinator:
 
     def __init__(self, agents):
         self.agents = agents
 
     def distribute(self, task):
-        results = []
+        # Agents run concurrently; results keep agent order
+        if len(self.agents) <= 1:
+            return [agent.execute(task) for agent in self.agents]
 
-        for agent in self.agents:
-            res = agent.execute(task)
-            results.append(res)
+        with ThreadPoolExecutor(max_workers=len(self.agents)) as pool:
+            return list(pool.map(lambda agent: agent.execute(task), self.agents))
 
-        return results
+    async def distribute_async(self, task):
+        results = await asyncio.gather(*(agent.execute_async(task) for agent in self.agents))
+        return list(results)
@@ -1,12 +1,25 @@
+from collections import deque
+
+
 class MessageBus:
 
     def __init__(self):
-        self.messages = []
+        # deque.append / popleft are atomic, so producers and the consumer
+        # need no lock
+        self.messages = deque()
 
     def publish(self, sender, payload):
         self.messages.append((sender, payload))
 
     def consume_all(self):
-        msgs = self.messages
-        self.messages = []
+        # Drain by popping rather than rebinding, so a message published
+        # mid-drain is kept for the next call. Only the messages queued on
+        # entry are taken, so a busy publisher cannot stretch the drain.
+        popleft = self.messages.popleft
+        msgs = []
+        try:
+            for _ in range(len(self.messages)):
+                msgs.append(popleft())
+        except IndexError:
+            pass
         return msgs
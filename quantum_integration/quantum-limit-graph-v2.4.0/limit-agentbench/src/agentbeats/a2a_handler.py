@@ -1,10 +1,70 @@
 # Update src/agentbeats/a2a_handler.py
 
+from typing import Optional
+
+import aiohttp
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from constraints.budget_enforcer import BudgetEnforcer, Budget
 
+# Connection pool shared by all requests of one handler
+MAX_CONNECTIONS = 128
+KEEPALIVE_TIMEOUT_SECONDS = 30
+
 class A2AHandler:
     def __init__(self, budget: Budget = None):
         self.budget_enforcer = BudgetEnforcer(budget) if budget else None
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Pooled keep-alive session, created on first use and reused for every task"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=MAX_CONNECTIONS,
+                    keepalive_timeout=KEEPALIVE_TIMEOUT_SECONDS
+                )
+            )
+        return self._session
+    
+    async def close(self):
+        """Close the pooled session"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    async def send_task(self, agent_url: str, task: dict) -> dict:
+        """POST a task to an agent's A2A endpoint"""
+        session = await self._get_session()
+        if ORJSON_AVAILABLE:
+            request = session.post(
+                f"{agent_url}/a2a/task",
+                data=orjson.dumps(task, option=orjson.OPT_SERIALIZE_NUMPY),
+                headers={"content-type": "application/json"}
+            )
+        else:
+            request = session.post(f"{agent_url}/a2a/task", json=task)
+        async with request as resp:
+            resp.raise_for_status()
+            return await resp.json()
+    
+    async def get_result(self, agent_url: str, task_id: str) -> dict:
+        """Fetch the status or result of a previously sent task"""
+        session = await self._get_session()
+        async with session.get(f"{agent_url}/a2a/task/{task_id}") as resp:
+            resp.raise_for_status()
+            return await resp.json()
     
     async def send_task_with_budget(self, agent_url: str, task: dict):
         """Send task with budget constraints"""
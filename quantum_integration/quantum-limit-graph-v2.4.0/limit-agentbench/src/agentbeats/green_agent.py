@@ -1,10 +1,57 @@
 # Update src/agentbeats/green_agent.py
 
+import asyncio
+from typing import Dict, List
+
 from analysis.pareto_analyzer import ParetoFrontierAnalyzer, ParetoPoint
 
+# Default cap on A2A tasks in flight during orchestration
+MAX_CONCURRENT_ASSESSMENTS = 32
+
 class GreenSustainabilityAgent:
-    def __init__(self):
+    def __init__(self, a2a_handler=None, max_concurrency: int = MAX_CONCURRENT_ASSESSMENTS):
         self.pareto_analyzer = ParetoFrontierAnalyzer()
+        self._a2a = a2a_handler
+        self.max_concurrency = max_concurrency
+    
+    @property
+    def a2a(self):
+        """A2A client used to reach purple agents, created on first use"""
+        if self._a2a is None:
+            from agentbeats.a2a_handler import A2AHandler
+            self._a2a = A2AHandler()
+        return self._a2a
+    
+    async def orchestrate_evaluation(self, purple_agents: List[str], task: Dict) -> Dict:
+        """
+        Send a task to every purple agent with bounded concurrency
+        
+        At most max_concurrency tasks are in flight, and coroutines are
+        created one chunk at a time so large fleets do not allocate every
+        task object up front.
+        
+        Returns:
+            {'results': {url: response}, 'failures': {url: error message}}
+        """
+        sem = asyncio.Semaphore(self.max_concurrency)
+        
+        async def _one(url):
+            async with sem:
+                return await self.a2a.send_task(url, task)
+        
+        results = {}
+        failures = {}
+        chunk = self.max_concurrency * 4
+        for start in range(0, len(purple_agents), chunk):
+            urls = purple_agents[start:start + chunk]
+            outcomes = await asyncio.gather(*(_one(url) for url in urls), return_exceptions=True)
+            for url, outcome in zip(urls, outcomes):
+                if isinstance(outcome, BaseException):
+                    failures[url] = f"{type(outcome).__name__}: {outcome}"
+                else:
+                    results[url] = outcome
+        
+        return {'results': results, 'failures': failures}
     
     async def score_with_pareto(self, results: List[Dict]) -> Dict:
         """Score agents using Pareto optimality"""
@@ -18,11 +65,14 @@ class GreenSustainabilityAgent:
             ) for r in results
         ]
         
-        frontier = self.pareto_analyzer.compute_frontier(points)
+        # Rank 0 of the dominance layering is the Pareto frontier (in input
+        # order), so one vectorized dominance matrix yields both
         ranks = self.pareto_analyzer.rank_by_dominance(points)
+        frontier = ranks.get(0, [])
+        knee = self.pareto_analyzer.get_knee_point(frontier)
         
         return {
             'frontier': frontier,
             'ranks': ranks,
-            'knee_point': self.pareto_analyzer.get_knee_point(frontier)
+            'knee_point': knee
         }
@@ -1,7 +1,17 @@
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from .green_agent import GreenSustainabilityAgent
 
-app = FastAPI()
+try:
+    import orjson  # noqa: F401  (required by ORJSONResponse)
+    from fastapi.responses import ORJSONResponse
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+app = FastAPI(
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+)
 agent = GreenSustainabilityAgent()
 
 @app.post("/a2a/task")
@@ -1,8 +1,44 @@
 # Add: src/agentbeats/platform_reporter.py
 
+import asyncio
+import json
+import logging
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Maximum trace events sent in one platform request
+TRACE_BATCH_SIZE = 64
+
+
+def _encode_payload(payload: dict) -> bytes:
+    """Serialize a payload to JSON bytes once, including NumPy scalars and arrays"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload, default=_to_builtin).encode()
+
+
+def _to_builtin(value):
+    """json fallback converting NumPy scalars and arrays with tolist()"""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
 class AgentBeatsPlatformReporter:
     """Reports results to AgentBeats platform"""
     
+    def __init__(self, platform_api=None, batch_size: int = TRACE_BATCH_SIZE):
+        self.platform_api = platform_api
+        self.batch_size = batch_size
+        self._trace_q = None
+        self._flusher = None
+    
     async def submit_result(self, result: dict):
         """Submit assessment result to platform"""
         payload = {
@@ -23,9 +59,46 @@ class AgentBeatsPlatformReporter:
         await self.platform_api.submit_result(payload)
     
     async def emit_trace(self, step: dict):
-        """Emit real-time trace updates"""
-        await self.platform_api.send_task_update({
+        """Queue a real-time trace update; a background task sends them in batches"""
+        if self._flusher is None or self._flusher.done():
+            if self._trace_q is None:
+                self._trace_q = asyncio.Queue()
+            self._flusher = asyncio.create_task(self._flush_loop())
+        
+        self._trace_q.put_nowait({
             "type": "progress",
             "message": step["description"],
             "metadata": step["metrics"]
-        })
\ No newline at end of file
+        })
+    
+    async def _flush_loop(self):
+        """Send queued traces, up to batch_size per request, each batch serialized once"""
+        queue = self._trace_q
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            
+            try:
+                await self.platform_api.send_batch(_encode_payload(batch))
+            except Exception as e:
+                logger.warning(f"Dropped {len(batch)} trace updates: {e}")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+    
+    async def flush(self):
+        """Wait until every queued trace has been sent"""
+        if self._trace_q is not None:
+            await self._trace_q.join()
+    
+    async def close(self):
+        """Flush pending traces and stop the background sender"""
+        await self.flush()
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
\ No newline at end of file
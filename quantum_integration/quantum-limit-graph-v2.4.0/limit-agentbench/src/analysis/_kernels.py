@@ -0,0 +1,178 @@
+"""
+Compiled kernels for Pareto dominance checks
+
+dominated_mask() is JIT-compiled with Numba when it is installed, with rows
+checked in parallel, and falls back to a blockwise NumPy sweep otherwise;
+both return the same mask.
+
+nondominated_scan() is a single sorted pass that only compares each row
+against the frontier kept so far, and skyline_2d() a sort-and-sweep for two objectives;
+they serve frontiers without repeated agent ids.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Upper bound on (dominators x candidates x dimensions) comparisons held in
+# memory at once by the NumPy fallback
+DOMINANCE_BLOCK_ELEMENTS = 1 << 22
+
+# Objectives that fit the per-pair comparison bit masks of the Numba kernel
+SWAR_MAX_OBJECTIVES = 62
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True, boundscheck=False)
+    def _dominated_mask_bits(A, id_codes):
+        """
+        out[i] is True if some row j with a different id code dominates row i
+
+        Branchless over objectives: comparison k sets bit k of a no-worse
+        and a strictly-better word, and j dominates i when every no-worse
+        bit is set and some better bit is. No-worse means "not greater", so
+        NaN compares as in the other kernels. Requires m <= SWAR_MAX_OBJECTIVES.
+        Rows are independent, so the outer loop runs across threads.
+        """
+        n, m = A.shape
+        full = (1 << m) - 1
+        out = np.zeros(n, np.bool_)
+        for i in prange(n):
+            for j in range(n):
+                if id_codes[j] == id_codes[i]:
+                    continue
+                no_worse_bits = 0
+                better_bits = 0
+                for k in range(m):
+                    no_worse_bits |= int(not (A[j, k] > A[i, k])) << k
+                    better_bits |= int(A[j, k] < A[i, k]) << k
+                if no_worse_bits == full and better_bits != 0:
+                    out[i] = True
+                    break
+        return out
+
+    @njit(parallel=True, cache=True, boundscheck=False)
+    def _dominated_mask_loop(A, id_codes):
+        """As _dominated_mask_bits, for any m, stopping at the first worse objective"""
+        n, m = A.shape
+        out = np.zeros(n, np.bool_)
+        for i in prange(n):
+            for j in range(n):
+                if id_codes[j] == id_codes[i]:
+                    continue
+                no_worse = True
+                better = False
+                for k in range(m):
+                    if A[j, k] > A[i, k]:
+                        no_worse = False
+                        break
+                    if A[j, k] < A[i, k]:
+                        better = True
+                if no_worse and better:
+                    out[i] = True
+                    break
+        return out
+
+    @njit(cache=True, boundscheck=False)
+    def any_dominates(F, p):
+        """True if some row of F dominates p, stopping at the first that does"""
+        k, m = F.shape
+        for r in range(k):
+            no_worse = True
+            better = False
+            for c in range(m):
+                if F[r, c] > p[c]:
+                    no_worse = False
+                    break
+                if F[r, c] < p[c]:
+                    better = True
+            if no_worse and better:
+                return True
+        return False
+
+    def dominated_mask(A, id_codes):
+        """
+        out[i] is True if some row j with a different id code dominates row i
+
+        All columns of A are minimized.
+        """
+        if A.shape[1] <= SWAR_MAX_OBJECTIVES:
+            return _dominated_mask_bits(A, id_codes)
+        return _dominated_mask_loop(A, id_codes)
+
+else:
+    def any_dominates(F, p):
+        """True if some row of F dominates p"""
+        return bool((~(F > p).any(axis=1) & (F < p).any(axis=1)).any())
+
+    def dominated_mask(A, id_codes):
+        """
+        out[i] is True if some row j with a different id code dominates row i
+
+        All columns of A are minimized. Candidates are swept in blocks to
+        bound the (n, block, m) comparison arrays.
+        """
+        n, m = A.shape
+        out = np.zeros(n, dtype=bool)
+        block = max(1, DOMINANCE_BLOCK_ELEMENTS // (max(n, 1) * max(m, 1)))
+        for start in range(0, n, block):
+            stop = min(start + block, n)
+            others = A[:, None, :]
+            candidates = A[None, start:stop, :]
+            no_worse = ~(others > candidates).any(axis=2)
+            better = (others < candidates).any(axis=2)
+            dominates = no_worse & better & (id_codes[:, None] != id_codes[None, start:stop])
+            out[start:stop] = dominates.any(axis=0)
+        return out
+
+
+def nondominated_scan(A):
+    """
+    Indices (ascending) of the rows of A that no other row dominates
+
+    All columns of A are minimized and A must not contain NaN. Rows are
+    visited in lexicographic order (first column primary), so a row can
+    only be dominated by rows visited before it: each row is checked
+    against the frontier kept so far and appended when nothing there
+    dominates it, and kept rows are never revisited.
+    """
+    n, m = A.shape
+    order = np.lexsort(A.T[::-1])
+    front = np.empty((n, m), dtype=A.dtype)
+    kept = np.empty(n, dtype=np.intp)
+    k = 0
+    for i in order:
+        p = A[i]
+        if not any_dominates(front[:k], p):
+            front[k] = p
+            kept[k] = i
+            k += 1
+    return np.sort(kept[:k])
+
+def skyline_2d(A):
+    """
+    Indices (ascending) of the rows of a two-column A that no other row dominates
+
+    Both columns are minimized and A must not contain NaN. Rows are sorted
+    by (x, y); within a run of equal x only the lowest y can survive, and it
+    does when that y is below every y seen at a smaller x. O(n log n).
+    """
+    n = len(A)
+    if not n:
+        return np.empty(0, dtype=np.intp)
+    order = np.lexsort((A[:, 1], A[:, 0]))
+    xs = A[order, 0]
+    ys = A[order, 1]
+    starts = np.flatnonzero(np.r_[True, xs[1:] != xs[:-1]])
+    group = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, n]))
+    # Lowest y over all rows with a smaller x than each run
+    best_before = np.empty(len(starts))
+    best_before[0] = np.inf
+    best_before[1:] = np.minimum.accumulate(ys)[starts[1:] - 1]
+    run_min = ys[starts]
+    keep = (ys == run_min[group]) & ((ys < best_before[group]) | (group == 0))
+    return np.sort(order[keep])
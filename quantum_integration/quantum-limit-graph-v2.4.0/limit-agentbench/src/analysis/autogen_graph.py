@@ -1,25 +1,65 @@
+from array import array
+
+
 class AutoGenConversationGraph:
     """
     Extracts message graph metrics from AutoGen runs.
+
+    Agent names are interned to small integer ids on first sight; edges
+    are kept as parallel int32 sender / recipient arrays, and depth is a
+    running counter, so metrics() is O(1) however long the conversation
+    grows. Message content is only retained for messages recorded with
+    record_with_content(). With store_edges=False only the id table and
+    depth are kept, so memory is bounded by the number of distinct agents.
     """
 
-    def __init__(self):
-        self.messages = []
+    def __init__(self, store_edges: bool = True):
+        self.store_edges = store_edges
+        self._id_of = {}
+        self._names = []
+        self._senders = array("i")
+        self._recipients = array("i")
+        self._contents = {}
+        self._depth = 0
 
-    def record(self, sender: str, recipient: str, content: str):
-        self.messages.append({
-            "from": sender,
-            "to": recipient,
-            "content": content
-        })
+    def _id(self, name: str) -> int:
+        """Interned id of an agent name, assigning the next id if new."""
+        i = self._id_of.get(name)
+        if i is None:
+            i = self._id_of[name] = len(self._names)
+            self._names.append(name)
+        return i
 
-    def metrics(self):
-        nodes = set()
-        for m in self.messages:
-            nodes.add(m["from"])
-            nodes.add(m["to"])
+    def record(self, sender: str, recipient: str, content: str = None):
+        """Record a message edge; content is not stored."""
+        sender_id = self._id(sender)
+        recipient_id = self._id(recipient)
+        if self.store_edges:
+            self._senders.append(sender_id)
+            self._recipients.append(recipient_id)
+        self._depth += 1
 
+    def record_with_content(self, sender: str, recipient: str, content: str):
+        """Record a message edge and keep its content (if edges are stored)."""
+        if self.store_edges:
+            self._contents[self._depth] = content
+        self.record(sender, recipient)
+
+    @property
+    def messages(self):
+        """Recorded messages as from / to / content dicts (content None if not kept).
+
+        Empty when the graph does not store edges.
+        """
+        names = self._names
+        contents = self._contents
+        return [
+            {"from": names[s], "to": names[r], "content": contents.get(i)}
+            for i, (s, r) in enumerate(zip(self._senders, self._recipients))
+        ]
+
+    def metrics(self):
         return {
-            "conversation_depth": len(self.messages),
-            "agent_nodes": len(nodes)
+            "conversation_depth": self._depth,
+            "agent_nodes": len(self._names)
         }
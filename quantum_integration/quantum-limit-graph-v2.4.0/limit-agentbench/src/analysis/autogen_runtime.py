@@ -1,22 +1,45 @@
 """
 AutoGen Runtime Adapter with message-graph depth tracking.
+
+This is the single AutoGenRuntime implementation; runtime.autogen_runtime
+re-exports it.
 """
 
+from .autogen_graph import AutoGenConversationGraph
+
+
 class AutoGenRuntime:
     def __init__(self):
-        self.graph_depth = 0
+        self._store = False
+        self.graph = AutoGenConversationGraph(store_edges=self._store)
+
+    @property
+    def graph_depth(self) -> int:
+        """Messages exchanged so far across all runs."""
+        return self.graph.metrics()["conversation_depth"]
 
     def init(self, config: dict):
         self.config = config
+        # Keep the message log only on request; depth and node counts are
+        # running totals either way
+        self._store = config.get("store_messages", False)
+        self.graph = AutoGenConversationGraph(store_edges=self._store)
+
+    def record_message(self, sender: str, recipient: str, content: str = None):
+        self.graph.record(sender, recipient, content)
 
     def run(self, query: dict) -> dict:
-        # Simulated multi-agent conversation
-        self.graph_depth += 2
+        # Simulated multi-agent conversation: one request / reply round
+        self.record_message("user_proxy", "assistant")
+        self.record_message("assistant", "user_proxy")
 
+        # Depth and node count are maintained by record_message; no rescan
+        graph_metrics = self.graph.metrics()
         return {
             "accuracy": 0.85,
             "tool_calls": 1,
-            "conversation_depth": self.graph_depth,
+            "conversation_depth": graph_metrics["conversation_depth"],
+            "agent_nodes": graph_metrics["agent_nodes"],
         }
 
     def reduce_tool_calls(self):
@@ -26,4 +49,4 @@ class AutoGenRuntime:
         pass
 
     def finalize(self):
-        pass
+        self.graph = AutoGenConversationGraph(store_edges=self._store)
@@ -1,8 +1,24 @@
+import numpy as np
+
+
 class CarbonEstimator:
     def __init__(self, grid_intensity_g_kwh: float, pue: float):
-        self.grid = grid_intensity_g_kwh
-        self.pue = pue
+        self._grid = grid_intensity_g_kwh
+        self._pue = pue
+        # kg CO2e per Wh: (Wh -> kWh) * g/kWh * PUE * (g -> kg)
+        self._k = grid_intensity_g_kwh * pue * 1e-6
+
+    # Read-only: _k is derived from both at construction
+    @property
+    def grid(self) -> float:
+        return self._grid
+
+    @property
+    def pue(self) -> float:
+        return self._pue
 
     def estimate(self, energy_wh: float) -> float:
-        kwh = energy_wh / 1000.0
-        return (kwh * self.grid * self.pue) / 1000.0
+        return energy_wh * self._k
+
+    def estimate_array(self, energy_wh: np.ndarray) -> np.ndarray:
+        return np.asarray(energy_wh, dtype=np.float64) * self._k
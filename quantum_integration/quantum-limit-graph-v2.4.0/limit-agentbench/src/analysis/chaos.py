@@ -1,7 +1,28 @@
 import random
 
+import numpy as np
+
 def inject_energy_spike(metrics, probability=0.1):
     if random.random() < probability:
         metrics["energy"] *= 1.5
         metrics["chaos_event"] = "energy_spike"
     return metrics
+
+def inject_energy_spike_batch(metrics_list, probability=0.1, rng=None):
+    # One vectorized draw for the whole batch instead of a random() call per
+    # row; rng is a Generator (shared across a sweep), a seed, or None
+    rng = np.random.default_rng(rng)
+    spiked = np.flatnonzero(rng.random(len(metrics_list)) < probability)
+    for i in spiked.tolist():
+        metrics = metrics_list[i]
+        metrics["energy"] *= 1.5
+        metrics["chaos_event"] = "energy_spike"
+    return metrics_list
+
+def inject_energy_spike_array(energy, probability=0.1, rng=None):
+    # In-place on a float energy column; returns the mask of spiked rows.
+    # rng is taken as in inject_energy_spike_batch
+    rng = np.random.default_rng(rng)
+    spiked = rng.random(energy.shape) < probability
+    energy[spiked] *= 1.5
+    return spiked
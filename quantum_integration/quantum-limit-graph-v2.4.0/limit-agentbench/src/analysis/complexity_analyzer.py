@@ -5,15 +5,72 @@ This module analyzes task complexity across multiple dimensions to enable
 fair normalization of energy consumption and performance metrics.
 """
 
-from dataclasses import dataclass
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from math import isclose, log1p
 from typing import Dict, List, Optional
 import numpy as np
 import logging
 
 logger = logging.getLogger(__name__)
 
+# TaskComplexity dimensions, in composite-score order, with the divisor
+# applied after log1p normalization
+COMPLEXITY_DIMENSIONS = ('prompt_length', 'reasoning_steps', 'tool_calls',
+                         'wall_clock_ms', 'context_size')
+_LOG_SCALE = np.array([10.0, 5.0, 3.0, 1000.0, 15.0])
 
-@dataclass
+# Default: balanced weights
+DEFAULT_COMPLEXITY_WEIGHTS = {
+    'prompt_length': 0.2,
+    'reasoning_steps': 0.3,
+    'tool_calls': 0.2,
+    'wall_clock_ms': 0.2,
+    'context_size': 0.1
+}
+_DEFAULT_WEIGHT_VECTOR = tuple(DEFAULT_COMPLEXITY_WEIGHTS[d] for d in COMPLEXITY_DIMENSIONS)
+
+# str.translate table deleting sentence terminators; the length drop is
+# the terminator count, found in one pass over the string
+_SENTENCE_END_DELETE = str.maketrans('', '', '.!?')
+
+
+def _normalized_weights(weights: Optional[Dict[str, float]]) -> Dict[str, float]:
+    """Composite-score weights, rescaled to sum to 1.0 if they do not"""
+    if weights is None:
+        return DEFAULT_COMPLEXITY_WEIGHTS
+    
+    weight_sum = sum(weights.values())
+    if not isclose(weight_sum, 1.0, rel_tol=1e-05, abs_tol=1e-08):
+        logger.warning(f"Weights sum to {weight_sum}, normalizing to 1.0")
+        weights = {k: v / weight_sum for k, v in weights.items()}
+    return weights
+
+
+def composite_scores(dimensions: np.ndarray,
+                     weights: Optional[Dict[str, float]] = None) -> np.ndarray:
+    """
+    TaskComplexity.compute_composite_score() for many tasks at once
+    
+    Args:
+        dimensions: (N, 5) array of COMPLEXITY_DIMENSIONS values per task
+        weights: Custom weights for each dimension
+    
+    Returns:
+        (N,) composite scores; these match the per-task scores up to the
+        last-bit rounding difference between NumPy's and libm's log1p
+    """
+    weights = _normalized_weights(weights)
+    normalized = np.log1p(np.asarray(dimensions, dtype=np.float64)) / _LOG_SCALE
+    
+    # Accumulate column by column in dimension order, as the scalar sum does
+    scores = np.zeros(len(normalized))
+    for j, dim in enumerate(COMPLEXITY_DIMENSIONS):
+        scores += normalized[:, j] * weights.get(dim, 0.0)
+    return scores
+
+
+@dataclass(slots=True)
 class TaskComplexity:
     """
     Multi-dimensional task complexity measurement
@@ -22,12 +79,17 @@ class TaskComplexity:
     - Input size (prompt length, context)
     - Computational requirements (reasoning steps, tool calls)
     - Temporal requirements (wall-clock time)
+    
+    The default-weight composite score is cached on first use; treat the
+    dimensions as read-only once scored. Instances are slotted (no
+    per-instance __dict__).
     """
     prompt_length: int           # Number of tokens in input
     reasoning_steps: int          # Number of thinking/planning steps
     tool_calls: int              # Number of external tools invoked
     wall_clock_ms: float         # Actual execution time
     context_size: int            # Total context window used
+    _score: Optional[float] = field(default=None, init=False, repr=False, compare=False)
     
     def compute_composite_score(self, weights: Optional[Dict[str, float]] = None) -> float:
         """
@@ -47,46 +109,51 @@ class TaskComplexity:
         single dimensions from dominating the score
         """
         if weights is None:
-            # Default: balanced weights
-            weights = {
-                'prompt_length': 0.2,
-                'reasoning_steps': 0.3,
-                'tool_calls': 0.2,
-                'wall_clock_ms': 0.2,
-                'context_size': 0.1
-            }
-        
-        # Validate weights sum to 1.0
-        weight_sum = sum(weights.values())
-        if not np.isclose(weight_sum, 1.0):
-            logger.warning(f"Weights sum to {weight_sum}, normalizing to 1.0")
-            weights = {k: v / weight_sum for k, v in weights.items()}
-        
-        # Normalize each component using log scale
-        normalized = {
-            'prompt_length': np.log1p(self.prompt_length) / 10.0,
-            'reasoning_steps': np.log1p(self.reasoning_steps) / 5.0,
-            'tool_calls': np.log1p(self.tool_calls) / 3.0,
-            'wall_clock_ms': np.log1p(self.wall_clock_ms) / 1000.0,
-            'context_size': np.log1p(self.context_size) / 15.0
-        }
-        
-        # Weighted sum
-        score = sum(normalized[k] * weights.get(k, 0.0) for k in normalized)
+            if self._score is not None:
+                return self._score
+            w = _DEFAULT_WEIGHT_VECTOR
+        else:
+            # Validate weights sum to 1.0
+            weights = _normalized_weights(weights)
+            w = tuple(weights.get(d, 0.0) for d in COMPLEXITY_DIMENSIONS)
+        
+        # Log-scale each component and sum in COMPLEXITY_DIMENSIONS order
+        score = (
+            log1p(self.prompt_length) / 10.0 * w[0]
+            + log1p(self.reasoning_steps) / 5.0 * w[1]
+            + log1p(self.tool_calls) / 3.0 * w[2]
+            + log1p(self.wall_clock_ms) / 1000.0 * w[3]
+            + log1p(self.context_size) / 15.0 * w[4]
+        )
         
-        logger.debug(f"Computed complexity score: {score:.4f} from {normalized}")
+        logger.debug("Computed complexity score: %.4f", score)
+        if weights is None:
+            self._score = score
         return score
     
-    def to_dict(self) -> Dict:
-        """Convert to dictionary for serialization"""
+    def to_dict(self, composite_score: Optional[float] = None) -> Dict:
+        """
+        Convert to dictionary for serialization
+        
+        Args:
+            composite_score: Precomputed default-weight composite score,
+                             the cached score is used if not given
+        """
+        if composite_score is None:
+            composite_score = self.compute_composite_score()
         return {
             'prompt_length': self.prompt_length,
             'reasoning_steps': self.reasoning_steps,
             'tool_calls': self.tool_calls,
             'wall_clock_ms': self.wall_clock_ms,
             'context_size': self.context_size,
-            'composite_score': self.compute_composite_score()
+            'composite_score': composite_score
         }
+    
+    def dimensions(self) -> tuple:
+        """Dimension values in COMPLEXITY_DIMENSIONS order"""
+        return (self.prompt_length, self.reasoning_steps, self.tool_calls,
+                self.wall_clock_ms, self.context_size)
 
 
 class ComplexityAnalyzer:
@@ -108,6 +175,12 @@ class ComplexityAnalyzer:
     
     def __init__(self):
         """Initialize complexity analyzer"""
+        # Tiers sorted by upper bound once; a score belongs to the first
+        # tier whose bound exceeds it, i.e. bisect_right over the bounds
+        tiers = sorted(self.TIER_THRESHOLDS.items(), key=lambda item: item[1])
+        self._tier_names = tuple(name for name, _ in tiers)
+        self._tier_cuts = tuple(bound for _, bound in tiers[:-1])
+        self._tier_bounds = np.array(self._tier_cuts)
         logger.info("Initialized ComplexityAnalyzer")
     
     def analyze_from_trace(self, trace: Dict) -> TaskComplexity:
@@ -150,7 +223,7 @@ class ComplexityAnalyzer:
             reasoning_steps = len(reasoning)
         elif isinstance(reasoning, str):
             # If reasoning is a single string, count sentences
-            reasoning_steps = reasoning.count('.') + reasoning.count('!') + reasoning.count('?')
+            reasoning_steps = len(reasoning) - len(reasoning.translate(_SENTENCE_END_DELETE))
         else:
             reasoning_steps = 0
         
@@ -181,7 +254,8 @@ class ComplexityAnalyzer:
             context_size=context_size
         )
         
-        logger.debug(f"Analyzed trace complexity: {complexity.to_dict()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Analyzed trace complexity: %s", complexity.to_dict())
         return complexity
     
     def categorize_complexity(self, complexity: TaskComplexity) -> str:
@@ -202,13 +276,9 @@ class ComplexityAnalyzer:
             - Extreme: Highly complex tasks, extensive computation
         """
         score = complexity.compute_composite_score()
-        
-        for tier, threshold in self.TIER_THRESHOLDS.items():
-            if score < threshold:
-                logger.info(f"Categorized complexity score {score:.2f} as '{tier}'")
-                return tier
-        
-        return 'extreme'
+        tier = self._tier_names[bisect_right(self._tier_cuts, score)]
+        logger.debug("Categorized complexity score %.2f as '%s'", score, tier)
+        return tier
     
     def compare_complexities(self, complexity_a: TaskComplexity, 
                             complexity_b: TaskComplexity) -> Dict:
@@ -360,11 +430,20 @@ class ComplexityAnalyzer:
             Batch analysis summary with statistics
         """
         complexities = [self.analyze_from_trace(trace) for trace in traces]
-        scores = [c.compute_composite_score() for c in complexities]
-        tiers = [self.categorize_complexity(c) for c in complexities]
+        
+        # One (N, 5) matrix: log1p, weighting and tiering run once per
+        # column instead of once per trace
+        dimensions = np.array([c.dimensions() for c in complexities], dtype=np.float64)
+        scores = composite_scores(dimensions.reshape(len(complexities), len(COMPLEXITY_DIMENSIONS)))
+        tier_index = np.searchsorted(self._tier_bounds, scores, side='right')
+        for c, score in zip(complexities, scores.tolist()):
+            c._score = score
         
         # Compute statistics
-        tier_distribution = {tier: tiers.count(tier) for tier in set(tiers)}
+        tier_distribution = {
+            self._tier_names[i]: int(n)
+            for i, n in zip(*np.unique(tier_index, return_counts=True))
+        }
         
         return {
             'total_tasks': len(traces),
@@ -1,6 +1,10 @@
 # src/analysis/dominance_checker.py
 
-from typing import Set, Dict
+from typing import Callable, Dict, Iterable, List, Set, Tuple
+
+import numpy as np
+
+from ._kernels import dominated_mask
 
 
 def dominates(
@@ -11,20 +15,102 @@ def dominates(
 ) -> bool:
     """
     Returns True if solution a Pareto-dominates solution b.
+
+    Stops at the first metric where a is worse.
     """
-    better_or_equal = True
     strictly_better = False
 
     for k in minimize:
-        if a[k] > b[k]:
-            better_or_equal = False
-        elif a[k] < b[k]:
+        x, y = a[k], b[k]
+        if x > y:
+            return False
+        if x < y:
             strictly_better = True
 
     for k in maximize:
-        if a[k] < b[k]:
-            better_or_equal = False
-        elif a[k] > b[k]:
+        x, y = a[k], b[k]
+        if x < y:
+            return False
+        if x > y:
             strictly_better = True
 
-    return better_or_equal and strictly_better
+    return strictly_better
+
+
+def make_dominates(
+    minimize: Iterable[str],
+    maximize: Iterable[str],
+) -> Callable[[Dict, Dict], bool]:
+    """
+    dominates() specialized to fixed metric sets.
+
+    The sets are frozen into tuples once, so repeated pairwise checks
+    iterate local tuples instead of re-reading the sets on every call.
+    """
+    mins = tuple(minimize)
+    maxs = tuple(maximize)
+
+    def _dominates(a: Dict, b: Dict) -> bool:
+        strictly_better = False
+        for k in mins:
+            x, y = a[k], b[k]
+            if x > y:
+                return False
+            if x < y:
+                strictly_better = True
+        for k in maxs:
+            x, y = a[k], b[k]
+            if x < y:
+                return False
+            if x > y:
+                strictly_better = True
+        return strictly_better
+
+    return _dominates
+
+
+def pack_metrics(
+    solutions: List[Dict],
+    minimize: Iterable[str] = (),
+    maximize: Iterable[str] = (),
+) -> Tuple[np.ndarray, np.ndarray, Tuple[str, ...]]:
+    """
+    Stacks solutions into an (N, D) float64 matrix for the batch checks.
+
+    Returns (M, sign, keys): column j of M holds keys[j], and sign[j] is
+    -1 for a minimized and +1 for a maximized metric, so M * sign is
+    larger-is-better on every column.
+    """
+    minimize = tuple(minimize)
+    maximize = tuple(maximize)
+    keys = minimize + maximize
+    sign = np.array([-1.0] * len(minimize) + [1.0] * len(maximize))
+    M = np.array(
+        [[s[k] for k in keys] for s in solutions], dtype=np.float64
+    ).reshape(len(solutions), len(keys))
+    return M, sign, keys
+
+
+def dominates_batch(A: np.ndarray, B: np.ndarray, sign: np.ndarray) -> np.ndarray:
+    """
+    Row-wise dominates(): out[i] is True if A[i] Pareto-dominates B[i].
+
+    Branchless over metrics; arrays broadcast, so B may be a single row.
+    """
+    a = np.asarray(A, dtype=np.float64) * sign
+    b = np.asarray(B, dtype=np.float64) * sign
+    no_worse = ~(a < b).any(axis=-1)
+    better = (a > b).any(axis=-1)
+    return no_worse & better
+
+
+def pareto_front_mask(M: np.ndarray, sign: np.ndarray) -> np.ndarray:
+    """
+    True for the rows of M that no other row Pareto-dominates.
+
+    Uses the shared dominance kernel (Numba when installed, blockwise
+    NumPy otherwise), so memory stays bounded for large N.
+    """
+    M = np.asarray(M, dtype=np.float64)
+    minimized = np.ascontiguousarray(M * -np.asarray(sign, dtype=np.float64))
+    return ~dominated_mask(minimized, np.arange(len(M)))
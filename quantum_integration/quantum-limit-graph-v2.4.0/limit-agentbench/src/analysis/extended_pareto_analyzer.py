@@ -10,15 +10,48 @@ Adds three critical dimensions to Green_Agent's multi-objective optimization:
 Each dimension captures different failure modes not visible in basic 4D analysis.
 """
 
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Sequence, Union
+from collections import OrderedDict
 from dataclasses import dataclass, field
 import numpy as np
 import logging
 
+from ._kernels import dominated_mask, nondominated_scan, skyline_2d
+
 logger = logging.getLogger(__name__)
 
+# Column layout of AgentBatch.objectives
+EXTENDED_DIMENSIONS = (
+    'accuracy', 'energy_kwh', 'carbon_co2e_kg', 'latency_ms',
+    'memory_mb', 'circuit_depth', 'variance_score'
+)
+IDX_ACCURACY, IDX_ENERGY, IDX_CARBON, IDX_LATENCY, IDX_MEMORY, IDX_DEPTH, IDX_VARIANCE = range(7)
+
+# Hard-constraint keys of comprehensive_analysis and the column each caps
+CONSTRAINT_COLUMNS = {
+    'max_memory_mb': IDX_MEMORY,
+    'max_circuit_depth': IDX_DEPTH,
+    'max_variance': IDX_VARIANCE,
+}
+
+# Frontiers remembered per ExtendedParetoAnalyzer (least recently used evicted)
+FRONTIER_CACHE_SIZE = 32
+
+# Structured (one record per agent) layout accepted by ExtendedParetoAnalyzer
+# in place of a list of ExtendedParetoPoint
+DTYPE = np.dtype([
+    ('agent_id', 'U64'),
+    ('accuracy', 'f8'),
+    ('energy_kwh', 'f8'),
+    ('carbon_co2e_kg', 'f8'),
+    ('latency_ms', 'f8'),
+    ('memory_mb', 'f8'),
+    ('circuit_depth', 'i4'),
+    ('variance_score', 'f8'),
+])
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ExtendedParetoPoint:
     """
     Extended Pareto point with 7 dimensions
@@ -38,6 +71,9 @@ class ExtendedParetoPoint:
     - Memory: Hard constraint on edge devices, power-hungry
     - Circuit Depth: Predicts quantum noise, decoherence, scalability
     - Variance: Stability under repeated execution (prevents SLA violations)
+    
+    Points are immutable and slotted (no per-instance __dict__); metadata
+    is still a mutable dict.
     """
     agent_id: str
     
@@ -152,6 +188,120 @@ class ExtendedParetoPoint:
         )
 
 
+@dataclass(frozen=True, eq=False)
+class AgentBatch:
+    """
+    Agents materialized once as a NumPy objective matrix
+    
+    Built by ExtendedParetoAnalyzer.prepare() and accepted by every analysis
+    method in place of the agent list, so repeated analyses of the same
+    agents slice columns instead of re-reading dataclass fields.
+    
+    objectives holds raw values (accuracy is not negated) in
+    EXTENDED_DIMENSIONS order; id_codes maps equal agent_ids to equal ints.
+    """
+    agents: Tuple[ExtendedParetoPoint, ...]
+    objectives: np.ndarray
+    id_codes: np.ndarray
+    
+    @classmethod
+    def from_agents(cls, agents: Sequence[ExtendedParetoPoint]) -> 'AgentBatch':
+        objectives = np.array(
+            [[getattr(a, dim) for dim in EXTENDED_DIMENSIONS] for a in agents],
+            dtype=np.float64
+        ).reshape(len(agents), len(EXTENDED_DIMENSIONS))
+        return cls._build(tuple(agents), objectives, [a.agent_id for a in agents])
+    
+    @classmethod
+    def from_records(cls, records: np.ndarray) -> 'AgentBatch':
+        """Build a batch from a structured array with dtype DTYPE"""
+        records = np.asarray(records, dtype=DTYPE)
+        objectives = np.column_stack(
+            [records[dim].astype(np.float64) for dim in EXTENDED_DIMENSIONS]
+        ).reshape(len(records), len(EXTENDED_DIMENSIONS))
+        agents = tuple(
+            ExtendedParetoPoint(
+                agent_id=str(r['agent_id']),
+                accuracy=float(r['accuracy']),
+                energy_kwh=float(r['energy_kwh']),
+                carbon_co2e_kg=float(r['carbon_co2e_kg']),
+                latency_ms=float(r['latency_ms']),
+                memory_mb=float(r['memory_mb']),
+                circuit_depth=int(r['circuit_depth']),
+                variance_score=float(r['variance_score'])
+            )
+            for r in records
+        )
+        return cls._build(agents, objectives, records['agent_id'])
+    
+    @classmethod
+    def _build(cls, agents, objectives, ids) -> 'AgentBatch':
+        _, id_codes = np.unique(np.asarray(ids, dtype=str), return_inverse=True)
+        objectives.flags.writeable = False
+        id_codes = id_codes.reshape(-1)
+        id_codes.flags.writeable = False
+        return cls(agents, objectives, id_codes)
+    
+    def to_records(self) -> np.ndarray:
+        """Structured array (dtype DTYPE) view of the batch, one record per agent"""
+        records = np.empty(len(self), dtype=DTYPE)
+        records['agent_id'] = self.ids
+        for j, dim in enumerate(EXTENDED_DIMENSIONS):
+            records[dim] = self.objectives[:, j]
+        return records
+    
+    def __len__(self) -> int:
+        return len(self.agents)
+    
+    @property
+    def ids(self) -> List[str]:
+        return [a.agent_id for a in self.agents]
+    
+    @property
+    def has_unique_ids(self) -> bool:
+        return len(np.unique(self.id_codes)) == len(self.id_codes)
+    
+    @property
+    def accuracy(self) -> np.ndarray:
+        return self.objectives[:, IDX_ACCURACY]
+    
+    @property
+    def energy(self) -> np.ndarray:
+        return self.objectives[:, IDX_ENERGY]
+    
+    @property
+    def memory(self) -> np.ndarray:
+        return self.objectives[:, IDX_MEMORY]
+    
+    @property
+    def depth(self) -> np.ndarray:
+        return self.objectives[:, IDX_DEPTH]
+    
+    @property
+    def variance(self) -> np.ndarray:
+        return self.objectives[:, IDX_VARIANCE]
+    
+    def select(self, index: np.ndarray) -> 'AgentBatch':
+        """Sub-batch for a boolean mask or integer index array"""
+        index = np.flatnonzero(index) if index.dtype == bool else index
+        return AgentBatch(
+            tuple(self.agents[i] for i in index),
+            self.objectives[index],
+            self.id_codes[index]
+        )
+    
+    def minimized(self, dimensions: Sequence[str]) -> np.ndarray:
+        """(N, len(dimensions)) matrix with accuracy negated so every column is minimized"""
+        A = self.objectives[:, [EXTENDED_DIMENSIONS.index(dim) for dim in dimensions]]
+        for j, dim in enumerate(dimensions):
+            if dim == 'accuracy':
+                A[:, j] = -A[:, j]
+        return A
+
+
+AgentsLike = Union[List[ExtendedParetoPoint], AgentBatch, np.ndarray]
+
+
 class ExtendedParetoAnalyzer:
     """
     Extended Pareto frontier analysis with 7 dimensions
@@ -182,44 +332,85 @@ class ExtendedParetoAnalyzer:
             'accuracy', 'energy_kwh', 'carbon_co2e_kg', 'latency_ms',
             'memory_mb', 'circuit_depth', 'variance_score'
         ]
+        self._frontier_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
         logger.info(f"Initialized ExtendedParetoAnalyzer with {len(self.dimensions)}D")
     
-    def compute_frontier(self, agents: List[ExtendedParetoPoint]) -> List[ExtendedParetoPoint]:
+    def prepare(self, agents: AgentsLike) -> AgentBatch:
+        """
+        Materialize agents once for reuse across several analyses
+        
+        Accepts a list of ExtendedParetoPoint, a structured array with dtype
+        DTYPE, or an existing AgentBatch (returned as is).
+        
+        Example:
+            batch = analyzer.prepare(agents)
+            frontier = analyzer.compute_frontier(batch)
+            memory = analyzer.analyze_memory_constraint(batch, 512)
+        """
+        if isinstance(agents, AgentBatch):
+            return agents
+        if isinstance(agents, np.ndarray):
+            return AgentBatch.from_records(agents)
+        return AgentBatch.from_agents(agents)
+    
+    def compute_frontier(self, agents: AgentsLike) -> List[ExtendedParetoPoint]:
         """
         Compute 7D Pareto frontier
         
-        Returns agents that are non-dominated in extended space.
+        Returns agents that are non-dominated in extended space. Results
+        are memoized per analyzer on the compared dimensions and the
+        identity of the agent objects (points are immutable), so analyses
+        and projections that revisit the same agents skip the dominance check.
         
         Args:
-            agents: List of ExtendedParetoPoint objects
+            agents: List of ExtendedParetoPoint objects or an AgentBatch
         
         Returns:
             List of agents on the Pareto frontier
         """
-        if not agents:
+        if not len(agents):
             logger.warning("Empty agent list")
             return []
         
-        frontier = []
-        
-        for agent in agents:
-            is_dominated = False
-            
-            for other in agents:
-                if other.agent_id != agent.agent_id:
-                    if other.dominates(agent, self.dimensions):
-                        is_dominated = True
-                        logger.debug(f"{agent.agent_id} dominated by {other.agent_id}")
-                        break
-            
-            if not is_dominated:
-                frontier.append(agent)
+        batch = self.prepare(agents)
+        frontier_idx = self._frontier_indices(batch, self.dimensions)
+        frontier = [batch.agents[i] for i in frontier_idx]
         
         logger.info(f"7D frontier: {len(frontier)} / {len(agents)} agents")
         return frontier
     
+    def _frontier_indices(self, batch: AgentBatch, dimensions: Sequence[str]) -> np.ndarray:
+        """Indices into batch of its frontier over dimensions, memoized"""
+        key = self._cache_key(batch, dimensions)
+        cached = self._frontier_cache.get(key)
+        if cached is not None:
+            self._frontier_cache.move_to_end(key)
+            return cached[1]
+        
+        A = np.ascontiguousarray(batch.minimized(dimensions))
+        
+        if batch.has_unique_ids and not np.isnan(A).any():
+            # Dominance is transitive here, so a sweep that only checks the
+            # running frontier is exact
+            frontier_idx = skyline_2d(A) if A.shape[1] == 2 else nondominated_scan(A)
+        else:
+            # Agents sharing an agent_id never dominate each other
+            dominated = dominated_mask(A, batch.id_codes.astype(np.int64))
+            frontier_idx = np.flatnonzero(~dominated)
+        
+        # The cached agents tuple keeps the keyed ids from being reused
+        self._frontier_cache[key] = (batch.agents, frontier_idx)
+        if len(self._frontier_cache) > FRONTIER_CACHE_SIZE:
+            self._frontier_cache.popitem(last=False)
+        return frontier_idx
+    
+    @staticmethod
+    def _cache_key(batch: AgentBatch, dimensions: Sequence[str]) -> tuple:
+        """Frontier cache key: compared dimensions plus agent object identities"""
+        return tuple(dimensions), tuple(map(id, batch.agents))
+    
     def project_2d(self,
-                   agents: List[ExtendedParetoPoint],
+                   agents: AgentsLike,
                    x_dim: str,
                    y_dim: str) -> Tuple[List[ExtendedParetoPoint], List[ExtendedParetoPoint]]:
         """
@@ -230,7 +421,7 @@ class ExtendedParetoAnalyzer:
         and vice versa.
         
         Args:
-            agents: List of agents (can be 7D frontier or all agents)
+            agents: List of agents or AgentBatch (7D frontier or all agents)
             x_dim: X-axis dimension
             y_dim: Y-axis dimension
         
@@ -244,15 +435,14 @@ class ExtendedParetoAnalyzer:
                 agents, 'carbon_co2e_kg', 'accuracy'
             )
         """
-        # Create temporary 2D analyzer
-        temp_analyzer = ExtendedParetoAnalyzer(dimensions=[x_dim, y_dim])
+        batch = self.prepare(agents)
         
-        # Compute 2D frontier
-        frontier_2d = temp_analyzer.compute_frontier(agents)
+        # Compute 2D frontier (sort-and-sweep skyline, cached with the 7D ones)
+        frontier_2d = [batch.agents[i] for i in self._frontier_indices(batch, (x_dim, y_dim))]
         
         # Find dominated agents in this projection
         frontier_ids = {a.agent_id for a in frontier_2d}
-        dominated = [a for a in agents if a.agent_id not in frontier_ids]
+        dominated = [a for a in batch.agents if a.agent_id not in frontier_ids]
         
         logger.info(f"2D projection ({x_dim} vs {y_dim}): "
                    f"{len(frontier_2d)} frontier, {len(dominated)} dominated")
@@ -260,7 +450,7 @@ class ExtendedParetoAnalyzer:
         return frontier_2d, dominated
     
     def analyze_memory_constraint(self,
-                                  agents: List[ExtendedParetoPoint],
+                                  agents: AgentsLike,
                                   max_memory_mb: float) -> Dict:
         """
         Analyze agents under memory constraint
@@ -268,7 +458,7 @@ class ExtendedParetoAnalyzer:
         Critical for edge deployment where memory is hard limit.
         
         Args:
-            agents: List of agents
+            agents: List of agents or AgentBatch
             max_memory_mb: Maximum allowed memory (e.g., 512 MB for edge)
         
         Returns:
@@ -280,17 +470,20 @@ class ExtendedParetoAnalyzer:
                 'memory_efficiency': Dict[agent_id -> accuracy/MB]
             }
         """
-        feasible = [a for a in agents if a.memory_mb <= max_memory_mb]
-        infeasible = [a for a in agents if a.memory_mb > max_memory_mb]
+        batch = self.prepare(agents)
+        memory = batch.memory
+        fits = memory <= max_memory_mb
+        feasible_idx = np.flatnonzero(fits)
+        feasible = [batch.agents[i] for i in feasible_idx]
+        infeasible = [batch.agents[i] for i in np.flatnonzero(~fits)]
         
-        # Compute frontier of feasible agents
-        frontier_feasible = self.compute_frontier(feasible) if feasible else []
+        # Compute frontier of feasible agents (memoized per agent set)
+        frontier_feasible = self.compute_frontier(batch.select(feasible_idx)) if feasible else []
         
         # Memory efficiency: accuracy per MB
-        memory_efficiency = {
-            a.agent_id: a.accuracy / a.memory_mb if a.memory_mb > 0 else 0.0
-            for a in agents
-        }
+        efficiency = np.divide(batch.accuracy, memory,
+                               out=np.zeros(len(batch)), where=memory > 0)
+        memory_efficiency = dict(zip(batch.ids, efficiency.tolist()))
         
         logger.info(f"Memory constraint {max_memory_mb} MB: "
                    f"{len(feasible)} feasible, {len(infeasible)} infeasible")
@@ -303,19 +496,20 @@ class ExtendedParetoAnalyzer:
             'infeasible': infeasible,
             'frontier_feasible': frontier_feasible,
             'memory_efficiency': memory_efficiency,
-            'best_memory_efficient': max(memory_efficiency.items(), 
-                                        key=lambda x: x[1])[0] if memory_efficiency else None
+            # Over the dict so a repeated agent_id counts with its last entry
+            'best_memory_efficient': max(memory_efficiency, key=memory_efficiency.get)
+                                     if memory_efficiency else None
         }
     
     def analyze_circuit_depth_scalability(self,
-                                         agents: List[ExtendedParetoPoint]) -> Dict:
+                                         agents: AgentsLike) -> Dict:
         """
         Analyze quantum circuit depth implications
         
         Predicts scalability and stability on real quantum hardware.
         
         Args:
-            agents: List of agents
+            agents: List of agents or AgentBatch
         
         Returns:
             Dict with depth analysis:
@@ -324,58 +518,67 @@ class ExtendedParetoAnalyzer:
                 'accuracy_vs_depth': correlation,
                 'energy_vs_depth': correlation,
                 'shallow_circuit_agents': agents with depth < threshold,
-                'fragility_score': depth normalized by accuracy
+                'fragility_score': depth normalized by accuracy,
+                'fragility_order': agent_ids, least fragile first
             }
         """
-        # Filter quantum/hybrid agents (circuit_depth > 0)
-        quantum_agents = [a for a in agents if a.circuit_depth > 0]
+        # Filter quantum/hybrid agents (circuit_depth > 0) with one mask over
+        # the batch columns
+        batch = self.prepare(agents)
+        quantum = batch.depth > 0
+        n_quantum = int(np.count_nonzero(quantum))
         
-        if not quantum_agents:
+        if not n_quantum:
             logger.warning("No quantum agents found (circuit_depth=0)")
-            return {'quantum_agents': 0}
+            return {'quantum_agents': 0, 'quantum_agents_count': 0}
         
-        depths = [a.circuit_depth for a in quantum_agents]
-        accuracies = [a.accuracy for a in quantum_agents]
-        energies = [a.energy_kwh for a in quantum_agents]
+        ids = [batch.agents[i].agent_id for i in np.flatnonzero(quantum)]
+        depths = batch.depth[quantum]
+        accuracies = batch.accuracy[quantum]
+        energies = batch.energy[quantum]
         
-        # Correlations
-        acc_depth_corr = np.corrcoef(depths, accuracies)[0, 1] if len(depths) > 1 else 0
-        energy_depth_corr = np.corrcoef(depths, energies)[0, 1] if len(depths) > 1 else 0
+        # Correlations: a single corrcoef over (depth, accuracy, energy) rows
+        if n_quantum > 1:
+            corr = np.corrcoef(np.stack([depths, accuracies, energies]))
+            acc_depth_corr, energy_depth_corr = corr[0, 1], corr[0, 2]
+        else:
+            acc_depth_corr = energy_depth_corr = 0
         
         # Fragility score: depth / accuracy (higher = more fragile)
-        fragility_scores = {
-            a.agent_id: a.circuit_depth / a.accuracy if a.accuracy > 0 else float('inf')
-            for a in quantum_agents
-        }
+        fragility = np.divide(depths, accuracies,
+                              out=np.full(n_quantum, np.inf), where=accuracies > 0)
+        fragility_scores = dict(zip(ids, fragility.tolist()))
+        fragility_order = [ids[i] for i in np.argsort(fragility, kind='stable')]
         
         # Find shallow circuits (depth < median)
         median_depth = np.median(depths)
-        shallow_agents = [a for a in quantum_agents if a.circuit_depth < median_depth]
+        shallow_agents = [ids[i] for i in np.flatnonzero(depths < median_depth)]
         
-        logger.info(f"Circuit depth analysis: {len(quantum_agents)} quantum agents, "
+        logger.info(f"Circuit depth analysis: {n_quantum} quantum agents, "
                    f"median depth={median_depth:.0f}")
         
         return {
-            'quantum_agents_count': len(quantum_agents),
+            'quantum_agents_count': n_quantum,
             'depth_stats': {
-                'mean': np.mean(depths),
+                'mean': depths.mean(),
                 'median': median_depth,
-                'min': np.min(depths),
-                'max': np.max(depths),
-                'std': np.std(depths)
+                'min': depths.min(),
+                'max': depths.max(),
+                'std': depths.std()
             },
             'correlations': {
                 'accuracy_vs_depth': acc_depth_corr,
                 'energy_vs_depth': energy_depth_corr
             },
-            'shallow_circuit_agents': [a.agent_id for a in shallow_agents],
+            'shallow_circuit_agents': shallow_agents,
             'fragility_scores': fragility_scores,
-            'most_fragile': max(fragility_scores.items(), key=lambda x: x[1])[0],
-            'most_robust': min(fragility_scores.items(), key=lambda x: x[1])[0]
+            'fragility_order': fragility_order,
+            'most_fragile': ids[int(np.argmax(fragility))],
+            'most_robust': fragility_order[0]
         }
     
     def analyze_variance_stability(self,
-                                   agents: List[ExtendedParetoPoint],
+                                   agents: AgentsLike,
                                    stability_threshold: float = 0.2) -> Dict:
         """
         Analyze inference variance and stability
@@ -387,7 +590,7 @@ class ExtendedParetoAnalyzer:
         - Poor schedulability
         
         Args:
-            agents: List of agents
+            agents: List of agents or AgentBatch
             stability_threshold: Max acceptable variance score
         
         Returns:
@@ -399,19 +602,20 @@ class ExtendedParetoAnalyzer:
                 'stability_ranking': agents sorted by stability
             }
         """
-        stable = [a for a in agents if a.variance_score < stability_threshold]
-        unstable = [a for a in agents if a.variance_score >= stability_threshold]
+        batch = self.prepare(agents)
+        variance = batch.variance
+        is_stable = variance < stability_threshold
+        stable = list(batch.select(is_stable).agents)
+        unstable = list(batch.select(~is_stable).agents)
         
         # Variance cost: how much worse are actual P95 metrics vs mean?
         # Approximation: mean + 2*std = ~P95
-        variance_cost = {}
-        for agent in agents:
-            # Estimate P95 energy (assuming variance_score ~ coefficient of variation)
-            p95_energy_estimate = agent.energy_kwh * (1 + 2 * agent.variance_score)
-            variance_cost[agent.agent_id] = p95_energy_estimate - agent.energy_kwh
+        # Estimate P95 energy (assuming variance_score ~ coefficient of variation)
+        p95_energy_estimate = batch.energy * (1 + 2 * variance)
+        variance_cost = dict(zip(batch.ids, (p95_energy_estimate - batch.energy).tolist()))
         
         # Stability ranking (lower variance = higher rank)
-        stability_ranking = sorted(agents, key=lambda a: a.variance_score)
+        stability_ranking = batch.select(np.argsort(variance, kind='stable')).agents
         
         logger.info(f"Variance analysis: {len(stable)} stable, {len(unstable)} unstable "
                    f"(threshold={stability_threshold})")
@@ -426,17 +630,17 @@ class ExtendedParetoAnalyzer:
             'stability_ranking': [a.agent_id for a in stability_ranking],
             'most_stable': stability_ranking[0].agent_id if stability_ranking else None,
             'least_stable': stability_ranking[-1].agent_id if stability_ranking else None,
-            'mean_variance': np.mean([a.variance_score for a in agents])
+            'mean_variance': np.mean(variance)
         }
     
     def comprehensive_analysis(self,
-                              agents: List[ExtendedParetoPoint],
+                              agents: AgentsLike,
                               constraints: Optional[Dict] = None) -> Dict:
         """
         Comprehensive 7D analysis with all extended dimensions
         
         Args:
-            agents: List of agents
+            agents: List of agents or AgentBatch
             constraints: Optional constraints:
                 {
                     'max_memory_mb': 512,
@@ -450,6 +654,8 @@ class ExtendedParetoAnalyzer:
         if constraints is None:
             constraints = {}
         
+        agents = self.prepare(agents)
+        
         # 7D Pareto frontier
         frontier_7d = self.compute_frontier(agents)
         
@@ -468,23 +674,20 @@ class ExtendedParetoAnalyzer:
             constraints.get('max_variance', 0.2)
         )
         
-        # Find agents that satisfy ALL constraints
-        fully_compliant = []
-        for agent in agents:
-            compliant = True
-            
-            if agent.memory_mb > constraints.get('max_memory_mb', float('inf')):
-                compliant = False
-            if agent.circuit_depth > constraints.get('max_circuit_depth', float('inf')):
-                compliant = False
-            if agent.variance_score > constraints.get('max_variance', float('inf')):
-                compliant = False
-            
-            if compliant:
-                fully_compliant.append(agent)
+        # Find agents that satisfy ALL constraints: one broadcast compare of
+        # the constrained columns against their limits, ANDed across columns
+        active = [key for key in CONSTRAINT_COLUMNS if key in constraints]
+        if active:
+            columns = [CONSTRAINT_COLUMNS[key] for key in active]
+            limits = np.array([constraints[key] for key in active], dtype=np.float64)
+            compliant = (agents.objectives[:, columns] <= limits).all(axis=1)
+        else:
+            compliant = np.ones(len(agents), dtype=bool)
+        compliant_batch = agents.select(compliant)
+        fully_compliant = list(compliant_batch.agents)
         
         # Frontier of compliant agents
-        frontier_compliant = self.compute_frontier(fully_compliant) if fully_compliant else []
+        frontier_compliant = self.compute_frontier(compliant_batch) if fully_compliant else []
         
         return {
             'total_agents': len(agents),
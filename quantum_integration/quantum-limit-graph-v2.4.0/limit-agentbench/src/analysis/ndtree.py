@@ -0,0 +1,247 @@
+"""
+ND-Tree Pareto Archive
+
+Incrementally maintains the set of non-dominated points, following
+Jaszkiewicz & Lust, "ND-Tree-based update: a fast algorithm for the dynamic
+non-dominance problem" (IEEE TEVC, 2018).
+
+Every node keeps the ideal (component-wise min) and nadir (component-wise
+max) of the points below it. A new point is compared against a subtree
+only when those bounds cannot settle the outcome, so whole subtrees are
+rejected or skipped without touching their points.
+
+All objectives are minimized. Points that are equal on every objective do
+not dominate each other and are all kept.
+"""
+
+from typing import Any, List, Optional, Sequence, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+Vector = Tuple[float, ...]
+
+
+def _dominates(a: Sequence[float], b: Sequence[float]) -> bool:
+    """True if a is no worse than b everywhere and strictly better somewhere"""
+    strictly_better = False
+    for x, y in zip(a, b):
+        if x > y:
+            return False
+        if x < y:
+            strictly_better = True
+    return strictly_better
+
+
+def _weakly_dominates(a: Sequence[float], b: Sequence[float]) -> bool:
+    """True if a is no worse than b on every objective"""
+    return all(x <= y for x, y in zip(a, b))
+
+
+def _squared_distance(a: Sequence[float], b: Sequence[float]) -> float:
+    return sum((x - y) ** 2 for x, y in zip(a, b))
+
+
+class _Node:
+    """ND-tree node: a leaf holding points or an internal node with children"""
+
+    __slots__ = ('points', 'children', 'ideal', 'nadir')
+
+    def __init__(self, points: Optional[List[Tuple[Vector, Any]]] = None):
+        self.points: List[Tuple[Vector, Any]] = points or []
+        self.children: List['_Node'] = []
+        self.ideal: Optional[List[float]] = None
+        self.nadir: Optional[List[float]] = None
+        for vector, _ in self.points:
+            self._extend_bounds(vector)
+
+    @property
+    def is_leaf(self) -> bool:
+        return not self.children
+
+    def _extend_bounds(self, vector: Vector):
+        if self.ideal is None:
+            self.ideal = list(vector)
+            self.nadir = list(vector)
+            return
+        for k, value in enumerate(vector):
+            if value < self.ideal[k]:
+                self.ideal[k] = value
+            elif value > self.nadir[k]:
+                self.nadir[k] = value
+
+    def midpoint(self) -> List[float]:
+        return [(lo + hi) / 2 for lo, hi in zip(self.ideal, self.nadir)]
+
+
+class NDTree:
+    """
+    Pareto archive backed by an ND-tree
+
+    Example:
+        tree = NDTree()
+        tree.update((1.0, 5.0), 'a')   # True: archived
+        tree.update((2.0, 6.0), 'b')   # False: dominated by 'a'
+        tree.update((0.5, 4.0), 'c')   # True: archived, 'a' removed
+        tree.items()                   # [((0.5, 4.0), 'c')]
+    """
+
+    def __init__(self, max_leaf_size: int = 20, max_children: Optional[int] = None):
+        """
+        Initialize an empty archive
+
+        Args:
+            max_leaf_size: Points a leaf holds before it is split
+            max_children: Children per internal node (default: objectives + 1)
+        """
+        self.max_leaf_size = max(2, max_leaf_size)
+        self.max_children = max_children
+        self.root: Optional[_Node] = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def update(self, vector: Sequence[float], item: Any = None) -> bool:
+        """
+        Offer a point to the archive
+
+        Archived points dominated by the new point are removed. The new
+        point is archived unless an archived point dominates it.
+
+        Args:
+            vector: Objective values (all minimized)
+            item: Payload stored with the point
+
+        Returns:
+            True if the point was archived
+        """
+        vector = tuple(vector)
+
+        if self.root is None:
+            self.root = _Node([(vector, item)])
+            self._size = 1
+            return True
+
+        if not self._update_node(self.root, vector):
+            return False
+
+        if self.root.ideal is None:
+            # Every archived point was dominated and removed
+            self.root = _Node([(vector, item)])
+            self._size = 1
+            return True
+
+        self._insert(self.root, vector, item)
+        self._size += 1
+        return True
+
+    def items(self) -> List[Tuple[Vector, Any]]:
+        """All archived (vector, item) pairs"""
+        out: List[Tuple[Vector, Any]] = []
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            if node.is_leaf:
+                out.extend(node.points)
+            else:
+                stack.extend(node.children)
+        return out
+
+    def _update_node(self, node: _Node, vector: Vector) -> bool:
+        """
+        Remove points of node dominated by vector
+
+        Returns:
+            False if some point of node dominates vector
+        """
+        if _dominates(node.nadir, vector):
+            # Every point in the node dominates the new one
+            return False
+
+        if _dominates(vector, node.ideal):
+            # The new point dominates every point in the node
+            self._size -= self._count(node)
+            node.points = []
+            node.children = []
+            node.ideal = node.nadir = None
+            return True
+
+        if not (_weakly_dominates(node.ideal, vector) or _weakly_dominates(vector, node.nadir)):
+            # No point in the node can dominate or be dominated by vector
+            return True
+
+        if node.is_leaf:
+            kept = []
+            for point in node.points:
+                if _dominates(point[0], vector):
+                    return False
+                if not _dominates(vector, point[0]):
+                    kept.append(point)
+            self._size -= len(node.points) - len(kept)
+            node.points = kept
+            if not kept:
+                node.ideal = node.nadir = None
+            return True
+
+        for child in node.children:
+            if not self._update_node(child, vector):
+                return False
+        node.children = [child for child in node.children if child.ideal is not None]
+        if not node.children:
+            node.ideal = node.nadir = None
+        elif len(node.children) == 1:
+            # Collapse the chain so the tree stays shallow
+            only = node.children[0]
+            node.points, node.children = only.points, only.children
+        return True
+
+    def _insert(self, node: _Node, vector: Vector, item: Any):
+        """Insert a non-dominated point below node"""
+        while not node.is_leaf:
+            node._extend_bounds(vector)
+            node = min(
+                node.children,
+                key=lambda child: _squared_distance(child.midpoint(), vector)
+            )
+
+        node.points.append((vector, item))
+        node._extend_bounds(vector)
+        if len(node.points) > self.max_leaf_size:
+            self._split(node, len(vector))
+
+    def _split(self, node: _Node, dims: int):
+        """Split an overfull leaf into children seeded by far-apart points"""
+        points = node.points
+        n_children = self.max_children or dims + 1
+        n_children = max(2, min(n_children, len(points)))
+
+        # First seed: the point farthest on average from the others
+        seeds = [max(
+            range(len(points)),
+            key=lambda i: sum(_squared_distance(points[i][0], p[0]) for p in points)
+        )]
+        # Further seeds: farthest from the nearest existing seed
+        while len(seeds) < n_children:
+            seeds.append(max(
+                (i for i in range(len(points)) if i not in seeds),
+                key=lambda i: min(_squared_distance(points[i][0], points[s][0]) for s in seeds)
+            ))
+
+        children = [_Node([points[s]]) for s in seeds]
+        seed_set = set(seeds)
+        for i, point in enumerate(points):
+            if i in seed_set:
+                continue
+            nearest = min(children, key=lambda child: _squared_distance(child.midpoint(), point[0]))
+            nearest.points.append(point)
+            nearest._extend_bounds(point[0])
+
+        node.points = []
+        node.children = children
+
+    @staticmethod
+    def _count(node: _Node) -> int:
+        if node.is_leaf:
+            return len(node.points)
+        return sum(NDTree._count(child) for child in node.children)
@@ -4,26 +4,29 @@ Pareto frontier computation for multi-objective agent comparison.
 
 from typing import List, Dict, Iterable
 
+from .dominance_checker import pack_metrics, pareto_front_mask
+
 
 def dominates(a: Dict, b: Dict, objectives: Iterable[str]) -> bool:
     """
     True if a dominates b (>= all, > at least one).
+
+    accuracy is maximized and every other objective minimized; the
+    direction is decided with one string compare per objective and the
+    check stops at the first objective where a is worse.
     """
-    better_or_equal = True
     strictly_better = False
 
     for obj in objectives:
-        if a[obj] > b[obj] and obj != "accuracy":
-            better_or_equal = False
-        if a[obj] < b[obj] and obj != "accuracy":
-            strictly_better = True
+        x, y = a[obj], b[obj]
         if obj == "accuracy":
-            if a[obj] < b[obj]:
-                better_or_equal = False
-            if a[obj] > b[obj]:
-                strictly_better = True
+            x, y = y, x
+        if x > y:
+            return False
+        if x < y:
+            strictly_better = True
 
-    return better_or_equal and strictly_better
+    return strictly_better
 
 
 def pareto_front(
@@ -32,18 +35,14 @@ def pareto_front(
 ) -> List[Dict]:
     """
     Returns non-dominated results.
+
+    accuracy is maximized and every other objective minimized; all
+    results are compared at once on a packed metric matrix.
     """
-    front = []
-
-    for candidate in results:
-        dominated = False
-        for other in results:
-            if other is candidate:
-                continue
-            if dominates(other, candidate, objectives):
-                dominated = True
-                break
-        if not dominated:
-            front.append(candidate)
-
-    return front
+    M, sign, _ = pack_metrics(
+        results,
+        minimize=[obj for obj in objectives if obj != "accuracy"],
+        maximize=[obj for obj in objectives if obj == "accuracy"],
+    )
+    keep = pareto_front_mask(M, sign)
+    return [r for r, k in zip(results, keep) if k]
@@ -1,16 +1,284 @@
 # analytics/pareto_analyzer.py
 
-from dataclasses import dataclass, asdict
-from typing import List, Dict
+from dataclasses import dataclass, asdict, field
+from typing import List, Dict, Optional, Tuple, Union
 import json
 import logging
 import os
 
+import numpy as np
+
+from .ndtree import NDTree
+
 logger = logging.getLogger(__name__)
 
+# Objectives compared by ParetoPoint.dominates; accuracy is maximized,
+# the rest are minimized
+PARETO_OBJECTIVES = ('accuracy', 'energy_kwh', 'carbon_co2e_kg', 'latency_ms')
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ParetoPoint:
+    """
+    Agent performance across the core green objectives
+    
+    - accuracy: Task success rate [0, 1] (maximize)
+    - energy_kwh: Energy consumption in kWh (minimize)
+    - carbon_co2e_kg: Carbon emissions in kg CO₂e (minimize)
+    - latency_ms: Task latency in milliseconds (minimize)
+    
+    Points are immutable and slotted (no per-instance __dict__).
+    """
+    agent_id: str
+    accuracy: float
+    energy_kwh: float
+    carbon_co2e_kg: float
+    latency_ms: float
+    metadata: Dict = field(default_factory=dict)
+    
+    def __post_init__(self):
+        """Validate objectives"""
+        if not 0 <= self.accuracy <= 1:
+            logger.warning(f"Accuracy {self.accuracy} outside [0, 1] for {self.agent_id}")
+        
+        for metric in PARETO_OBJECTIVES[1:]:
+            value = getattr(self, metric)
+            if value < 0:
+                raise ValueError(f"{metric} cannot be negative: {value}")
+    
+    def objective_vector(self) -> Tuple[float, ...]:
+        """Objectives as a minimization vector (accuracy negated)"""
+        return (-self.accuracy, self.energy_kwh, self.carbon_co2e_kg, self.latency_ms)
+    
+    def dominates(self, other: 'ParetoPoint') -> bool:
+        """
+        Check if this point Pareto-dominates another
+        
+        True if this point is no worse on every objective and strictly
+        better on at least one.
+        """
+        better_on_at_least_one = False
+        for mine, theirs in zip(self.objective_vector(), other.objective_vector()):
+            if mine > theirs:
+                return False
+            if mine < theirs:
+                better_on_at_least_one = True
+        return better_on_at_least_one
+    
+    def to_dict(self) -> Dict:
+        """Serialize to dictionary"""
+        return {
+            'agent_id': self.agent_id,
+            'accuracy': self.accuracy,
+            'energy_kwh': self.energy_kwh,
+            'carbon_co2e_kg': self.carbon_co2e_kg,
+            'latency_ms': self.latency_ms,
+            'metadata': self.metadata
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ParetoPoint':
+        """Deserialize from dictionary"""
+        return cls(
+            agent_id=data['agent_id'],
+            accuracy=data['accuracy'],
+            energy_kwh=data['energy_kwh'],
+            carbon_co2e_kg=data['carbon_co2e_kg'],
+            latency_ms=data['latency_ms'],
+            metadata=data.get('metadata', {})
+        )
+
+
+class ParetoFrontierAnalyzer:
+    """
+    Pareto frontier analysis over accuracy, energy, carbon and latency
+    
+    Frontiers are maintained in an ND-tree archive (see analysis.ndtree):
+    each new point is checked only against subtrees whose bounding boxes
+    cannot settle dominance, instead of against every other agent.
+    """
+    
+    def __init__(self):
+        """Initialize analyzer with an empty streaming archive"""
+        self._archive = NDTree()
+        self._arrivals = 0
+    
+    def compute_frontier(
+        self,
+        agents: List[ParetoPoint],
+        return_knee: bool = False
+    ) -> Union[List[ParetoPoint], Tuple[List[ParetoPoint], Optional[ParetoPoint]]]:
+        """
+        Compute the Pareto frontier (non-dominated agents)
+        
+        Args:
+            agents: List of ParetoPoint objects
+            return_knee: Also return the knee point, computed from the
+                archived objective vectors without a second pass over agents
+        
+        Returns:
+            Agents on the frontier, in input order; with return_knee, a
+            (frontier, knee) tuple equal to get_knee_point(frontier)
+        """
+        if not agents:
+            return ([], None) if return_knee else []
+        
+        tree = NDTree()
+        for i, agent in enumerate(agents):
+            tree.update(agent.objective_vector(), (i, agent))
+        
+        archived = sorted(tree.items(), key=lambda x: x[1][0])
+        frontier = [agent for _, (_, agent) in archived]
+        
+        logger.info(f"Pareto frontier: {len(frontier)} / {len(agents)} agents")
+        if not return_knee:
+            return frontier
+        
+        knee = self._knee_index(np.array([vector for vector, _ in archived], dtype=np.float64))
+        return frontier, frontier[knee]
+    
+    def add_point(self, point: ParetoPoint) -> bool:
+        """
+        Add a point to the analyzer's streaming frontier
+        
+        Archived points the new point dominates are dropped.
+        
+        Args:
+            point: Newly evaluated agent
+        
+        Returns:
+            True if the point is on the frontier after insertion
+        """
+        self._arrivals += 1
+        return self._archive.update(point.objective_vector(), (self._arrivals, point))
+    
+    def get_frontier(self) -> List[ParetoPoint]:
+        """Current streaming frontier, in arrival order"""
+        return [point for _, (_, point) in sorted(self._archive.items(), key=lambda x: x[1][0])]
+    
+    def rank_by_dominance(self, agents: List[ParetoPoint]) -> Dict[int, List[ParetoPoint]]:
+        """
+        Rank agents by dominance layers
+        
+        Rank 0 is the Pareto frontier, rank 1 the frontier once rank 0 is
+        removed, and so on.
+        
+        Args:
+            agents: List of ParetoPoint objects
+        
+        Returns:
+            Dict mapping rank to the agents in that layer
+        """
+        if not agents:
+            return {}
+        
+        # One (N, N) comparison, then layers are peeled by masking rows and
+        # columns instead of recomputing the frontier of the remainder
+        dominates = self._dominance_matrix(agents)
+        remaining = np.ones(len(agents), dtype=bool)
+        ranks = {}
+        rank = 0
+        
+        while remaining.any():
+            idx = np.flatnonzero(remaining)
+            dominated = dominates[np.ix_(idx, idx)].any(axis=0)
+            layer = idx[~dominated]
+            ranks[rank] = [agents[i] for i in layer]
+            remaining[layer] = False
+            rank += 1
+        
+        return ranks
+    
+    @staticmethod
+    def _dominance_matrix(agents: List[ParetoPoint]) -> np.ndarray:
+        """
+        Pairwise dominance of agents
+        
+        Returns:
+            (N, N) bool array; [i, j] is True if agent i dominates agent j
+        """
+        A = np.array([agent.objective_vector() for agent in agents], dtype=np.float64)
+        others = A[:, None, :]
+        candidates = A[None, :, :]
+        no_worse = ~(others > candidates).any(axis=2)
+        better = (others < candidates).any(axis=2)
+        return no_worse & better
+    
+    def get_knee_point(self, frontier: List[ParetoPoint]) -> Optional[ParetoPoint]:
+        """
+        Find the knee point - the best overall compromise on the frontier
+        
+        Objectives are min-max normalized across the frontier; the knee is
+        the agent closest to the ideal point (best value on every objective).
+        
+        Args:
+            frontier: Pareto frontier
+        
+        Returns:
+            Knee point agent, or None for an empty frontier
+        """
+        if not frontier:
+            return None
+        if len(frontier) == 1:
+            return frontier[0]
+        
+        A = np.array([agent.objective_vector() for agent in frontier], dtype=np.float64)
+        return frontier[self._knee_index(A)]
+    
+    @staticmethod
+    def _knee_index(A: np.ndarray) -> int:
+        """Row of A closest to the ideal point after min-max normalization"""
+        lo = A.min(axis=0)
+        span = A.max(axis=0) - lo
+        span[span == 0] = 1.0
+        distances = np.linalg.norm((A - lo) / span, axis=1)
+        return int(np.argmin(distances))
+    
+    def compare_agents(self, agent_a: ParetoPoint, agent_b: ParetoPoint) -> Dict:
+        """
+        Compare two agents and explain their relationship
+        
+        Returns:
+            Dict with 'relationship' ('dominates', 'dominated_by' or
+            'non_comparable'), 'explanation' and, for non-comparable agents,
+            'trade_offs'
+        """
+        if agent_a.dominates(agent_b):
+            return {
+                'relationship': 'dominates',
+                'explanation': f"{agent_a.agent_id} is at least as good as "
+                               f"{agent_b.agent_id} on every objective and better on at least one"
+            }
+        if agent_b.dominates(agent_a):
+            return {
+                'relationship': 'dominated_by',
+                'explanation': f"{agent_b.agent_id} is at least as good as "
+                               f"{agent_a.agent_id} on every objective and better on at least one"
+            }
+        
+        a_better_on = []
+        b_better_on = []
+        for metric, mine, theirs in zip(PARETO_OBJECTIVES,
+                                        agent_a.objective_vector(),
+                                        agent_b.objective_vector()):
+            if mine < theirs:
+                a_better_on.append(metric)
+            elif theirs < mine:
+                b_better_on.append(metric)
+        
+        return {
+            'relationship': 'non_comparable',
+            'explanation': f"Neither agent dominates: the choice between "
+                           f"{agent_a.agent_id} and {agent_b.agent_id} is a trade-off",
+            'trade_offs': {
+                'a_better_on': a_better_on,
+                'b_better_on': b_better_on
+            }
+        }
+
+
+@dataclass
+class ParetoRecord:
     energy_joules: float
     accuracy: float
     carbon_grams: float
@@ -28,7 +296,7 @@ class ParetoAnalyzer:
     """
 
     def __init__(self):
-        self.points: List[ParetoPoint] = []
+        self.points: List[ParetoRecord] = []
 
     def add_record(
         self,
@@ -41,7 +309,7 @@ class ParetoAnalyzer:
         if metadata is None:
             metadata = {}
 
-        point = ParetoPoint(
+        point = ParetoRecord(
             energy_joules=energy_joules,
             accuracy=accuracy,
             carbon_grams=carbon_grams,
@@ -52,7 +320,7 @@ class ParetoAnalyzer:
         self.points.append(point)
         logger.info(f"Added Pareto record: {label}")
 
-    def compute_frontier(self) -> List[ParetoPoint]:
+    def compute_frontier(self) -> List[ParetoRecord]:
         """
         Pareto-optimal points:
         Lower energy + Higher accuracy
@@ -1,5 +1,14 @@
 # src/constraints/budget_enforcer.py
 
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from .budget_manager import Budget, BudgetManager
+
+# Budget metrics that accumulate across executions (latency is per-task)
+CUMULATIVE_METRICS = ('energy_wh', 'carbon_g', 'cost_usd')
+
+
 class BudgetExceeded(Exception):
     pass
 
@@ -7,18 +16,35 @@ class BudgetExceeded(Exception):
 class BudgetEnforcer:
     """
     Enforces execution budgets during benchmarking.
+
+    execute_with_budget() is async-safe: at most max_concurrent agent calls
+    run at once, and every read or write of the shared budget accounting
+    happens under a single asyncio.Lock. An execution reserves its estimated
+    consumption before the agent runs, so concurrent tasks see each other's
+    in-flight spend and cannot jointly overrun the budget; the reservation
+    is replaced by the actual consumption once the agent returns or raises.
+    The enforcer is not thread-safe; share it between tasks of one event
+    loop only.
     """
 
     def __init__(
         self,
+        budget: Optional[Budget] = None,
         max_energy=None,
         max_carbon=None,
         max_latency=None,
+        max_concurrent: int = 16,
     ):
         self.max_energy = max_energy
         self.max_carbon = max_carbon
         self.max_latency = max_latency
 
+        self.manager = BudgetManager(budget) if budget is not None else None
+        self.max_concurrent = max_concurrent
+        self.reserved = {metric: 0.0 for metric in CUMULATIVE_METRICS}
+        self._sem = asyncio.Semaphore(max_concurrent)
+        self._lock = asyncio.Lock()
+
     def check(self, metrics: dict) -> None:
         if self.max_energy is not None and metrics["energy"] > self.max_energy:
             raise BudgetExceeded("Energy budget exceeded")
@@ -28,3 +54,94 @@ class BudgetEnforcer:
 
         if self.max_latency is not None and metrics["latency"] > self.max_latency:
             raise BudgetExceeded("Latency budget exceeded")
+
+    async def execute_with_budget(
+        self,
+        agent_fn: Callable[[Any], Awaitable[Dict]],
+        task: Any,
+        estimated_consumption: Dict[str, float]
+    ) -> Dict:
+        """
+        Run an agent on a task if its estimated consumption fits the budget.
+
+        Args:
+            agent_fn: Async agent callable; its result may carry a 'metrics'
+                dict with energy_kwh, carbon_kg and latency_ms
+            task: Task passed to agent_fn
+            estimated_consumption: Estimated energy_wh, carbon_g, latency_ms
+                (and optionally cost_usd)
+
+        Returns:
+            Dict with success, violations and, when executed, result,
+            actual_consumption and remaining_budget
+        """
+        if self.manager is None:
+            raise ValueError("execute_with_budget requires a Budget")
+
+        async with self._sem:
+            async with self._lock:
+                can_execute, violations = self._reserve(estimated_consumption)
+            if not can_execute:
+                return {
+                    'success': False,
+                    'budget_violated': True,
+                    'violations': violations,
+                    'remaining_budget': self.manager.get_remaining_budget()
+                }
+
+            actual = None
+            try:
+                result = await agent_fn(task)
+                actual = self._actual_consumption(result, estimated_consumption)
+            finally:
+                async with self._lock:
+                    self._settle(estimated_consumption, actual)
+                    remaining = self.manager.get_remaining_budget()
+
+        return {
+            'success': True,
+            'budget_violated': False,
+            'violations': [],
+            'result': result,
+            'actual_consumption': actual,
+            'remaining_budget': remaining
+        }
+
+    def get_budget_report(self) -> Dict:
+        """Get the budget summary, including consumption still in flight"""
+        if self.manager is None:
+            raise ValueError("No Budget configured")
+        report = self.manager.get_summary()
+        report['reserved'] = dict(self.reserved)
+        return report
+
+    def _reserve(self, estimated: Dict[str, float]):
+        """Check estimate plus in-flight reservations; reserve on success (lock held)"""
+        pending = dict(estimated)
+        for metric in CUMULATIVE_METRICS:
+            pending[metric] = pending.get(metric, 0.0) + self.reserved[metric]
+        can_execute, violations = self.manager.can_execute(pending)
+        if can_execute:
+            for metric in CUMULATIVE_METRICS:
+                self.reserved[metric] += estimated.get(metric, 0.0)
+        return can_execute, violations
+
+    def _settle(self, estimated: Dict[str, float], actual: Optional[Dict[str, float]]):
+        """Release a reservation and record actual consumption (lock held)"""
+        for metric in CUMULATIVE_METRICS:
+            self.reserved[metric] -= estimated.get(metric, 0.0)
+        # A failed agent call is charged its estimate
+        self.manager.record_consumption(actual if actual is not None else estimated)
+
+    @staticmethod
+    def _actual_consumption(result: Any, estimated: Dict[str, float]) -> Dict[str, float]:
+        """Convert agent-reported metrics to budget units, defaulting to the estimate"""
+        metrics = result.get('metrics', {}) if isinstance(result, dict) else {}
+        actual = dict(estimated)
+        if 'energy_kwh' in metrics:
+            actual['energy_wh'] = metrics['energy_kwh'] * 1000
+        if 'carbon_kg' in metrics:
+            actual['carbon_g'] = metrics['carbon_kg'] * 1000
+        if 'latency_ms' in metrics:
+            actual['latency_ms'] = metrics['latency_ms']
+        return actual
@@ -9,6 +9,7 @@ from typing import Dict, Optional, List, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
+import numpy as np
 import logging
 
 logger = logging.getLogger(__name__)
@@ -383,3 +384,54 @@ class BudgetManager:
             'execution_count': len(self.execution_history),
             'violation_count': len(self.violation_history)
         }
+    
+    @staticmethod
+    def compliance_mask(results: List[Dict], budget: Budget) -> np.ndarray:
+        """
+        Check which results fit within a budget
+        
+        Builds energy, carbon and latency columns once and compares each
+        against its limit as a whole array, instead of checking results
+        one by one. Cost is checked too when the budget sets a cost limit.
+        
+        Args:
+            results: Result dicts with 'energy_kwh', 'carbon_kg',
+                     'latency_ms' and optionally 'cost_usd'
+            budget: Budget to check against
+        
+        Returns:
+            Boolean array, True where the result is within budget
+        """
+        n = len(results)
+        energy_wh = np.fromiter((r.get('energy_kwh', 0.0) for r in results),
+                                dtype=np.float64, count=n) * 1000
+        carbon_g = np.fromiter((r.get('carbon_kg', 0.0) for r in results),
+                               dtype=np.float64, count=n) * 1000
+        latency_ms = np.fromiter((r.get('latency_ms', 0.0) for r in results),
+                                 dtype=np.float64, count=n)
+        
+        mask = ((energy_wh <= budget.max_energy_wh) &
+                (carbon_g <= budget.max_carbon_g) &
+                (latency_ms <= budget.max_latency_ms))
+        
+        if budget.max_cost_usd is not None:
+            cost_usd = np.fromiter((r.get('cost_usd', 0.0) for r in results),
+                                   dtype=np.float64, count=n)
+            mask &= cost_usd <= budget.max_cost_usd
+        
+        return mask
+    
+    @staticmethod
+    def filter_compliant(results: List[Dict], budget: Budget) -> List[Dict]:
+        """
+        Keep only the results that fit within a budget
+        
+        Args:
+            results: Result dicts (see compliance_mask)
+            budget: Budget to check against
+        
+        Returns:
+            Compliant results, in input order
+        """
+        mask = BudgetManager.compliance_mask(results, budget)
+        return [results[i] for i in np.nonzero(mask)[0]]
@@ -5,6 +5,7 @@ Calculates efficiency metrics normalized by task complexity to enable
 fair comparison across tasks of different difficulties.
 """
 
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple
 import numpy as np
 import logging
@@ -18,6 +19,9 @@ from analysis.complexity_analyzer import ComplexityAnalyzer, TaskComplexity
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of distinct traces whose complexity analysis is memoized
+COMPLEXITY_CACHE_SIZE = 4096
+
 
 class NormalizedEfficiencyCalculator:
     """
@@ -37,6 +41,7 @@ class NormalizedEfficiencyCalculator:
     def __init__(self):
         """Initialize efficiency calculator"""
         self.complexity_analyzer = ComplexityAnalyzer()
+        self._complexity_cache: "OrderedDict[tuple, Tuple[TaskComplexity, float, str]]" = OrderedDict()
         logger.info("Initialized NormalizedEfficiencyCalculator")
     
     def calculate_energy_efficiency(self, 
@@ -212,7 +217,8 @@ class NormalizedEfficiencyCalculator:
                                       carbon_kg: float,
                                       latency_ms: float,
                                       trace: Dict,
-                                      weights: Optional[Dict[str, float]] = None) -> float:
+                                      weights: Optional[Dict[str, float]] = None,
+                                      complexity: Optional[TaskComplexity] = None) -> float:
         """
         Calculate composite efficiency score
         
@@ -226,6 +232,7 @@ class NormalizedEfficiencyCalculator:
             latency_ms: Task latency
             trace: Execution trace
             weights: Custom weights for each component
+            complexity: Pre-computed TaskComplexity (optional)
         
         Returns:
             Composite efficiency score (higher = better)
@@ -245,7 +252,8 @@ class NormalizedEfficiencyCalculator:
             }
         
         # Compute complexity
-        complexity = self.complexity_analyzer.analyze_from_trace(trace)
+        if complexity is None:
+            complexity = self.complexity_analyzer.analyze_from_trace(trace)
         
         # Calculate individual efficiencies
         acc_per_watt = self.calculate_accuracy_per_watt(accuracy, energy_kwh)
@@ -310,10 +318,9 @@ class NormalizedEfficiencyCalculator:
         rankings = []
         
         for result in results:
-            # Extract task complexity
-            complexity = self.complexity_analyzer.analyze_from_trace(result['trace'])
-            complexity_score = complexity.compute_composite_score()
-            complexity_tier = self.complexity_analyzer.categorize_complexity(complexity)
+            # Extract task complexity (memoized across identical traces)
+            complexity, complexity_score, complexity_tier = \
+                self._complexity_features(result['trace'])
             
             # Calculate normalized efficiencies
             energy_eff = self.calculate_energy_efficiency(
@@ -343,7 +350,8 @@ class NormalizedEfficiencyCalculator:
                 result['energy_kwh'],
                 result['carbon_kg'],
                 result['latency_ms'],
-                result['trace']
+                result['trace'],
+                complexity=complexity
             )
             
             rankings.append({
@@ -397,6 +405,57 @@ class NormalizedEfficiencyCalculator:
             'complexity_distribution': complexity_distribution
         }
     
+    def _complexity_features(self, trace: Dict) -> Tuple[TaskComplexity, float, str]:
+        """
+        Analyze trace complexity, reusing results for identical traces
+        
+        Many results share a trace shape (same prompt, step and tool
+        counts), so the analysis, composite score and tier are cached on
+        the trace fields ComplexityAnalyzer reads. The returned
+        TaskComplexity is shared and must not be mutated.
+        
+        Args:
+            trace: Execution trace
+        
+        Returns:
+            Tuple of (TaskComplexity, composite score, complexity tier)
+        """
+        key = self._trace_key(trace)
+        cached = self._complexity_cache.get(key)
+        if cached is not None:
+            self._complexity_cache.move_to_end(key)
+            return cached
+        
+        complexity = self.complexity_analyzer.analyze_from_trace(trace)
+        features = (
+            complexity,
+            complexity.compute_composite_score(),
+            self.complexity_analyzer.categorize_complexity(complexity)
+        )
+        
+        self._complexity_cache[key] = features
+        if len(self._complexity_cache) > COMPLEXITY_CACHE_SIZE:
+            self._complexity_cache.popitem(last=False)
+        
+        return features
+    
+    @staticmethod
+    def _trace_key(trace: Dict) -> tuple:
+        """Hashable key over every trace field complexity analysis reads"""
+        prompt = trace.get('prompt', '')
+        reasoning = trace.get('reasoning', [])
+        tool_calls = trace.get('tool_calls', [])
+        
+        return (
+            prompt if isinstance(prompt, str) else '',
+            len(reasoning) if isinstance(reasoning, list) else
+            reasoning if isinstance(reasoning, str) else 0,
+            len(tool_calls) if isinstance(tool_calls, list) else 0,
+            trace.get('execution_time_ms', 0.0),
+            trace.get('latency_ms', 0.0),
+            trace.get('context_tokens', 0)
+        )
+    
     def benchmark_efficiency_baseline(self,
                                      results: List[Dict]) -> Dict:
         """
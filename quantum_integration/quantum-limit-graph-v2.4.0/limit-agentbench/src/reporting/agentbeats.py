@@ -5,6 +5,12 @@ AgentBeats-compatible reporting utilities.
 from typing import List, Dict
 import json
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 def build_agentbeats_submission(
     image: str,
@@ -16,7 +22,14 @@ def build_agentbeats_submission(
         "queries": queries,
     }
 
-    with open(output_path, "w") as f:
-        json.dump(submission, f, indent=2)
+    if ORJSON_AVAILABLE:
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(
+                submission,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            ))
+    else:
+        with open(output_path, "w") as f:
+            json.dump(submission, f, indent=2)
 
     return output_path
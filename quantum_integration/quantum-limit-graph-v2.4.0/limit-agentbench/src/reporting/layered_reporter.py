@@ -12,6 +12,12 @@ from dataclasses import dataclass
 import numpy as np
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import from analysis module
 import sys
 from pathlib import Path
@@ -420,11 +426,18 @@ class LayeredReporter:
             filepath: Output file path
             format: 'json' or 'csv'
         """
-        import json
-        
         if format == 'json':
-            with open(filepath, 'w') as f:
-                json.dump(report, f, indent=2)
+            if ORJSON_AVAILABLE:
+                # Serializes numpy scalars/arrays from the summaries natively
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(
+                        report,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                    ))
+            else:
+                import json
+                with open(filepath, 'w') as f:
+                    json.dump(report, f, indent=2)
             logger.info(f"Exported report to {filepath}")
         
         elif format == 'csv':
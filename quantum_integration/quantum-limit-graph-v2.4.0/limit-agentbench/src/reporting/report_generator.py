@@ -8,6 +8,7 @@ Generates formatted reports for different audiences:
 """
 
 from typing import Dict, Optional
+import io
 import logging
 
 from .layered_reporter import LayeredReporter
@@ -45,7 +46,8 @@ class ReportGenerator:
         total = full_report['total_agents']
         top_agent = full_report['summary']['top_agent']
         
-        summary = f"""
+        buf = io.StringIO()
+        buf.write(f"""
 {'='*70}
 EXECUTIVE SUMMARY - {scenario.upper()} SCENARIO
 {'='*70}
@@ -59,74 +61,74 @@ Top Performer: {top_agent}
 
 KEY FINDINGS
 ------------
-"""
+""")
         
         # Layer 1 (Raw Performance)
         l1 = full_report['summary']['layer1_avg']
-        summary += f"""
+        buf.write(f"""
 Average Performance Metrics:
   • Accuracy: {l1['accuracy']:.1%}
   • Energy Consumption: {l1['energy_wh']:.2f} Wh per task
   • Carbon Footprint: {l1['carbon_g']:.2f} g CO₂ per task
   • Response Time: {l1['latency_ms']:.0f} ms
-"""
+""")
         
         # Layer 3 (Business Value)
         l3_score = full_report['summary']['layer3_avg']['weighted_score']
-        summary += f"""
+        buf.write(f"""
 Composite Score (weighted for {scenario}): {l3_score:.2f} / 1.00
 
-"""
+""")
         
         # Top 3 Agents
-        summary += "TOP 3 RECOMMENDED AGENTS\n"
-        summary += "-" * 70 + "\n"
+        buf.write("TOP 3 RECOMMENDED AGENTS\n")
+        buf.write("-" * 70 + "\n")
         
         for i in range(min(3, len(full_report['reports']))):
             agent = full_report['reports'][i]
-            summary += f"""
+            buf.write(f"""
 #{i+1}. {agent['agent_id']}
    Scenario Score: {agent['layer3_scenario']['weighted_score']:.3f}
    Accuracy: {agent['layer1_raw']['accuracy']:.1%}
    Energy: {agent['layer1_raw']['energy_wh']:.2f} Wh
    Latency: {agent['layer1_raw']['latency_ms']:.0f} ms
    
-"""
+""")
         
         # Deployment Recommendation
-        summary += "\nDEPLOYMENT RECOMMENDATION\n"
-        summary += "-" * 70 + "\n"
+        buf.write("\nDEPLOYMENT RECOMMENDATION\n")
+        buf.write("-" * 70 + "\n")
         
         top_report = full_report['reports'][0]
         if scenario == 'production':
-            summary += f"""Deploy {top_report['agent_id']} for production workloads.
+            buf.write(f"""Deploy {top_report['agent_id']} for production workloads.
 This agent offers the best balance of accuracy and operational efficiency.
 
 Estimated Operational Costs (per 1M tasks):
   • Energy: ~{l1['energy_wh'] * 1000:.0f} kWh
   • Carbon: ~{l1['carbon_g'] * 1000:.0f} kg CO₂
   • Latency: ~{l1['latency_ms'] * 1000:.0f} seconds total
-"""
+""")
         elif scenario == 'eco_sensitive':
-            summary += f"""Deploy {top_report['agent_id']} for environmentally-conscious deployment.
+            buf.write(f"""Deploy {top_report['agent_id']} for environmentally-conscious deployment.
 This agent minimizes environmental impact while maintaining acceptable performance.
 
 Environmental Benefits (vs. average):
   • {((1 - top_report['layer1_raw']['energy_wh'] / l1['energy_wh']) * 100):.0f}% less energy
   • {((1 - top_report['layer1_raw']['carbon_co2_g'] / l1['carbon_g']) * 100):.0f}% less carbon
-"""
+""")
         elif scenario == 'real_time':
-            summary += f"""Deploy {top_report['agent_id']} for real-time applications.
+            buf.write(f"""Deploy {top_report['agent_id']} for real-time applications.
 This agent delivers the fastest response times.
 
 Latency Performance:
   • Average: {top_report['layer1_raw']['latency_ms']:.0f} ms
   • 95th percentile: <{top_report['layer1_raw']['latency_ms'] * 1.5:.0f} ms (estimated)
-"""
+""")
         
-        summary += "\n" + "="*70 + "\n"
+        buf.write("\n" + "="*70 + "\n")
         
-        return summary
+        return buf.getvalue()
     
     def generate_technical_report(self, full_report: Dict) -> str:
         """
@@ -7,6 +7,7 @@ optimal policies for specific deployment scenarios.
 """
 
 from typing import Dict, List, Callable, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import numpy as np
 import logging
 
@@ -23,8 +24,19 @@ class PolicyEvaluationEnvironment:
     across different execution modes (eco, fast, accuracy, balanced).
     """
     
-    def __init__(self):
-        """Initialize policy evaluation environment"""
+    def __init__(self, max_workers: int = 8):
+        """
+        Initialize policy evaluation environment
+        
+        Args:
+            max_workers: Maximum number of tasks executed concurrently.
+                         Policies run in worker threads, so this speeds up
+                         I/O-bound agents; CPU-bound pure-Python policies
+                         stay serialized by the GIL. Use 1 to run tasks
+                         sequentially.
+        """
+        self.max_workers = max(1, int(max_workers))
+        
         # Create reward shapers for each mode
         self.reward_shapers = {
             mode: RewardShaper(mode) 
@@ -79,47 +91,81 @@ class PolicyEvaluationEnvironment:
             
             print(f"Eco mode reward: {results['avg_reward']:.3f}")
         """
-        if mode not in self.reward_shapers:
-            raise ValueError(f"Unknown mode: {mode}")
-        
-        shaper = self.reward_shapers[mode]
-        results = []
+        shaper = self._get_shaper(mode)
         
         if verbose:
             print(f"\nEvaluating policy in {mode.value} mode...")
             print(f"Tasks: {len(tasks)}")
         
-        for i, task in enumerate(tasks):
-            if verbose and (i + 1) % 10 == 0:
-                print(f"  Progress: {i + 1}/{len(tasks)}")
-            
-            try:
-                # Execute agent
-                result = agent_policy(task)
-                
-                # Compute reward
-                reward_data = shaper.compute_reward(
-                    task_success=result.get('accuracy', result.get('task_success', 0.0)),
-                    energy_kwh=result.get('energy_kwh', 0.0),
-                    carbon_kg=result.get('carbon_kg', 0.0),
-                    latency_ms=result.get('latency_ms', 0.0),
-                    cost_usd=result.get('cost_usd', 0.0)
-                )
-                
-                results.append({
-                    'task_id': task.get('task_id', f"task_{i}"),
-                    **reward_data,
-                    'metrics': result
-                })
-                
-            except Exception as e:
-                logger.error(f"Task {i} failed: {e}")
-                results.append({
-                    'task_id': task.get('task_id', f"task_{i}"),
-                    'reward': 0.0,
-                    'error': str(e)
-                })
+        def run(indexed_task):
+            i, task = indexed_task
+            return self._execute_task(agent_policy, task, i, shaper)
         
+        # Results come back in task order even though tasks run concurrently
+        workers = max(1, min(self.max_workers, len(tasks)))
+        results = []
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            for result in ex.map(run, enumerate(tasks)):
+                results.append(result)
+                if verbose and len(results) % 10 == 0:
+                    print(f"  Progress: {len(results)}/{len(tasks)}")
+        
+        return self._summarize_mode(mode, tasks, results, verbose)
+    
+    def _execute_task(self,
+                      agent_policy: Callable,
+                      task: Dict,
+                      index: int,
+                      shaper: RewardShaper) -> Dict:
+        """Run the policy on one task and shape its reward, capturing failures"""
+        try:
+            # Execute agent
+            result = agent_policy(task)
+        except Exception as e:
+            return self._failed_task(task, index, e)
+        
+        return self._shape_task(result, task, index, shaper)
+    
+    def _shape_task(self,
+                    result: Dict,
+                    task: Dict,
+                    index: int,
+                    shaper: RewardShaper) -> Dict:
+        """Shape the reward for one policy result, capturing failures"""
+        try:
+            # Compute reward
+            reward_data = shaper.compute_reward(
+                task_success=result.get('accuracy', result.get('task_success', 0.0)),
+                energy_kwh=result.get('energy_kwh', 0.0),
+                carbon_kg=result.get('carbon_kg', 0.0),
+                latency_ms=result.get('latency_ms', 0.0),
+                cost_usd=result.get('cost_usd', 0.0)
+            )
+        except Exception as e:
+            return self._failed_task(task, index, e)
+        
+        return {
+            'task_id': task.get('task_id', f"task_{index}"),
+            **reward_data,
+            'metrics': result
+        }
+    
+    @staticmethod
+    def _failed_task(task: Dict, index: int, error: Exception) -> Dict:
+        """Result entry for a task whose execution or shaping failed"""
+        logger.error(f"Task {index} failed: {error}")
+        return {
+            'task_id': task.get('task_id', f"task_{index}"),
+            'reward': 0.0,
+            'error': str(error)
+        }
+    
+    def _summarize_mode(self,
+                        mode: ExecutionMode,
+                        tasks: List[Dict],
+                        results: List[Dict],
+                        verbose: bool = False) -> Dict:
+        """Aggregate per-task results for one mode and record them in history"""
         # Aggregate statistics
         rewards = [r['reward'] for r in results if 'reward' in r]
         successes = [r['components']['task_success'] for r in results if 'components' in r]
@@ -175,7 +221,9 @@ class PolicyEvaluationEnvironment:
         Evaluate agent across all execution modes
         
         This shows how the same agent performs under different
-        optimization objectives.
+        optimization objectives. The policy runs once per task and every
+        mode shapes the same results, so modes are compared on identical
+        executions.
         
         Args:
             agent_policy: Agent to evaluate
@@ -203,17 +251,39 @@ class PolicyEvaluationEnvironment:
             modes = [ExecutionMode.ECO_MODE, ExecutionMode.FAST_MODE,
                     ExecutionMode.ACCURACY_MODE, ExecutionMode.BALANCED_MODE]
         
-        evaluations = {}
+        shapers = {mode: self._get_shaper(mode) for mode in modes}
+        per_mode = {mode: [None] * len(tasks) for mode in modes}
+        
+        # Pipeline: the policy runs once per task in worker threads while
+        # this thread shapes each finished result under every mode, so
+        # reward shaping overlaps with the tasks still executing
+        workers = max(1, min(self.max_workers, len(tasks)))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            futures = {
+                ex.submit(agent_policy, task): i
+                for i, task in enumerate(tasks)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                error = future.exception()
+                if error is not None:
+                    failed = self._failed_task(tasks[i], i, error)
+                    for mode in modes:
+                        per_mode[mode][i] = dict(failed)
+                    continue
+                
+                result = future.result()
+                for mode in modes:
+                    per_mode[mode][i] = self._shape_task(
+                        result, tasks[i], i, shapers[mode]
+                    )
         
+        evaluations = {}
         for mode in modes:
             if verbose:
                 print(f"\n{'='*60}")
-            
-            evaluations[mode.value] = self.evaluate_policy(
-                agent_policy,
-                tasks,
-                mode,
-                verbose=verbose
+            evaluations[mode.value] = self._summarize_mode(
+                mode, tasks, per_mode[mode], verbose=verbose
             )
         
         # Find best mode (highest average reward)
@@ -233,6 +303,12 @@ class PolicyEvaluationEnvironment:
             'recommendations': recommendations
         }
     
+    def _get_shaper(self, mode: ExecutionMode) -> RewardShaper:
+        """Look up the reward shaper for a mode"""
+        if mode not in self.reward_shapers:
+            raise ValueError(f"Unknown mode: {mode}")
+        return self.reward_shapers[mode]
+    
     def compare_policies(self,
                         policies: Dict[str, Callable],
                         tasks: List[Dict],
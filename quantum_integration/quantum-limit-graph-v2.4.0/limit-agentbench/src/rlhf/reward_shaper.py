@@ -13,9 +13,32 @@ from enum import Enum
 import numpy as np
 import logging
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True)
+    def _batch_rewards(M, W, out):
+        """out[i, j] = reward of metric row i under weight column j"""
+        for i in prange(M.shape[0]):
+            for j in range(W.shape[1]):
+                acc = 0.0
+                for k in range(M.shape[1]):
+                    acc += M[i, k] * W[k, j]
+                out[i, j] = acc
+        return out
+else:
+    def _batch_rewards(M, W, out):
+        """out[i, j] = reward of metric row i under weight column j"""
+        return np.matmul(M, W, out=out)
+
+
 class ExecutionMode(Enum):
     """
     Different optimization modes for agent execution
@@ -329,6 +352,132 @@ class RewardShaper:
             }
         }
     
+    @classmethod
+    def batch_compare(cls,
+                      results: List[Dict],
+                      modes: Optional[List[ExecutionMode]] = None) -> Dict[str, Dict]:
+        """
+        Compare agent policies under several execution modes at once
+        
+        Stacks the results into an (n_agents, 5) metric matrix and each
+        mode's scaled lambda values into a (5, n_modes) weight matrix, so
+        every reward for every mode comes out of one matrix multiply
+        instead of one compare_policies() pass per mode.
+        
+        Args:
+            results: List of result dictionaries (same as compare_policies)
+            modes: Modes to compare under (default: all non-custom modes)
+        
+        Returns:
+            Dict mapping mode value to its comparison:
+            {
+                'rankings': List[Dict],  # agent_id, reward, rank, raw_metrics
+                'mode': str,
+                'best_agent': str,
+                'summary': Dict
+            }
+            Rankings match compare_policies() without the per-penalty
+            breakdown.
+        
+        Example:
+            comparisons = RewardShaper.batch_compare(
+                results,
+                [ExecutionMode.ECO_MODE, ExecutionMode.FAST_MODE]
+            )
+            print(f"Eco best: {comparisons['eco']['best_agent']}")
+        """
+        if modes is None:
+            modes = list(cls.MODE_CONFIGS)
+        
+        metrics = cls._metric_matrix(results)
+        weights = np.stack(
+            [cls._weight_vector(cls.MODE_CONFIGS[mode]) for mode in modes], axis=1
+        )
+        
+        # (n_agents, n_modes): R = TaskSuccess - sum(λ·scale·resource)
+        rewards = cls.reward_matrix(metrics, weights)
+        
+        comparisons = {}
+        for j, mode in enumerate(modes):
+            mode_rewards = rewards[:, j]
+            order = np.argsort(-mode_rewards, kind='stable')
+            
+            ranked = [
+                {
+                    'agent_id': results[i]['agent_id'],
+                    'reward': float(mode_rewards[i]),
+                    'mode': mode.value,
+                    'rank': rank,
+                    'raw_metrics': {
+                        'task_success': results[i].get('task_success', results[i].get('accuracy')),
+                        'energy_kwh': results[i].get('energy_kwh'),
+                        'carbon_kg': results[i].get('carbon_kg'),
+                        'latency_ms': results[i].get('latency_ms')
+                    }
+                }
+                for rank, i in enumerate(order, 1)
+            ]
+            
+            comparisons[mode.value] = {
+                'rankings': ranked,
+                'mode': mode.value,
+                'best_agent': ranked[0]['agent_id'] if ranked else None,
+                'summary': {
+                    'mean_reward': np.mean(mode_rewards),
+                    'std_reward': np.std(mode_rewards),
+                    'min_reward': np.min(mode_rewards),
+                    'max_reward': np.max(mode_rewards),
+                    'reward_range': np.max(mode_rewards) - np.min(mode_rewards)
+                }
+            }
+        
+        return comparisons
+    
+    @staticmethod
+    def reward_matrix(metrics: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        """
+        Rewards for every (result, reward configuration) pair
+        
+        Runs the compiled Numba kernel (parallel over results) when numba
+        is installed, otherwise a single NumPy matmul.
+        
+        Args:
+            metrics: (n_results, 5) matrix from _metric_matrix()
+            weights: (5, n_configs) matrix of _weight_vector() columns
+        
+        Returns:
+            (n_results, n_configs) reward matrix
+        """
+        metrics = np.ascontiguousarray(metrics, dtype=np.float64)
+        weights = np.ascontiguousarray(weights, dtype=np.float64)
+        out = np.empty((metrics.shape[0], weights.shape[1]), dtype=np.float64)
+        return _batch_rewards(metrics, weights, out)
+    
+    @staticmethod
+    def _metric_matrix(results: List[Dict]) -> np.ndarray:
+        """Stack results into (success, energy, carbon, latency, cost) rows"""
+        return np.array([
+            [
+                r.get('task_success', r.get('accuracy', 0.0)),
+                r.get('energy_kwh', 0.0),
+                r.get('carbon_kg', 0.0),
+                r.get('latency_ms', 0.0),
+                r.get('cost_usd', 0.0)
+            ]
+            for r in results
+        ], dtype=np.float64).reshape(len(results), 5)
+    
+    @staticmethod
+    def _weight_vector(config: RewardConfig) -> np.ndarray:
+        """Reward weights for (success, energy, carbon, latency, cost) columns"""
+        return np.array([
+            1.0,
+            -config.lambda_energy * config.energy_scale,
+            -config.lambda_carbon * config.carbon_scale,
+            -config.lambda_latency * config.latency_scale,
+            -config.lambda_cost * config.cost_scale
+        ], dtype=np.float64)
+    
     def recommend_mode(self, constraints: Dict[str, float]) -> ExecutionMode:
         """
         Recommend execution mode based on constraints
@@ -390,34 +539,35 @@ class RewardShaper:
         logger.info(f"Optimizing lambda values for {target_metric}")
         
         # Grid search over lambda values
+        configs = [
+            RewardConfig(
+                mode=ExecutionMode.CUSTOM,
+                lambda_energy=lambda_energy,
+                lambda_carbon=lambda_carbon,
+                lambda_latency=lambda_latency
+            )
+            for lambda_energy in [0.5, 1.0, 3.0, 5.0, 10.0]
+            for lambda_carbon in [0.5, 1.0, 3.0, 5.0, 10.0]
+            for lambda_latency in [0.5, 1.0, 3.0, 5.0, 10.0]
+        ]
+        
+        # Rewards for every config in one kernel call: (n_samples, n_configs)
+        rewards = self.reward_matrix(
+            self._metric_matrix(training_data),
+            np.stack([self._weight_vector(config) for config in configs], axis=1)
+        )
+        target_values = [d[target_metric] for d in training_data]
+        
         best_config = None
         best_score = -float('inf')
         
-        for lambda_energy in [0.5, 1.0, 3.0, 5.0, 10.0]:
-            for lambda_carbon in [0.5, 1.0, 3.0, 5.0, 10.0]:
-                for lambda_latency in [0.5, 1.0, 3.0, 5.0, 10.0]:
-                    
-                    # Create config
-                    config = RewardConfig(
-                        mode=ExecutionMode.CUSTOM,
-                        lambda_energy=lambda_energy,
-                        lambda_carbon=lambda_carbon,
-                        lambda_latency=lambda_latency
-                    )
-                    
-                    # Compute rewards with this config
-                    temp_shaper = RewardShaper(ExecutionMode.CUSTOM, config)
-                    rewards = temp_shaper.compute_batch_rewards(training_data)
-                    
-                    # Compute correlation with target
-                    reward_values = [r['reward'] for r in rewards]
-                    target_values = [d[target_metric] for d in training_data]
-                    
-                    correlation = np.corrcoef(reward_values, target_values)[0, 1]
-                    
-                    if correlation > best_score:
-                        best_score = correlation
-                        best_config = config
+        for j, config in enumerate(configs):
+            # Compute correlation with target
+            correlation = np.corrcoef(rewards[:, j], target_values)[0, 1]
+            
+            if correlation > best_score:
+                best_score = correlation
+                best_config = config
         
         logger.info(f"Optimized lambda values: "
                    f"energy={best_config.lambda_energy}, "
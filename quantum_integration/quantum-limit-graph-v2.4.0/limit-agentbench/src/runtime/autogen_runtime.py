@@ -1,24 +1,5 @@
-class AutoGenRuntime:
-    def __init__(self):
-        self.graph_depth = 0
+# Kept for import compatibility; the implementation lives in
+# analysis.autogen_runtime
+from analysis.autogen_runtime import AutoGenRuntime
 
-    def init(self, config):
-        self.config = config
-
-    def run(self, query):
-        self.graph_depth += 2
-
-        return {
-            "accuracy": 0.85,
-            "tool_calls": 1,
-            "conversation_depth": self.graph_depth,
-        }
-
-    def reduce_tool_calls(self):
-        pass
-
-    def shorten_context(self):
-        pass
-
-    def finalize(self):
-        pass
+__all__ = ["AutoGenRuntime"]
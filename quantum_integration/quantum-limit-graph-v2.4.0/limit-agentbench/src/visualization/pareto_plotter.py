@@ -12,19 +12,36 @@ Why multiple 2D plots instead of one 7D plot:
 - Projections reveal different "faces" of the Pareto frontier
 """
 
-from typing import List, Optional, Dict, Tuple
+from __future__ import annotations
+
+from typing import List, Optional, Dict, Tuple, Union
 import numpy as np
 import logging
 
+# Import from analysis module
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analysis._kernels import dominated_mask, skyline_2d
+
 # Import visualization libraries
 try:
     import plotly.graph_objects as go
+    import plotly.io as pio
+    from plotly.offline import get_plotlyjs_version
     from plotly.subplots import make_subplots
     PLOTLY_AVAILABLE = True
 except ImportError:
     PLOTLY_AVAILABLE = False
     logging.warning("Plotly not available. Install with: pip install plotly")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     import matplotlib.pyplot as plt
     MATPLOTLIB_AVAILABLE = True
@@ -34,6 +51,51 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Shared plotly template: plotly_white plus the house font, hover and legend
+# settings, resolved once at import instead of per figure
+if PLOTLY_AVAILABLE:
+    _TEMPLATE = go.layout.Template(pio.templates['plotly_white'])
+    _TEMPLATE.layout.update(hovermode='closest', font=dict(size=12), showlegend=True)
+else:
+    _TEMPLATE = None
+
+# Minimal page for figures saved with include_plotlyjs='cdn'
+_CDN_HTML = """<html>
+<head><meta charset="utf-8" /><script src="https://cdn.plot.ly/plotly-{version}.min.js"></script></head>
+<body><div id="{div_id}"></div>
+<script>Plotly.newPlot("{div_id}", {figure});</script>
+</body>
+</html>
+"""
+
+
+def _fast_write_html(fig: go.Figure, path: str):
+    """
+    Write fig as a small HTML page that loads plotly.js from the CDN
+    
+    Skips plotly's full HTML writer; the figure is serialized with orjson
+    when available (plotly's own orjson engine, which handles numpy data).
+    """
+    figure = pio.to_json(fig, validate=False, engine='orjson' if ORJSON_AVAILABLE else 'json')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(_CDN_HTML.format(version=get_plotlyjs_version(), div_id='pareto-plot', figure=figure))
+
+
+def _frontier_2d(xs, ys) -> np.ndarray:
+    """
+    Indices of the 2D Pareto frontier, both axes minimized
+    
+    Same frontier as ExtendedParetoAnalyzer.project_2d: the O(N log N)
+    skyline sweep, with equal points kept since they do not dominate each
+    other. Indices come back in ascending x order (ties by y), so frontier
+    lines are drawn left to right.
+    """
+    A = np.column_stack((np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64)))
+    if np.isnan(A).any():
+        index = np.flatnonzero(~dominated_mask(A, np.arange(len(A))))
+    else:
+        index = skyline_2d(A)
+    return index[np.lexsort((A[index, 1], A[index, 0]))]
 
 class ParetoPlotter:
     """
@@ -62,6 +124,7 @@ class ParetoPlotter:
             backend: 'plotly' (interactive) or 'matplotlib' (static)
         """
         self.backend = backend
+        self._template = _TEMPLATE
         
         if backend == 'plotly' and not PLOTLY_AVAILABLE:
             raise ImportError("Plotly not installed. Run: pip install plotly")
@@ -70,11 +133,20 @@ class ParetoPlotter:
         
         logger.info(f"Initialized ParetoPlotter with {backend} backend")
     
+    @staticmethod
+    def _write_html(fig: go.Figure, path: str, include_plotlyjs: Union[bool, str]):
+        """Save a plotly figure; CDN-linked pages bypass plotly's HTML writer"""
+        if include_plotlyjs == 'cdn':
+            _fast_write_html(fig, path)
+        else:
+            fig.write_html(path, include_plotlyjs=include_plotlyjs)
+    
     def plot_accuracy_vs_carbon(self,
                                 agents: List,
-                                frontier: List,
+                                frontier: Optional[List] = None,
                                 title: str = "Accuracy vs Carbon Footprint",
-                                save_path: Optional[str] = None) -> Optional[go.Figure]:
+                                save_path: Optional[str] = None,
+                                include_plotlyjs: Union[bool, str] = True) -> Optional[go.Figure]:
         """
         Plot Accuracy vs Carbon - Sustainability perspective
         
@@ -94,9 +166,11 @@ class ParetoPlotter:
         
         Args:
             agents: All agents (ExtendedParetoPoint objects)
-            frontier: Agents on Pareto frontier
+            frontier: Agents to highlight (default: this projection's 2D frontier)
             title: Plot title
             save_path: Optional path to save plot
+            include_plotlyjs: True inlines plotly.js (~3 MB per file); 'cdn'
+                writes a small page that links it; other values go to write_html
         
         Returns:
             Plotly figure (if backend='plotly')
@@ -106,6 +180,10 @@ class ParetoPlotter:
             fig = plotter.plot_accuracy_vs_carbon(agents, frontier)
             fig.show()  # Interactive plot
         """
+        if frontier is None:
+            frontier = [agents[i] for i in _frontier_2d(
+                [a.carbon_co2e_kg for a in agents], [-a.accuracy for a in agents]
+            )]
         frontier_ids = {a.agent_id for a in frontier}
         
         if self.backend == 'plotly':
@@ -148,10 +226,7 @@ class ParetoPlotter:
                 title=title,
                 xaxis_title='Carbon Footprint (g CO₂e)',
                 yaxis_title='Accuracy (%)',
-                template='plotly_white',
-                hovermode='closest',
-                font=dict(size=12),
-                showlegend=True,
+                template=self._template,
                 width=800,
                 height=600
             )
@@ -169,7 +244,7 @@ class ParetoPlotter:
                 ))
             
             if save_path:
-                fig.write_html(save_path)
+                self._write_html(fig, save_path, include_plotlyjs)
                 logger.info(f"Saved plot to {save_path}")
             
             return fig
@@ -213,9 +288,10 @@ class ParetoPlotter:
     
     def plot_latency_vs_energy(self,
                                agents: List,
-                               frontier: List,
+                               frontier: Optional[List] = None,
                                title: str = "Latency vs Energy Consumption",
-                               save_path: Optional[str] = None) -> Optional[go.Figure]:
+                               save_path: Optional[str] = None,
+                               include_plotlyjs: Union[bool, str] = True) -> Optional[go.Figure]:
         """
         Plot Latency vs Energy - Systems engineering perspective
         
@@ -237,6 +313,10 @@ class ParetoPlotter:
         If plot shows strong correlation: architecture couples speed and energy
         If plot shows weak correlation: algorithmic optimizations possible
         """
+        if frontier is None:
+            frontier = [agents[i] for i in _frontier_2d(
+                [a.latency_ms for a in agents], [a.energy_kwh for a in agents]
+            )]
         frontier_ids = {a.agent_id for a in frontier}
         
         if self.backend == 'plotly':
@@ -271,10 +351,7 @@ class ParetoPlotter:
                 title=title,
                 xaxis_title='Latency (ms)',
                 yaxis_title='Energy (Wh)',
-                template='plotly_white',
-                hovermode='closest',
-                font=dict(size=12),
-                showlegend=True,
+                template=self._template,
                 width=800,
                 height=600
             )
@@ -285,7 +362,7 @@ class ParetoPlotter:
                              opacity=0.3, annotation_text=f"{sla_ms}ms SLA")
             
             if save_path:
-                fig.write_html(save_path)
+                self._write_html(fig, save_path, include_plotlyjs)
             
             return fig
         
@@ -318,9 +395,10 @@ class ParetoPlotter:
     
     def plot_carbon_vs_energy(self,
                              agents: List,
-                             frontier: List,
+                             frontier: Optional[List] = None,
                              title: str = "Pure Green: Carbon vs Energy",
-                             save_path: Optional[str] = None) -> Optional[go.Figure]:
+                             save_path: Optional[str] = None,
+                             include_plotlyjs: Union[bool, str] = True) -> Optional[go.Figure]:
         """
         Plot Carbon vs Energy - Pure environmental efficiency
         
@@ -347,6 +425,10 @@ class ParetoPlotter:
         - Low accuracy but excellent green efficiency (lower left)
         - This plot shows which agents are environmentally optimal
         """
+        if frontier is None:
+            frontier = [agents[i] for i in _frontier_2d(
+                [a.energy_kwh for a in agents], [a.carbon_co2e_kg for a in agents]
+            )]
         frontier_ids = {a.agent_id for a in frontier}
         
         if self.backend == 'plotly':
@@ -410,10 +492,7 @@ class ParetoPlotter:
                 title=title,
                 xaxis_title='Energy (Wh)',
                 yaxis_title='Carbon (g CO₂e)',
-                template='plotly_white',
-                hovermode='closest',
-                font=dict(size=12),
-                showlegend=True,
+                template=self._template,
                 width=800,
                 height=600
             )
@@ -429,7 +508,7 @@ class ParetoPlotter:
             )
             
             if save_path:
-                fig.write_html(save_path)
+                self._write_html(fig, save_path, include_plotlyjs)
             
             return fig
         
@@ -472,7 +551,7 @@ class ParetoPlotter:
     
     def plot_all_projections(self,
                             agents: List,
-                            frontier: List,
+                            frontier: Optional[List] = None,
                             save_dir: Optional[str] = None) -> Dict[str, go.Figure]:
         """
         Generate all three specialized plots
@@ -484,7 +563,7 @@ class ParetoPlotter:
         
         Args:
             agents: All agents
-            frontier: Pareto frontier
+            frontier: Agents to highlight (default: each projection's 2D frontier)
             save_dir: Directory to save plots
         
         Returns:
@@ -510,3 +589,49 @@ class ParetoPlotter:
         
         logger.info(f"Generated {len(plots)} projection plots")
         return plots
+    
+    def combine_projections(self,
+                            figures: Dict[str, go.Figure],
+                            save_path: Optional[str] = None,
+                            include_plotlyjs: Union[bool, str] = 'cdn') -> go.Figure:
+        """
+        Lay several projection plots side by side in one figure
+        
+        One HTML file linking plotly.js from the CDN replaces a standalone
+        file per plot, each with plotly.js inlined. Traces and axis titles
+        are carried over; per-plot shapes and annotations are not.
+        
+        Args:
+            figures: Dict mapping plot name -> plotly figure (plot order)
+            save_path: Optional path to save the combined HTML
+            include_plotlyjs: As for plot_* (default: 'cdn')
+        
+        Returns:
+            Combined plotly figure
+        """
+        if self.backend != 'plotly':
+            raise ValueError("combine_projections requires the plotly backend")
+        
+        names = list(figures)
+        combined = make_subplots(
+            rows=1, cols=len(names),
+            subplot_titles=[figures[name].layout.title.text or name for name in names]
+        )
+        for col, name in enumerate(names, start=1):
+            fig = figures[name]
+            for trace in fig.data:
+                combined.add_trace(trace, row=1, col=col)
+            combined.update_xaxes(title_text=fig.layout.xaxis.title.text, row=1, col=col)
+            combined.update_yaxes(title_text=fig.layout.yaxis.title.text, row=1, col=col)
+        
+        combined.update_layout(
+            template=self._template,
+            width=800 * len(names),
+            height=600
+        )
+        
+        if save_path:
+            self._write_html(combined, save_path, include_plotlyjs)
+            logger.info(f"Saved {len(names)} plots to {save_path}")
+        
+        return combined
@@ -0,0 +1,102 @@
+"""
+Unit tests for budget compliance checks and enforcement
+
+Run with: pytest tests/test_budget.py -v
+"""
+
+import pytest
+import asyncio
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from constraints.budget_manager import Budget, BudgetManager
+from constraints.budget_enforcer import BudgetEnforcer
+
+
+class TestComplianceMask:
+    """Test BudgetManager.compliance_mask"""
+    
+    @pytest.mark.parametrize('max_cost_usd', [None, 0.05])
+    def test_matches_per_result_checks(self, max_cost_usd):
+        """Vectorized mask agrees with checking each result by hand"""
+        budget = Budget(max_energy_wh=5.0, max_carbon_g=1.0,
+                        max_latency_ms=400.0, max_cost_usd=max_cost_usd)
+        results = [
+            {'energy_kwh': e, 'carbon_kg': c, 'latency_ms': l, 'cost_usd': u}
+            for e in (0.001, 0.005, 0.006)
+            for c in (0.0005, 0.001, 0.002)
+            for l in (100.0, 400.0, 401.0)
+            for u in (0.01, 0.1)
+        ] + [{}]
+        
+        expected = [
+            r.get('energy_kwh', 0.0) * 1000 <= budget.max_energy_wh
+            and r.get('carbon_kg', 0.0) * 1000 <= budget.max_carbon_g
+            and r.get('latency_ms', 0.0) <= budget.max_latency_ms
+            and (max_cost_usd is None or r.get('cost_usd', 0.0) <= max_cost_usd)
+            for r in results
+        ]
+        assert BudgetManager.compliance_mask(results, budget).tolist() == expected
+        assert BudgetManager.filter_compliant(results, budget) == \
+            [r for r, ok in zip(results, expected) if ok]
+
+
+class TestExecuteWithBudget:
+    """Test BudgetEnforcer.execute_with_budget"""
+    
+    def test_concurrent_executions_respect_budget(self):
+        """Reservations stop concurrent tasks from jointly overrunning the budget"""
+        enforcer = BudgetEnforcer(
+            Budget(max_energy_wh=10.0, max_carbon_g=10.0, max_latency_ms=1000.0)
+        )
+        
+        async def agent(task):
+            await asyncio.sleep(0.01)
+            return {'task': task, 'metrics': {'energy_kwh': 0.002}}
+        
+        async def run():
+            return await asyncio.gather(*[
+                enforcer.execute_with_budget(
+                    agent, i, {'energy_wh': 3.0, 'carbon_g': 1.0, 'latency_ms': 100.0}
+                )
+                for i in range(5)
+            ])
+        
+        outcomes = asyncio.run(run())
+        executed = [o for o in outcomes if o['success']]
+        
+        # Three 3 Wh estimates fit in 10 Wh; the rest are refused up front
+        assert len(executed) == 3
+        assert all(o['violations'] == ['energy_wh'] for o in outcomes if not o['success'])
+        # Actual consumption (2 Wh each) is recorded, reservations released
+        assert enforcer.manager.consumed['energy_wh'] == pytest.approx(6.0)
+        assert enforcer.reserved['energy_wh'] == pytest.approx(0.0)
+        assert executed[0]['actual_consumption']['energy_wh'] == pytest.approx(2.0)
+    
+    def test_failed_agent_is_charged_its_estimate(self):
+        """An agent that raises still releases its reservation and pays the estimate"""
+        enforcer = BudgetEnforcer(
+            Budget(max_energy_wh=10.0, max_carbon_g=10.0, max_latency_ms=1000.0)
+        )
+        
+        async def failing_agent(task):
+            raise RuntimeError("agent crashed")
+        
+        with pytest.raises(RuntimeError):
+            asyncio.run(enforcer.execute_with_budget(
+                failing_agent, 'task', {'energy_wh': 4.0, 'carbon_g': 1.0}
+            ))
+        
+        assert enforcer.manager.consumed['energy_wh'] == pytest.approx(4.0)
+        assert enforcer.reserved['energy_wh'] == pytest.approx(0.0)
+    
+    def test_requires_budget(self):
+        """Enforcers built from plain limits cannot run budgeted executions"""
+        async def agent(task):
+            return {}
+        
+        with pytest.raises(ValueError):
+            asyncio.run(BudgetEnforcer(max_energy=1.0).execute_with_budget(agent, None, {}))
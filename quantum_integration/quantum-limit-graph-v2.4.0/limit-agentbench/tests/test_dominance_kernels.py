@@ -0,0 +1,257 @@
+"""
+Unit tests for the Pareto dominance kernels and archives
+
+Run with: pytest tests/test_dominance_kernels.py -v
+"""
+
+import pytest
+import sys
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from analysis import _kernels
+from analysis.dominance_checker import (
+    dominates, make_dominates, pack_metrics, dominates_batch, pareto_front_mask
+)
+from analysis.extended_pareto_analyzer import ExtendedParetoAnalyzer, ExtendedParetoPoint
+from analysis.ndtree import NDTree
+
+
+def load_numpy_kernels():
+    """Second copy of analysis._kernels imported as if numba were missing"""
+    missing = object()
+    saved = sys.modules.get('numba', missing)
+    sys.modules['numba'] = None
+    try:
+        spec = importlib.util.spec_from_file_location('_kernels_numpy', _kernels.__file__)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        if saved is missing:
+            del sys.modules['numba']
+        else:
+            sys.modules['numba'] = saved
+    assert not module.NUMBA_AVAILABLE
+    return module
+
+
+NUMPY_KERNELS = load_numpy_kernels()
+
+
+@pytest.fixture(params=['default', 'numpy'])
+def kernels(request):
+    """The kernels as imported (Numba when installed) and the NumPy fallback"""
+    return _kernels if request.param == 'default' else NUMPY_KERNELS
+
+
+def brute_force_dominated(A, id_codes):
+    """Reference mask: j dominates i if no worse everywhere and better somewhere"""
+    n = len(A)
+    out = np.zeros(n, dtype=bool)
+    for i in range(n):
+        for j in range(n):
+            if id_codes[i] == id_codes[j]:
+                continue
+            if not any(A[j] > A[i]) and any(A[j] < A[i]):
+                out[i] = True
+                break
+    return out
+
+
+def random_matrix(rng, n, m, nan=True):
+    """Small-integer matrix (plenty of ties) with +/-inf and optional NaN cells"""
+    A = rng.integers(0, 3, size=(n, m)).astype(np.float64)
+    if n:
+        A[rng.random((n, m)) < 0.1] = np.inf
+        A[rng.random((n, m)) < 0.1] = -np.inf
+        if nan:
+            A[rng.random((n, m)) < 0.1] = np.nan
+    return A
+
+
+class TestDominatedMask:
+    """Test dominated_mask and its Numba variants"""
+
+    def test_nan_counts_as_not_worse(self, kernels):
+        """A NaN objective neither helps nor hurts a dominator"""
+        A = np.array([[1.0, np.nan], [2.0, 5.0]])
+        mask = kernels.dominated_mask(A, np.arange(2))
+        assert mask.tolist() == [False, True]
+
+    def test_matches_brute_force(self, kernels):
+        """Mask matches the pairwise definition on ties, inf and NaN"""
+        rng = np.random.default_rng(0)
+        for _ in range(200):
+            n, m = rng.integers(0, 12), rng.integers(1, 5)
+            A = random_matrix(rng, n, m)
+            ids = rng.integers(0, max(n, 1), size=n)
+            np.testing.assert_array_equal(
+                kernels.dominated_mask(A, ids), brute_force_dominated(A, ids)
+            )
+
+    @pytest.mark.skipif(not _kernels.NUMBA_AVAILABLE, reason="numba not installed")
+    def test_numba_kernels_agree(self):
+        """Bit-mask and early-exit Numba kernels return the same mask"""
+        rng = np.random.default_rng(1)
+        for _ in range(200):
+            n, m = rng.integers(0, 12), rng.integers(1, 5)
+            A = random_matrix(rng, n, m)
+            ids = rng.integers(0, max(n, 1), size=n)
+            expected = brute_force_dominated(A, ids)
+            np.testing.assert_array_equal(_kernels._dominated_mask_bits(A, ids), expected)
+            np.testing.assert_array_equal(_kernels._dominated_mask_loop(A, ids), expected)
+
+
+class TestFrontierKernels:
+    """Test any_dominates, nondominated_scan and skyline_2d"""
+
+    def test_any_dominates(self, kernels):
+        """any_dominates agrees with the pairwise definition"""
+        rng = np.random.default_rng(2)
+        for _ in range(300):
+            k, m = rng.integers(0, 6), rng.integers(1, 5)
+            F = random_matrix(rng, k, m)
+            p = random_matrix(rng, 1, m)[0]
+            expected = any(not any(f > p) and any(f < p) for f in F)
+            assert kernels.any_dominates(F, p) == expected
+
+    def test_nondominated_scan(self, kernels):
+        """Single scan returns the brute-force frontier, ascending"""
+        rng = np.random.default_rng(3)
+        for _ in range(200):
+            n, m = rng.integers(0, 15), rng.integers(1, 6)
+            A = random_matrix(rng, n, m, nan=False)
+            expected = np.flatnonzero(~brute_force_dominated(A, np.arange(n)))
+            np.testing.assert_array_equal(kernels.nondominated_scan(A), expected)
+
+    def test_skyline_2d(self, kernels):
+        """2D sweep returns the brute-force frontier, ascending"""
+        rng = np.random.default_rng(4)
+        for _ in range(300):
+            n = rng.integers(0, 15)
+            A = random_matrix(rng, n, 2, nan=False)
+            expected = np.flatnonzero(~brute_force_dominated(A, np.arange(n)))
+            np.testing.assert_array_equal(kernels.skyline_2d(A), expected)
+
+    def test_skyline_2d_keeps_equal_points(self, kernels):
+        """Identical points do not dominate each other"""
+        A = np.array([[1.0, 3.0], [1.0, 3.0], [2.0, 1.0], [0.5, 9.0]])
+        assert kernels.skyline_2d(A).tolist() == [0, 1, 2, 3]
+
+
+class TestDominanceChecker:
+    """Test dict-based dominance helpers"""
+
+    @pytest.fixture
+    def solutions(self):
+        rng = np.random.default_rng(5)
+        values = [0.0, 1.0, 2.0, np.inf, np.nan]
+        return [
+            {'energy': values[i], 'latency': values[j], 'accuracy': values[k]}
+            for i, j, k in rng.integers(0, len(values), size=(40, 3))
+        ]
+
+    def test_pack_metrics(self):
+        """Columns follow minimize then maximize keys; sign flips minimized ones"""
+        M, sign, keys = pack_metrics(
+            [{'energy': 1.0, 'accuracy': 0.9}, {'energy': 2.0, 'accuracy': 0.8}],
+            minimize=['energy'], maximize=['accuracy']
+        )
+        assert keys == ('energy', 'accuracy')
+        assert sign.tolist() == [-1.0, 1.0]
+        assert M.tolist() == [[1.0, 0.9], [2.0, 0.8]]
+        assert pack_metrics([], ['energy'])[0].shape == (0, 1)
+
+    def test_batch_and_specialized_match_dominates(self, solutions):
+        """dominates_batch and make_dominates agree with dominates on every pair"""
+        minimize, maximize = ['energy', 'latency'], ['accuracy']
+        M, sign, _ = pack_metrics(solutions, minimize, maximize)
+        specialized = make_dominates(minimize, maximize)
+
+        for i, a in enumerate(solutions):
+            expected = [dominates(a, b, set(minimize), set(maximize)) for b in solutions]
+            assert dominates_batch(M[i], M, sign).tolist() == expected
+            assert [specialized(a, b) for b in solutions] == expected
+
+    def test_pareto_front_mask(self, solutions):
+        """Front mask keeps exactly the solutions nothing dominates"""
+        minimize, maximize = ['energy', 'latency'], ['accuracy']
+        M, sign, _ = pack_metrics(solutions, minimize, maximize)
+        expected = [
+            not any(dominates(b, a, set(minimize), set(maximize)) for b in solutions)
+            for a in solutions
+        ]
+        assert pareto_front_mask(M, sign).tolist() == expected
+
+
+class TestExtendedFrontier:
+    """Test ExtendedParetoAnalyzer frontier dispatch"""
+
+    def make_agents(self, rng, n, shared_ids=False):
+        return [
+            ExtendedParetoPoint(
+                agent_id=f"agent_{i % 3 if shared_ids else i}",
+                accuracy=float(rng.integers(0, 3)) / 2,
+                energy_kwh=float(rng.integers(0, 3)),
+                carbon_co2e_kg=float(rng.integers(0, 3)),
+                latency_ms=float(rng.integers(0, 3)),
+                memory_mb=float(rng.integers(0, 3)),
+                circuit_depth=int(rng.integers(0, 3)),
+                variance_score=float(rng.integers(0, 3)) / 4
+            )
+            for i in range(n)
+        ]
+
+    @pytest.mark.parametrize('shared_ids', [False, True])
+    def test_frontiers_match_pairwise_dominance(self, shared_ids):
+        """7D frontier and 2D projections match dominates() between distinct agents"""
+        rng = np.random.default_rng(6)
+        for _ in range(20):
+            agents = self.make_agents(rng, int(rng.integers(1, 20)), shared_ids)
+            analyzer = ExtendedParetoAnalyzer()
+
+            expected = [
+                a for a in agents
+                if not any(b.agent_id != a.agent_id and b.dominates(a) for b in agents)
+            ]
+            assert analyzer.compute_frontier(agents) == expected
+
+            dims = ['carbon_co2e_kg', 'accuracy']
+            expected_2d = [
+                a for a in agents
+                if not any(b.agent_id != a.agent_id and b.dominates(a, dims) for b in agents)
+            ]
+            frontier_2d, _ = analyzer.project_2d(agents, *dims)
+            assert frontier_2d == expected_2d
+
+
+class TestNDTree:
+    """Test the ND-tree Pareto archive"""
+
+    @pytest.mark.parametrize('max_leaf_size', [2, 20])
+    def test_archive_matches_brute_force(self, max_leaf_size):
+        """After offering every point, the archive holds exactly the frontier"""
+        rng = np.random.default_rng(7)
+        for _ in range(30):
+            n, m = int(rng.integers(1, 60)), int(rng.integers(2, 5))
+            A = rng.integers(0, 6, size=(n, m)).astype(np.float64)
+            tree = NDTree(max_leaf_size=max_leaf_size)
+            for i, row in enumerate(A):
+                tree.update(row, i)
+
+            expected = np.flatnonzero(~brute_force_dominated(A, np.arange(n)))
+            assert sorted(item for _, item in tree.items()) == expected.tolist()
+            assert len(tree) == len(expected)
+
+    def test_update_reports_archiving(self):
+        """update() returns whether the point was archived"""
+        tree = NDTree()
+        assert tree.update((1.0, 5.0), 'a')
+        assert not tree.update((2.0, 6.0), 'b')
+        assert tree.update((0.5, 4.0), 'c')
+        assert tree.items() == [((0.5, 4.0), 'c')]
@@ -0,0 +1,183 @@
+"""
+Unit tests for the SQLite-backed green leaderboard
+
+Run with: pytest tests/test_green_leaderboard.py -v
+"""
+
+import pytest
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+# Add the package root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dashboard.green_leaderboard import GreenLeaderboard, METRIC_FIELDS
+# Bind the top-level metrics package now; src/ (added by other test
+# modules) has a metrics package of its own
+from metrics import sustainability_index
+from metrics.sustainability_index import SustainabilityIndex
+
+
+@pytest.fixture
+def leaderboard(tmp_path):
+    board = GreenLeaderboard(storage_path=str(tmp_path / "board"))
+    yield board
+    board.close()
+
+
+def submit_sample(board):
+    """Three entries across two frameworks with explicit sustainability indices"""
+    return board.submit_many([
+        {"agent_name": "a", "framework": "langchain", "task_suite": "s",
+         "accuracy": 0.9, "energy_kwh": 0.02, "carbon_co2e_kg": 0.004,
+         "latency_ms": 120.0, "sustainability_index": 70.0,
+         "metadata": {"run": 1}},
+        {"agent_name": "b", "framework": "autogen", "task_suite": "s",
+         "accuracy": 0.8, "energy_kwh": 0.01, "carbon_co2e_kg": 0.002,
+         "latency_ms": 90.0, "sustainability_index": 85.0},
+        {"agent_name": "c", "framework": "langchain", "task_suite": "s",
+         "accuracy": 0.7, "energy_kwh": 0.05, "carbon_co2e_kg": 0.010,
+         "latency_ms": 300.0, "sustainability_index": 40.0},
+    ])
+
+
+class TestGreenLeaderboard:
+    """Test GreenLeaderboard rankings"""
+    
+    def test_rankings_are_independent_copies(self, leaderboard):
+        """Mutating a returned ranking does not leak into later (cached) calls"""
+        submit_sample(leaderboard)
+        
+        first = leaderboard.get_rankings()
+        assert isinstance(first, list)
+        assert [e["agent_name"] for e in first] == ["b", "a", "c"]
+        
+        first[0]["agent_name"] = "mutated"
+        first[0]["metrics"]["accuracy"] = -1
+        first[1]["metadata"]["run"] = 99
+        first.pop()
+        
+        again = leaderboard.get_rankings()
+        assert [e["agent_name"] for e in again] == ["b", "a", "c"]
+        assert again[0]["metrics"]["accuracy"] == pytest.approx(0.8)
+        assert again[1]["metadata"] == {"run": 1}
+        assert leaderboard.get_top_agents(n=1)[0]["agent_name"] == "b"
+    
+    def test_submit_many_round_trip(self, leaderboard):
+        """Submitted entries come back from rankings and history unchanged"""
+        submitted = submit_sample(leaderboard)
+        assert [e["agent_name"] for e in submitted] == ["a", "b", "c"]
+        
+        rankings = leaderboard.get_rankings(sort_by="latency_ms")
+        assert [e["agent_name"] for e in rankings] == ["b", "a", "c"]
+        assert [e["rank"] for e in rankings] == [1, 2, 3]
+        assert rankings[1]["metrics"] == submitted[0]["metrics"]
+        assert rankings[1]["metadata"] == {"run": 1}
+        
+        assert leaderboard.get_rankings(framework_filter="langchain", limit=1)[0]["agent_name"] == "a"
+        assert leaderboard.get_agent_history("c") == [submitted[2]]
+    
+    def test_framework_stats(self, leaderboard):
+        """Per-framework sums and means over the stored entries"""
+        submit_sample(leaderboard)
+        stats = leaderboard.get_framework_stats()
+        
+        assert list(stats) == ["langchain", "autogen"]
+        assert stats["langchain"]["count"] == 2
+        assert stats["langchain"]["avg_accuracy"] == pytest.approx(0.8)
+        assert stats["langchain"]["total_energy"] == pytest.approx(0.07)
+        assert stats["autogen"]["avg_sustainability"] == pytest.approx(85.0)
+    
+    def test_submissions_invalidate_cached_rankings(self, leaderboard):
+        """A new submission shows up in the next ranking query"""
+        submit_sample(leaderboard)
+        assert len(leaderboard.get_rankings()) == 3
+        leaderboard.submit("d", "crewai", "s", 0.95, 0.001, 0.0002, 50.0,
+                           sustainability_index=99.0)
+        assert leaderboard.get_rankings()[0]["agent_name"] == "d"
+    
+    def test_concurrent_rankings_and_submissions(self, leaderboard):
+        """Threads querying and submitting at once always see a consistent ranking"""
+        submit_sample(leaderboard)
+        
+        def work(i):
+            if i % 4 == 0:
+                leaderboard.submit(f"t{i}", "crewai", "s", 0.5, 0.01, 0.002, 10.0)
+            limit = 1 + i % 3
+            return len(leaderboard.get_rankings(limit=limit)), limit
+        
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for count, limit in pool.map(work, range(400)):
+                assert count == limit
+    
+    def test_rescore_all_matches_calculate(self, leaderboard):
+        """Batch rescoring agrees with the per-entry sustainability index"""
+        submit_sample(leaderboard)
+        leaderboard.rescore_all()
+        
+        calc = SustainabilityIndex()
+        for entry in leaderboard.get_rankings():
+            m = entry["metrics"]
+            assert m["sustainability_index"] == calc.calculate(
+                m["accuracy"], m["energy_kwh"], m["carbon_co2e_kg"]
+            )
+    
+    def test_rescore_all_keeps_unchanged_scores(self, leaderboard):
+        """Rescoring unchanged data leaves stored indices bit-for-bit intact"""
+        leaderboard.submit("d", "crewai", "s", 0.85, 0.001, 0.0002, 50.0)
+        before = leaderboard.get_rankings()[0]["metrics"]["sustainability_index"]
+        leaderboard.rescore_all()
+        assert leaderboard.get_rankings()[0]["metrics"]["sustainability_index"] == before
+    
+    @pytest.mark.parametrize("numba", [True, False])
+    def test_calculate_batch_float32_input(self, monkeypatch, numba):
+        """Both batch paths score float32 columns in float64, matching calculate()"""
+        monkeypatch.setattr(
+            sustainability_index, "NUMBA_AVAILABLE",
+            numba and sustainability_index.NUMBA_AVAILABLE
+        )
+        columns = np.array([[0.85, 0.001, 0.0002], [0.9, 0.0, 0.004], [0.7, 0.02, 0.0]],
+                           dtype=np.float32)
+        calc = SustainabilityIndex()
+        scores = calc.calculate_batch(*columns.T)
+        
+        assert scores.dtype == np.float64
+        assert scores.tolist() == [calc.calculate(*map(float, row)) for row in columns]
+    
+    def test_export_columns(self, leaderboard, tmp_path):
+        """Metric columns are written as float32 memmaps in entry order"""
+        submit_sample(leaderboard)
+        paths = leaderboard.export_columns(str(tmp_path / "columns"))
+        
+        assert set(paths) == {"id"} | set(METRIC_FIELDS)
+        assert np.fromfile(paths["id"], dtype=np.int64).tolist() == [1, 2, 3]
+        latency = np.memmap(paths["latency_ms"], dtype=np.float32, mode="r")
+        assert latency.tolist() == [120.0, 90.0, 300.0]
+    
+    def test_export_to_json(self, leaderboard, tmp_path):
+        """Streamed JSON export parses and matches the rankings"""
+        submit_sample(leaderboard)
+        path = tmp_path / "leaderboard.json"
+        leaderboard.export_to_json(str(path))
+        
+        data = json.loads(path.read_text())
+        assert data["leaderboard"] == leaderboard.get_rankings()
+        assert data["framework_stats"] == leaderboard.get_framework_stats()
+        assert data["total_entries"] == 3
+    
+    def test_entries_persist_across_instances(self, tmp_path):
+        """A reopened leaderboard reads the entries from its database"""
+        board = GreenLeaderboard(storage_path=str(tmp_path / "board"))
+        submit_sample(board)
+        expected = board.get_rankings()
+        board.close()
+        
+        reopened = GreenLeaderboard(storage_path=str(tmp_path / "board"))
+        try:
+            assert reopened.get_rankings() == expected
+        finally:
+            reopened.close()
@@ -128,6 +128,20 @@ class TestParetoFrontierAnalyzer:
         assert len(frontier) == 1
         assert frontier[0].agent_id == 'solo'
     
+    def test_add_point_streaming(self, sample_agents):
+        """Test streaming frontier matches batch computation"""
+        analyzer = ParetoFrontierAnalyzer()
+        for agent in sample_agents:
+            analyzer.add_point(agent)
+
+        batch = analyzer.compute_frontier(sample_agents)
+        assert [p.agent_id for p in analyzer.get_frontier()] == [p.agent_id for p in batch]
+
+        # A point dominating everything replaces the whole frontier
+        assert analyzer.add_point(ParetoPoint('best', 0.99, 0.001, 0.0001, 50))
+        assert [p.agent_id for p in analyzer.get_frontier()] == ['best']
+        assert not analyzer.add_point(ParetoPoint('worse', 0.90, 0.002, 0.0002, 60))
+
     def test_rank_by_dominance(self, sample_agents):
         """Test Pareto ranking"""
         analyzer = ParetoFrontierAnalyzer()
@@ -0,0 +1,72 @@
+"""
+Unit tests for batched RLHF reward shaping
+
+Run with: pytest tests/test_reward_shaper.py -v
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from rlhf.reward_shaper import ExecutionMode, RewardShaper
+
+
+@pytest.fixture
+def results():
+    rng = np.random.default_rng(0)
+    return [
+        {
+            'agent_id': f'agent_{i}',
+            'task_success': float(rng.random()),
+            'energy_kwh': float(rng.random() * 0.01),
+            'carbon_kg': float(rng.random() * 0.002),
+            'latency_ms': float(rng.random() * 500),
+            'cost_usd': float(rng.random() * 0.01)
+        }
+        for i in range(12)
+    ]
+
+
+class TestBatchRewards:
+    """Test RewardShaper.batch_compare and reward_matrix"""
+    
+    def test_reward_matrix_matches_matmul(self):
+        """Compiled (or NumPy) kernel equals a plain matrix product"""
+        rng = np.random.default_rng(1)
+        metrics = rng.random((50, 5))
+        weights = rng.standard_normal((5, 3))
+        np.testing.assert_allclose(
+            RewardShaper.reward_matrix(metrics, weights), metrics @ weights
+        )
+    
+    def test_batch_compare_matches_compare_policies(self, results):
+        """One batched pass ranks like compare_policies() in every mode"""
+        comparisons = RewardShaper.batch_compare(results)
+        assert set(comparisons) == {mode.value for mode in RewardShaper.MODE_CONFIGS}
+        
+        for mode in RewardShaper.MODE_CONFIGS:
+            expected = RewardShaper(mode).compare_policies(results)
+            batched = comparisons[mode.value]
+            
+            assert batched['best_agent'] == expected['best_agent']
+            assert [r['agent_id'] for r in batched['rankings']] == \
+                [r['agent_id'] for r in expected['rankings']]
+            assert [r['reward'] for r in batched['rankings']] == pytest.approx(
+                [r['reward'] for r in expected['rankings']]
+            )
+            assert batched['summary']['mean_reward'] == pytest.approx(
+                expected['summary']['mean_reward']
+            )
+    
+    def test_batch_compare_selected_modes(self, results):
+        """Only the requested modes are compared"""
+        comparisons = RewardShaper.batch_compare(
+            results, [ExecutionMode.ECO_MODE, ExecutionMode.FAST_MODE]
+        )
+        assert list(comparisons) == ['eco', 'fast']
+        assert [r['rank'] for r in comparisons['eco']['rankings']] == list(range(1, 13))